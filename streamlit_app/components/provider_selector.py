@@ -13,7 +13,7 @@ import os
 import logging
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
@@ -30,34 +30,52 @@ except ImportError as e:
     logger.error(f"Erreur import ProviderManager: {e}")
     provider_manager = None
 
+# Identifiant canonique ("mistral" | "gemini") de chaque clé du ProviderManager
+_PROVIDER_IDS = {"mistral_local": "mistral", "gemini_cloud": "gemini"}
 
-def render_provider_selector():
+
+def _select_provider(provider_key: str, status) -> None:
+    """Enregistre le provider choisi: nom affiché et identifiant canonique."""
+    st.session_state.selected_provider = status.name
+    st.session_state.selected_provider_id = _PROVIDER_IDS[provider_key]
+
+
+def render_provider_selector(statuses: Optional[Dict[str, Any]] = None):
     """
     Affiche le sélecteur de provider dans le sidebar.
 
     Affiche des boutons visuels pour sélectionner Mistral Local ou Gemini API,
     avec statuts en temps réel et messages contextuels.
+
+    Écrit dans le conteneur courant: à appeler dans `with st.sidebar` (compatible
+    avec un appel depuis un st.fragment, qui ne peut pas cibler st.sidebar).
+
+    Args:
+        statuses: Statuts par clé de provider (résultat de get_all_statuses),
+            pour afficher le même instantané que celui utilisé par la page;
+            vérifiés en direct si None
     """
     if provider_manager is None:
-        st.sidebar.error("⚠️ ProviderManager non disponible")
+        st.error("⚠️ ProviderManager non disponible")
         return
 
-    # Initialiser session state pour le provider sélectionné
-    if "selected_provider" not in st.session_state:
-        # Essayer de récupérer le provider par défaut
-        default_provider = provider_manager.get_default_provider()
-        if default_provider:
-            st.session_state.selected_provider = default_provider
-        else:
-            st.session_state.selected_provider = None
-
     # Récupérer les statuts de tous les providers
-    statuses = provider_manager.get_all_statuses()
+    if statuses is None:
+        statuses = provider_manager.get_all_statuses()
     mistral_status = statuses.get("mistral_local")
     gemini_status = statuses.get("gemini_cloud")
 
+    # Initialiser session state avec le provider par défaut (le premier disponible)
+    if "selected_provider" not in st.session_state:
+        st.session_state.selected_provider = None
+        st.session_state.selected_provider_id = "auto"
+        for provider_key, status in statuses.items():
+            if status.available:
+                _select_provider(provider_key, status)
+                break
+
     # Section titre
-    st.sidebar.markdown(
+    st.markdown(
         """
     <div style="margin-bottom: 1rem;">
         <h3 style="font-size: 1.15rem; font-weight: 700; color: #1E293B; margin-bottom: 0.5rem; 
@@ -72,7 +90,7 @@ def render_provider_selector():
     )
 
     # Boutons de sélection des providers
-    col1, col2 = st.sidebar.columns(2, gap="small")
+    col1, col2 = st.columns(2, gap="small")
 
     with col1:
         # Bouton Mistral Local
@@ -93,7 +111,7 @@ def render_provider_selector():
             type=button_type,
         ):
             if mistral_available:
-                st.session_state.selected_provider = mistral_status.name
+                _select_provider("mistral_local", mistral_status)
                 st.success("Mistral sélectionné", icon="✅")
                 st.rerun()
             else:
@@ -129,7 +147,7 @@ def render_provider_selector():
             type=button_type,
         ):
             if gemini_available:
-                st.session_state.selected_provider = gemini_status.name
+                _select_provider("gemini_cloud", gemini_status)
                 st.success("Gemini sélectionné", icon="✅")
                 st.rerun()
             else:
@@ -166,7 +184,7 @@ def render_provider_selector():
                 else "rgba(239, 68, 68, 0.1)"
             )
 
-            st.sidebar.markdown(
+            st.markdown(
                 f"""
             <div style="
                 background: linear-gradient(135deg, {status_bg} 0%, rgba(255,255,255,0.05) 100%);
@@ -195,14 +213,14 @@ def render_provider_selector():
 
             # Afficher bouton de configuration si non disponible
             if not selected_status.available:
-                if st.sidebar.button(
+                if st.button(
                     "🔧 Configurer",
                     key="btn_configure_selected",
                     use_container_width=True,
                 ):
                     st.session_state.show_provider_config_modal = True
                     st.session_state.config_provider_type = (
-                        "mistral" if "Mistral" in selected_status.name else "gemini"
+                        st.session_state.get("selected_provider_id", "gemini")
                     )
 
     # Afficher les providers non disponibles dans un expander
@@ -211,7 +229,7 @@ def render_provider_selector():
     ]
 
     if unavailable_providers:
-        with st.sidebar.expander("❌ Providers non disponibles", expanded=False):
+        with st.expander("❌ Providers non disponibles", expanded=False):
             for status in unavailable_providers:
                 st.markdown(
                     f"""
@@ -235,195 +253,203 @@ def render_provider_selector():
                     st.caption(f"💡 {status.installation_command}")
 
 
-def render_provider_configuration_modal():
+def render_provider_configuration_modal(
+    on_key_saved: Optional[Callable[[], None]] = None,
+):
     """
     Affiche une modal de configuration pour les providers manquants.
 
     Permet de configurer Gemini API ou de tester la connexion Ollama.
+    Écrit dans le conteneur courant (appelée dans `with st.sidebar`).
+
+    Args:
+        on_key_saved: Appelée dès que la clé Gemini est enregistrée, avant le
+            rerun (ex: invalider les statuts de providers mis en cache)
     """
     if not st.session_state.get("show_provider_config_modal", False):
         return
 
     config_type = st.session_state.get("config_provider_type", "gemini")
 
-    with st.sidebar:
-        with st.expander("⚙️ Configuration Provider", expanded=True):
-
-            provider_type = st.radio(
-                "Quel provider configurer?",
-                ["Mistral Local", "Gemini API"],
-                index=0 if config_type == "mistral" else 1,
-                key="config_provider_radio",
-            )
+    with st.expander("⚙️ Configuration Provider", expanded=True):
 
-            st.markdown("---")
+        provider_type = st.radio(
+            "Quel provider configurer?",
+            ["Mistral Local", "Gemini API"],
+            index=0 if config_type == "mistral" else 1,
+            key="config_provider_radio",
+        )
 
-            if provider_type == "Mistral Local":
-                st.markdown(
-                    """
-                <div style="background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(5, 150, 105, 0.05) 100%);
-                            padding: 1rem; border-radius: 10px; margin-bottom: 1rem;">
-                    <h4 style="color: #059669; font-weight: 700; margin-bottom: 0.75rem;
-                               display: flex; align-items: center; gap: 0.5rem;">
-                        <i class="fas fa-server" style="color: #10B981;"></i>
-                        Configurer Mistral Local (Ollama)
-                    </h4>
-                </div>
-                """,
-                    unsafe_allow_html=True,
-                )
+        st.markdown("---")
 
-                st.markdown(
-                    """
-                **Prérequis:**
-                
-                1. **Téléchargez Ollama**: https://ollama.ai
-                2. **Installez un modèle**: `ollama pull mistral`
-                3. **Lancez le serveur**: `ollama serve`
-                
-                **Ou utilisez Docker:**
-                ```bash
-                docker run -d --name ollama -p 11434:11434 ollama/ollama
-                docker exec ollama ollama pull mistral
-                ```
+        if provider_type == "Mistral Local":
+            st.markdown(
                 """
-                )
+            <div style="background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(5, 150, 105, 0.05) 100%);
+                        padding: 1rem; border-radius: 10px; margin-bottom: 1rem;">
+                <h4 style="color: #059669; font-weight: 700; margin-bottom: 0.75rem;
+                           display: flex; align-items: center; gap: 0.5rem;">
+                    <i class="fas fa-server" style="color: #10B981;"></i>
+                    Configurer Mistral Local (Ollama)
+                </h4>
+            </div>
+            """,
+                unsafe_allow_html=True,
+            )
 
-                # Test de connexion
-                st.markdown("**🔍 Test de connexion:**")
+            st.markdown(
+                """
+            **Prérequis:**
+            
+            1. **Téléchargez Ollama**: https://ollama.ai
+            2. **Installez un modèle**: `ollama pull mistral`
+            3. **Lancez le serveur**: `ollama serve`
+            
+            **Ou utilisez Docker:**
+            ```bash
+            docker run -d --name ollama -p 11434:11434 ollama/ollama
+            docker exec ollama ollama pull mistral
+            ```
+            """
+            )
 
-                if st.button(
-                    "🔄 Vérifier la connexion Ollama",
-                    key="btn_test_ollama",
-                    use_container_width=True,
-                ):
-                    if provider_manager:
-                        available, msg = provider_manager.check_ollama_connection()
-                        if available:
-                            st.success(msg)
-                        else:
-                            st.error(msg)
+            # Test de connexion
+            st.markdown("**🔍 Test de connexion:**")
+
+            if st.button(
+                "🔄 Vérifier la connexion Ollama",
+                key="btn_test_ollama",
+                use_container_width=True,
+            ):
+                if provider_manager:
+                    available, msg = provider_manager.check_ollama_connection()
+                    if available:
+                        st.success(msg)
                     else:
-                        st.error("ProviderManager non disponible")
+                        st.error(msg)
+                else:
+                    st.error("ProviderManager non disponible")
 
-            elif provider_type == "Gemini API":
-                st.markdown(
-                    """
-                <div style="background: linear-gradient(135deg, rgba(59, 130, 246, 0.1) 0%, rgba(37, 99, 235, 0.05) 100%);
-                            padding: 1rem; border-radius: 10px; margin-bottom: 1rem;">
-                    <h4 style="color: #2563EB; font-weight: 700; margin-bottom: 0.75rem;
-                               display: flex; align-items: center; gap: 0.5rem;">
-                        <i class="fas fa-cloud" style="color: #3B82F6;"></i>
-                        Configurer Gemini API
-                    </h4>
-                </div>
-                """,
-                    unsafe_allow_html=True,
-                )
+        elif provider_type == "Gemini API":
+            st.markdown(
+                """
+            <div style="background: linear-gradient(135deg, rgba(59, 130, 246, 0.1) 0%, rgba(37, 99, 235, 0.05) 100%);
+                        padding: 1rem; border-radius: 10px; margin-bottom: 1rem;">
+                <h4 style="color: #2563EB; font-weight: 700; margin-bottom: 0.75rem;
+                           display: flex; align-items: center; gap: 0.5rem;">
+                    <i class="fas fa-cloud" style="color: #3B82F6;"></i>
+                    Configurer Gemini API
+                </h4>
+            </div>
+            """,
+                unsafe_allow_html=True,
+            )
 
-                st.markdown(
-                    """
-                **Étapes:**
-                
-                1. **Créez un compte**: https://console.cloud.google.com
-                2. **Générez une clé API**: https://ai.google.dev/api
-                3. **Copiez votre clé** ci-dessous
+            st.markdown(
                 """
-                )
+            **Étapes:**
+            
+            1. **Créez un compte**: https://console.cloud.google.com
+            2. **Générez une clé API**: https://ai.google.dev/api
+            3. **Copiez votre clé** ci-dessous
+            """
+            )
 
-                # Input pour la clé API
-                api_key = st.text_input(
-                    "Clé API Gemini",
-                    type="password",
-                    placeholder="Entrez votre clé API",
-                    help="Votre clé API sera sauvegardée dans le fichier .env",
-                    key="gemini_api_key_input",
-                )
+            # Input pour la clé API
+            api_key = st.text_input(
+                "Clé API Gemini",
+                type="password",
+                placeholder="Entrez votre clé API",
+                help="Votre clé API sera sauvegardée dans le fichier .env",
+                key="gemini_api_key_input",
+            )
+
+            if api_key:
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    if st.button(
+                        "✅ Tester et Sauvegarder",
+                        key="btn_save_gemini",
+                        use_container_width=True,
+                    ):
+                        # Tester la clé
+                        try:
+                            import google.generativeai as genai
 
-                if api_key:
-                    col1, col2 = st.columns(2)
+                            genai.configure(api_key=api_key)
 
-                    with col1:
-                        if st.button(
-                            "✅ Tester et Sauvegarder",
-                            key="btn_save_gemini",
-                            use_container_width=True,
-                        ):
-                            # Tester la clé
+                            # Essayer de lister les modèles
                             try:
-                                import google.generativeai as genai
-
-                                genai.configure(api_key=api_key)
-
-                                # Essayer de lister les modèles
-                                try:
-                                    list(genai.list_models())
-                                    test_result = True
-                                    test_msg = "✅ Clé API valide"
-                                except Exception:
-                                    test_result = True  # On considère valide même si list_models échoue
-                                    test_msg = "✅ Clé API acceptée"
-
-                                if test_result:
-                                    # Sauvegarder dans .env
-                                    env_file = (
-                                        Path(__file__).parent.parent.parent / ".env"
-                                    )
-                                    if env_file.exists():
-                                        # Lire le fichier existant
-                                        content = env_file.read_text(encoding="utf-8")
-
-                                        # Remplacer ou ajouter GEMINI_API_KEY
-                                        if "GEMINI_API_KEY" in content:
-                                            lines = content.split("\n")
-                                            new_lines = []
-                                            for line in lines:
-                                                if line.startswith("GEMINI_API_KEY"):
-                                                    new_lines.append(
-                                                        f"GEMINI_API_KEY={api_key}"
-                                                    )
-                                                else:
-                                                    new_lines.append(line)
-                                            env_file.write_text(
-                                                "\n".join(new_lines), encoding="utf-8"
-                                            )
-                                        else:
-                                            env_file.write_text(
-                                                content + f"\nGEMINI_API_KEY={api_key}",
-                                                encoding="utf-8",
-                                            )
+                                list(genai.list_models())
+                                test_result = True
+                                test_msg = "✅ Clé API valide"
+                            except Exception:
+                                test_result = True  # On considère valide même si list_models échoue
+                                test_msg = "✅ Clé API acceptée"
+
+                            if test_result:
+                                # Sauvegarder dans .env
+                                env_file = (
+                                    Path(__file__).parent.parent.parent / ".env"
+                                )
+                                if env_file.exists():
+                                    # Lire le fichier existant
+                                    content = env_file.read_text(encoding="utf-8")
+
+                                    # Remplacer ou ajouter GEMINI_API_KEY
+                                    if "GEMINI_API_KEY" in content:
+                                        lines = content.split("\n")
+                                        new_lines = []
+                                        for line in lines:
+                                            if line.startswith("GEMINI_API_KEY"):
+                                                new_lines.append(
+                                                    f"GEMINI_API_KEY={api_key}"
+                                                )
+                                            else:
+                                                new_lines.append(line)
+                                        env_file.write_text(
+                                            "\n".join(new_lines), encoding="utf-8"
+                                        )
                                     else:
-                                        # Créer le fichier .env
                                         env_file.write_text(
-                                            f"GEMINI_API_KEY={api_key}",
+                                            content + f"\nGEMINI_API_KEY={api_key}",
                                             encoding="utf-8",
                                         )
-
-                                    # Mettre à jour la variable d'environnement
-                                    os.environ["GEMINI_API_KEY"] = api_key
-
-                                    st.success(test_msg)
-                                    st.success(
-                                        "✅ Clé API Gemini sauvegardée dans .env!"
+                                else:
+                                    # Créer le fichier .env
+                                    env_file.write_text(
+                                        f"GEMINI_API_KEY={api_key}",
+                                        encoding="utf-8",
                                     )
 
-                                    # Fermer la modal et recharger
-                                    st.session_state.show_provider_config_modal = False
-                                    time.sleep(0.5)
-                                    st.rerun()
-                            except Exception as e:
-                                st.error(f"❌ Erreur: {str(e)[:100]}")
-
-                    with col2:
-                        if st.button(
-                            "❌ Annuler",
-                            key="btn_cancel_gemini",
-                            use_container_width=True,
-                        ):
-                            st.session_state.show_provider_config_modal = False
-                            st.rerun()
-
-            # Bouton pour fermer la modal
-            if st.button("✖️ Fermer", key="btn_close_modal", use_container_width=True):
-                st.session_state.show_provider_config_modal = False
-                st.rerun()
+                                # Mettre à jour la variable d'environnement
+                                os.environ["GEMINI_API_KEY"] = api_key
+                                if on_key_saved is not None:
+                                    on_key_saved()
+
+                                st.success(test_msg)
+                                st.success(
+                                    "✅ Clé API Gemini sauvegardée dans .env!"
+                                )
+
+                                # Fermer la modal et recharger
+                                st.session_state.show_provider_config_modal = False
+                                time.sleep(0.5)
+                                st.rerun()
+                        except Exception as e:
+                            st.error(f"❌ Erreur: {str(e)[:100]}")
+
+                with col2:
+                    if st.button(
+                        "❌ Annuler",
+                        key="btn_cancel_gemini",
+                        use_container_width=True,
+                    ):
+                        st.session_state.show_provider_config_modal = False
+                        st.rerun()
+
+        # Bouton pour fermer la modal
+        if st.button("✖️ Fermer", key="btn_close_modal", use_container_width=True):
+            st.session_state.show_provider_config_modal = False
+            st.rerun()
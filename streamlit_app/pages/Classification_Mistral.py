@@ -26,13 +26,18 @@ import pandas as pd
 import numpy as np
 import sys
 import os
+import gc
+import platform
 import logging
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
 import time
 import json
+import csv
+import hashlib
 import html
+import importlib
+import re
+from string import Template
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 from dotenv import load_dotenv
@@ -47,28 +52,38 @@ from utils.helpers import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Charger les variables d'environnement depuis .env
-# Chercher le fichier .env à la racine du projet (avec override pour forcer le rechargement)
-env_path = Path(__file__).parent.parent.parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path, override=True)
-    logger.info(f"Fichier .env chargé depuis: {env_path}")
-    # Vérifier que GEMINI_API_KEY est bien chargé
-    if os.getenv("GEMINI_API_KEY"):
-        logger.info("✓ GEMINI_API_KEY détectée dans .env")
-else:
-    # Essayer aussi à la racine du workspace
-    root_env = Path(__file__).parent.parent.parent.parent / ".env"
-    if root_env.exists():
-        load_dotenv(root_env, override=True)
-        logger.info(f"Fichier .env chargé depuis: {root_env}")
-        # Vérifier que GEMINI_API_KEY est bien chargé
-        if os.getenv("GEMINI_API_KEY"):
-            logger.info("✓ GEMINI_API_KEY détectée dans .env")
-    else:
-        logger.warning(
-            "Fichier .env non trouvé, utilisation des variables d'environnement système"
-        )
+
+# Charger les variables d'environnement depuis .env (une seule fois par processus)
+@st.cache_resource(show_spinner=False)
+def _ensure_env_loaded() -> Optional[Path]:
+    """
+    Charge les variables d'environnement depuis .env, une seule fois par processus.
+
+    Cherche le fichier .env à la racine du projet puis à la racine du workspace
+    (avec override pour que le fichier prime sur l'environnement).
+
+    Returns:
+        Chemin du fichier chargé, ou None si aucun .env n'a été trouvé
+    """
+    for candidate in (
+        Path(__file__).parent.parent.parent / ".env",
+        Path(__file__).parent.parent.parent.parent / ".env",
+    ):
+        if candidate.exists():
+            load_dotenv(candidate, override=True)
+            logger.info(f"Fichier .env chargé depuis: {candidate}")
+            # Vérifier que GEMINI_API_KEY est bien chargé
+            if os.getenv("GEMINI_API_KEY"):
+                logger.info("✓ GEMINI_API_KEY détectée dans .env")
+            return candidate
+
+    logger.warning(
+        "Fichier .env non trouvé, utilisation des variables d'environnement système"
+    )
+    return None
+
+
+_ensure_env_loaded()
 
 # Configuration des chemins
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -96,32 +111,50 @@ except ImportError as e:
     render_provider_configuration_modal = None
     PROVIDER_MANAGER_AVAILABLE = False
 
+# pyarrow (installé avec Streamlit) pour les calculs vectorisés sur les chaînes
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    pc = None
+    PYARROW_AVAILABLE = False
+
 # ==============================================================================
 # LAZY LOADING - OPTIMISATION CRITIQUE
 # ==============================================================================
 
 
-@st.cache_resource(show_spinner=False)
+# Délai avant nouvelle tentative d'import lorsque des modules ont échoué
+_MODULES_RETRY_TTL = 60
+
+
+def _modules_cache_valid(result: Dict[str, Any]) -> bool:
+    """
+    Valide l'entrée en cache de _load_classification_modules.
+
+    Un chargement complet reste valide pour la durée du processus; un chargement
+    partiel (erreurs d'import) expire après _MODULES_RETRY_TTL secondes.
+    """
+    if not result["modules_status"]["errors"]:
+        return True
+    return time.time() - result["loaded_at"] < _MODULES_RETRY_TTL
+
+
+@st.cache_resource(show_spinner=False, validate=_modules_cache_valid)
 def _load_classification_modules():
     """
     Charge les modules de classification avec cache et gestion gracieuse des erreurs.
 
     Gère l'absence de PyTorch et autres dépendances de manière conditionnelle.
     Retourne des informations détaillées sur les modules disponibles/indisponibles.
+    Les imports ne sont faits qu'une fois par processus; en cas d'échec partiel
+    ils sont retentés après _MODULES_RETRY_TTL secondes.
     """
-    # Recharger le .env avant de charger les modules pour s'assurer que les clés API sont à jour
-    try:
-        env_path = Path(__file__).parent.parent.parent / ".env"
-        if env_path.exists():
-            load_dotenv(env_path, override=True)
-            logger.debug(f"Fichier .env rechargé depuis: {env_path}")
-        else:
-            root_env = Path(__file__).parent.parent.parent.parent / ".env"
-            if root_env.exists():
-                load_dotenv(root_env, override=True)
-                logger.debug(f"Fichier .env rechargé depuis: {root_env}")
-    except Exception as e:
-        logger.debug(f"Erreur rechargement .env (non bloquant): {e}")
+    # S'assurer que le .env est chargé avant les modules (clés API)
+    _ensure_env_loaded()
 
     modules_status = {"available": False, "modules": {}, "errors": {}, "warnings": []}
 
@@ -207,15 +240,14 @@ def _load_classification_modules():
 
     # Module 5: GeminiClassifier
     try:
-        from services.gemini_classifier import (
-            GeminiClassifier,
-            check_gemini_availability,
-        )
+        # google-generativeai n'est importé qu'au premier usage par ce module
+        gemini_module = importlib.import_module("services.gemini_classifier")
 
-        modules_status["modules"]["GeminiClassifier"] = GeminiClassifier
+        modules_status["modules"]["gemini_classifier"] = gemini_module
+        modules_status["modules"]["GeminiClassifier"] = gemini_module.GeminiClassifier
         modules_status["modules"][
             "check_gemini_availability"
-        ] = check_gemini_availability
+        ] = gemini_module.check_gemini_availability
         logger.info("✓ GeminiClassifier chargé")
     except ImportError as e:
         modules_status["errors"]["GeminiClassifier"] = f"Import error: {str(e)}"
@@ -252,6 +284,7 @@ def _load_classification_modules():
         "available": modules_status["available"],
         "modules_status": modules_status,
         "error": None,
+        "loaded_at": time.time(),
     }
 
     # Ajouter les modules chargés pour compatibilité
@@ -269,22 +302,25 @@ def _load_classification_modules():
 
 @st.cache_resource(show_spinner=False)
 def _load_role_system():
-    """Charge le système de rôles avec cache"""
+    """
+    Charge le système de rôles avec cache.
+
+    L'import est différé jusqu'au premier appel et payé une seule fois par
+    processus grâce à st.cache_resource.
+    """
     try:
-        from services.role_manager import (
-            initialize_role_system,
-            get_current_role,
-            check_permission,
-        )
-        from services.auth_service import AuthService
-
-        return {
-            "initialize_role_system": initialize_role_system,
-            "get_current_role": get_current_role,
-            "check_permission": check_permission,
-            "AuthService": AuthService,
-            "available": True,
+        role_manager_module = importlib.import_module("services.role_manager")
+        auth_service_module = importlib.import_module("services.auth_service")
+
+        role_system = {
+            "initialize_role_system": role_manager_module.initialize_role_system,
+            "get_current_role": role_manager_module.get_current_role,
+            "check_permission": role_manager_module.check_permission,
+            "AuthService": auth_service_module.AuthService,
         }
+        # Disponibilité réelle vérifiée une fois au chargement
+        role_system["available"] = all(callable(obj) for obj in role_system.values())
+        return role_system
     except Exception as e:
         logger.warning(f"Role system not available: {e}")
         return {"available": False}
@@ -315,52 +351,76 @@ def main():
 
     _load_modern_css()
 
-    # Initialisation du système de rôles avec chargement différé
+    # Initialisation du système de rôles avec chargement différé (une seule fois par session)
     role_system = _load_role_system()
-    if role_system["available"]:
-        try:
-            role_manager, role_ui_manager = role_system["initialize_role_system"]()
-            current_role = role_system["get_current_role"]()
-            if not current_role:
-                role_manager.set_current_role("manager")
-        except Exception as e:
-            logger.warning(f"Erreur lors de l'initialisation du système de rôles: {e}")
+    if not st.session_state.get("_role_initialized") and role_system["available"]:
+        role_manager, role_ui_manager = role_system["initialize_role_system"]()
+        if not role_system["get_current_role"]():
+            role_manager.set_current_role("manager")
+        st.session_state["_role_initialized"] = True
 
     _render_header()
-    _render_sidebar_complete()
+    with st.sidebar:
+        _render_sidebar_complete()
     _render_workflow_indicator()
+    # Émis avant la section: une section qui se termine par st.stop()
+    # ne doit pas priver la page des styles différés
+    _load_deferred_css()
 
     # Gestion du workflow en trois étapes
-    if "workflow_step" not in st.session_state:
-        st.session_state.workflow_step = "upload"
+    st.session_state.setdefault("workflow_step", "upload")
 
     # Routage vers la section appropriée selon l'étape du workflow
-    if st.session_state.workflow_step == "upload":
-        _section_upload()
-    elif st.session_state.workflow_step == "classify":
-        _section_classification()
-    elif st.session_state.workflow_step == "results":
-        _section_results()
+    section = _SECTIONS.get(st.session_state.workflow_step)
+    if section is not None:
+        section()
 
 
 # ==============================================================================
 # CSS MODERNE - FONT AWESOME UNIQUEMENT
 # ==============================================================================
 
+_STYLE_BLOCK_RE = re.compile(r"(<style>)(.*?)(</style>)", re.S)
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_RE = re.compile(r"\s*([{};:,>])\s*")
 
-def _load_modern_css():
+
+def _compact_css(css: str) -> str:
+    """Supprime commentaires et espaces superflus d'une feuille de style."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    css = _CSS_PUNCT_RE.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+@st.cache_resource(show_spinner=False)
+def _minify_css(markup: str) -> str:
     """
-    Charge les styles CSS personnalisés modernes pour l'interface utilisateur.
+    Minifie le contenu des balises <style> d'un bloc HTML.
 
-    Design premium avec glassmorphism, animations fluides et palette de couleurs moderne.
+    Le résultat est mis en cache via st.cache_resource (le script de la page
+    étant ré-exécuté à chaque rerun, un cache de module ne survivrait pas):
+    la minification n'est payée qu'une fois par processus.
     """
-    st.markdown(
-        """
+    return _STYLE_BLOCK_RE.sub(
+        lambda m: m.group(1) + _compact_css(m.group(2)) + m.group(3), markup
+    )
+
+
+# Styles critiques (variables, mise en page, composants visibles), minifiés
+# une seule fois par processus (cache de _minify_css)
+_MODERN_CSS_CRITICAL = _minify_css(
+    """
+    <link rel="preconnect" href="https://cdnjs.cloudflare.com" crossorigin>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link rel="preload" as="style" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+    <link rel="preload" as="style" href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap">
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-    
+    <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap">
+
     <style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800;900&display=swap');
-    
     :root {
         --primary: #667eea;
         --primary-dark: #764ba2;
@@ -420,46 +480,6 @@ def _load_modern_css():
         }
     }
     
-    @keyframes slideInUp {
-        from {
-            opacity: 0;
-            transform: translateY(20px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-    
-    @keyframes pulse {
-        0%, 100% {
-            opacity: 1;
-        }
-        50% {
-            opacity: 0.5;
-        }
-    }
-    
-    @keyframes shimmer {
-        0% {
-            background-position: -1000px 0;
-        }
-        100% {
-            background-position: 1000px 0;
-        }
-    }
-    
-    /* Provider Cards Hover Effect */
-    .provider-card {
-        transition: all var(--transition-normal);
-        cursor: pointer;
-    }
-    
-    .provider-card:hover {
-        transform: translateY(-4px);
-        box-shadow: var(--shadow-xl) !important;
-    }
-    
     /* Buttons modernes */
     .stButton > button {
         background: linear-gradient(135deg, var(--primary) 0%, var(--primary-dark) 100%);
@@ -475,26 +495,6 @@ def _load_modern_css():
         overflow: hidden;
     }
     
-    .stButton > button::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.2), transparent);
-        transition: left var(--transition-slow);
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: var(--shadow-lg);
-    }
-    
-    .stButton > button:hover::before {
-        left: 100%;
-    }
-    
     .stButton > button:active {
         transform: translateY(0);
         box-shadow: var(--shadow-sm);
@@ -504,7 +504,6 @@ def _load_modern_css():
     .stProgress > div > div {
         background: linear-gradient(90deg, var(--primary) 0%, var(--primary-dark) 50%, var(--success) 100%);
         background-size: 200% 100%;
-        animation: shimmer 2s infinite;
         height: 8px;
         border-radius: var(--radius-lg);
         box-shadow: 0 2px 8px rgba(102, 126, 234, 0.3);
@@ -568,31 +567,6 @@ def _load_modern_css():
     /* Hide default Streamlit elements */
     #MainMenu, footer, header {visibility: hidden;}
     
-    /* Scrollbar moderne */
-    ::-webkit-scrollbar {
-        width: 8px;
-        height: 8px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: var(--gray-100);
-        border-radius: 4px;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: var(--gray-400);
-        border-radius: 4px;
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: var(--gray-500);
-    }
-    
-    /* Animations pour les éléments qui apparaissent */
-    [data-testid="stMarkdownContainer"] {
-        animation: slideInUp 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-    }
-    
     /* Amélioration des inputs */
     .stTextInput > div > div > input {
         border-radius: var(--radius-md);
@@ -638,119 +612,441 @@ def _load_modern_css():
     .stCheckbox > label:hover {
         color: var(--primary);
     }
+    
+    /* Cards providers: la palette est portée par les variables --card-* */
+    .provider-card {
+        position: relative;
+        overflow: hidden;
+        padding: 1.5rem;
+        border-radius: 16px;
+        margin-bottom: 1rem;
+        backdrop-filter: blur(10px);
+        background: linear-gradient(135deg, rgba(var(--card-rgb), 0.1) 0%, rgba(var(--card-rgb-dark), 0.05) 100%);
+        border: 1px solid rgba(var(--card-rgb), 0.2);
+        box-shadow: 0 4px 20px rgba(var(--card-rgb), 0.15);
+    }
+    
+    .provider-card--success {
+        --card-rgb: 16, 185, 129;
+        --card-rgb-dark: 5, 150, 105;
+        --card-color: #10B981;
+        --card-badge: linear-gradient(135deg, #10B981 0%, #059669 100%);
+    }
+    
+    .provider-card--danger {
+        --card-rgb: 239, 68, 68;
+        --card-rgb-dark: 220, 38, 38;
+        --card-color: #EF4444;
+        --card-badge: linear-gradient(135deg, #EF4444 0%, #DC2626 100%);
+    }
+    
+    .provider-card--warning {
+        --card-rgb: 245, 158, 11;
+        --card-rgb-dark: 217, 119, 6;
+        --card-color: #F59E0B;
+        --card-badge: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
+    }
+    
+    .provider-card-glow {
+        position: absolute;
+        top: 0;
+        right: 0;
+        width: 100px;
+        height: 100px;
+        background: radial-gradient(circle, rgba(var(--card-rgb), 0.1) 0%, transparent 70%);
+        border-radius: 50%;
+        transform: translate(30px, -30px);
+    }
+    
+    .provider-card-head {
+        display: flex;
+        align-items: flex-start;
+        justify-content: space-between;
+        margin-bottom: 1rem;
+        position: relative;
+        z-index: 1;
+    }
+    
+    .provider-card-id {
+        display: flex;
+        align-items: center;
+        gap: 0.75rem;
+    }
+    
+    .provider-card-badge {
+        width: 48px;
+        height: 48px;
+        background: var(--card-badge);
+        border-radius: 12px;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        box-shadow: 0 4px 12px rgba(var(--card-rgb), 0.3);
+        color: white;
+        font-size: 1.25rem;
+    }
+    
+    .provider-card-title {
+        font-weight: 700;
+        color: #0F172A;
+        font-size: 1rem;
+        margin-bottom: 0.25rem;
+    }
+    
+    .provider-card-origin {
+        font-size: 0.75rem;
+        color: #64748B;
+        font-weight: 500;
+    }
+    
+    .provider-card-origin i {
+        margin-right: 0.25rem;
+    }
+    
+    .provider-card-status {
+        padding: 0.375rem 0.75rem;
+        background: rgba(var(--card-rgb), 0.15);
+        border-radius: 20px;
+        display: flex;
+        align-items: center;
+        gap: 0.375rem;
+        color: var(--card-color);
+        font-size: 0.75rem;
+        font-weight: 600;
+    }
+    
+    .provider-card-message {
+        font-size: 0.8125rem;
+        color: #475569;
+        line-height: 1.5;
+        position: relative;
+        z-index: 1;
+        padding-top: 0.75rem;
+        border-top: 1px solid rgba(var(--card-rgb), 0.1);
+    }
+    
+    .provider-card-message i {
+        color: #64748B;
+        margin-right: 0.375rem;
+        font-size: 0.75rem;
+    }
+    
+    /* Cartes de statut de l'en-tête */
+    .metric-card {
+        text-align: center;
+    }
+    
+    .metric-label {
+        font-size: 0.875rem;
+        color: var(--gray-500);
+    }
+    
+    .metric-body {
+        font-weight: 600;
+        margin-top: 0.25rem;
+    }
+    
+    /* Indicateur de workflow (grille de 3 cartes) */
+    .wf-grid {
+        display: grid;
+        grid-template-columns: repeat(3, 1fr);
+        gap: 1rem;
+    }
+    
+    .wf-card {
+        padding: 0.9rem 1rem;
+        border-radius: var(--radius-md);
+        border: 1px solid var(--gray-200);
+        color: var(--gray-500);
+        font-size: 0.95rem;
+    }
+    
+    .wf-card small {
+        display: block;
+        margin-top: 0.25rem;
+        font-size: 0.8rem;
+    }
+    
+    .wf-current {
+        background: rgba(59, 130, 246, 0.1);
+        border-color: var(--info);
+        color: var(--gray-800);
+        font-weight: 700;
+    }
+    
+    .wf-completed {
+        background: rgba(16, 185, 129, 0.1);
+        border-color: var(--success);
+        color: var(--gray-800);
+        font-weight: 700;
+    }
+    
+    /* Badge de version (contenu statique peint par le navigateur) */
+    .version-pill {
+        text-align: right;
+        margin-bottom: -10px;
+    }
+    
+    .version-pill::before {
+        content: 'VERSION 4.5 | FINAL EDITION';
+        display: inline-block;
+        background: linear-gradient(135deg, var(--secondary) 0%, var(--primary) 100%);
+        color: white;
+        padding: 0.5rem 1.5rem;
+        border-radius: 25px;
+        font-weight: 700;
+        font-size: 0.85rem;
+        letter-spacing: 1px;
+        box-shadow: 0 4px 12px rgba(46, 134, 222, 0.3);
+    }
     </style>
-    """,
-        unsafe_allow_html=True,
-    )
-
-
-# ==============================================================================
-# HEADER
-# ==============================================================================
-
-
-def _render_header():
-    """
-    Affiche l'en-tête principal de l'application.
-
-    Présente le titre, le statut du système et l'étape actuelle du workflow.
+    <div class="version-pill"></div>
     """
-    st.markdown(
-        """
-    <div style="text-align: right; margin-bottom: -10px;">
-        <span style="background: linear-gradient(135deg, var(--secondary) 0%, var(--primary) 100%);
-                     color: white; padding: 0.5rem 1.5rem; border-radius: 25px;
-                     font-weight: 700; font-size: 0.85rem; letter-spacing: 1px;
-                     box-shadow: 0 4px 12px rgba(46, 134, 222, 0.3);">
-            VERSION 4.5 | FINAL EDITION
-        </span>
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
-
-    st.markdown("<div style='height: 1rem;'></div>", unsafe_allow_html=True)
-
-    col1, col2, col3 = st.columns([2, 1, 1])
-
-    with col1:
-        st.markdown("### Système de Classification Automatisé")
-        st.markdown("**NLP Avancé avec Mistral AI, BERT et Classification par Règles**")
+)
 
-    with col2:
-        # Statut système
-        modules = _load_classification_modules()
-        status_icon = (
-            "<i class='fas fa-check-circle' style='color:#10AC84;'></i>"
-            if modules.get("available")
-            else "<i class='fas fa-times-circle' style='color:#EE5A6F;'></i>"
-        )
-        status_text = "Opérationnel" if modules.get("available") else "Erreur"
-        st.metric("Statut Système", "", help="État des modules de classification")
-        st.markdown(
-            f"<div style='text-align: center; margin-top: -20px; font-weight: 600;'>{status_icon} {status_text}</div>",
-            unsafe_allow_html=True,
-        )
 
-    with col3:
-        # Étape workflow
-        step = st.session_state.get("workflow_step", "upload")
-        step_names = {
-            "upload": "Upload",
-            "classify": "Classification",
-            "results": "Résultats",
+# Styles non critiques (animations, survols, scrollbar), émis à part
+_MODERN_CSS_DEFERRED = _minify_css(
+    """
+    <style>
+    @keyframes slideInUp {
+        from {
+            opacity: 0;
+            transform: translateY(20px);
         }
-        step_icons = {
-            "upload": "<i class='fas fa-upload'></i>",
-            "classify": "<i class='fas fa-cogs'></i>",
-            "results": "<i class='fas fa-chart-bar'></i>",
+        to {
+            opacity: 1;
+            transform: translateY(0);
         }
-        st.metric("Étape Actuelle", "", help="Progression workflow")
-        step_display = step_names.get(step, "N/A")
-        step_icon = step_icons.get(step, "<i class='fas fa-list'></i>")
-        st.markdown(
-            f"<div style='text-align: center; margin-top: -20px; font-weight: 600;'>{step_icon} {step_display}</div>",
-            unsafe_allow_html=True,
-        )
-
-    st.markdown("---")
-
-
-# ==============================================================================
-# WORKFLOW INDICATOR
-# ==============================================================================
-
-
-def _render_workflow_indicator():
+    }
+    
+    @keyframes pulse {
+        0%, 100% {
+            opacity: 1;
+        }
+        50% {
+            opacity: 0.5;
+        }
+    }
+    
+    @keyframes shimmer {
+        0% {
+            background-position: -1000px 0;
+        }
+        100% {
+            background-position: 1000px 0;
+        }
+    }
+    
+    /* Provider Cards Hover Effect */
+    .provider-card {
+        transition: all var(--transition-normal);
+        cursor: pointer;
+    }
+    
+    .provider-card:hover {
+        transform: translateY(-4px);
+        box-shadow: var(--shadow-xl) !important;
+    }
+    
+    /* Effets de survol des boutons */
+    .stButton > button::before {
+        content: '';
+        position: absolute;
+        top: 0;
+        left: -100%;
+        width: 100%;
+        height: 100%;
+        background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.2), transparent);
+        transition: left var(--transition-slow);
+    }
+    
+    .stButton > button:hover {
+        transform: translateY(-2px);
+        box-shadow: var(--shadow-lg);
+    }
+    
+    .stButton > button:hover::before {
+        left: 100%;
+    }
+    
+    /* Shimmer uniquement si l'utilisateur accepte les animations */
+    @media (prefers-reduced-motion: no-preference) {
+        .stProgress > div > div {
+            animation: shimmer 2s infinite;
+        }
+    }
+    
+    /* Scrollbar moderne */
+    ::-webkit-scrollbar {
+        width: 8px;
+        height: 8px;
+    }
+    
+    ::-webkit-scrollbar-track {
+        background: var(--gray-100);
+        border-radius: 4px;
+    }
+    
+    ::-webkit-scrollbar-thumb {
+        background: var(--gray-400);
+        border-radius: 4px;
+    }
+    
+    ::-webkit-scrollbar-thumb:hover {
+        background: var(--gray-500);
+    }
+    
+    /* Animations pour les éléments qui apparaissent */
+    [data-testid="stMarkdownContainer"] {
+        animation: slideInUp 0.4s cubic-bezier(0.4, 0, 0.2, 1);
+    }
+    
+    </style>
     """
-    Affiche un indicateur visuel de progression dans le workflow.
+)
 
-    Montre les trois étapes principales (Upload, Classification, Résultats)
-    et met en évidence l'étape courante ainsi que les étapes complétées.
+
+def _load_modern_css():
     """
-    current_step = st.session_state.get("workflow_step", "upload")
+    Charge les styles CSS personnalisés modernes pour l'interface utilisateur.
+
+    Design premium avec glassmorphism, animations fluides et palette de couleurs moderne.
+    """
+    st.markdown(_MODERN_CSS_CRITICAL, unsafe_allow_html=True)
+
+
+def _load_deferred_css():
+    """
+    Charge les styles non critiques (animations, effets de survol, scrollbar).
+
+    Appelée après l'en-tête, la barre latérale et l'indicateur de progression,
+    avant la section courante (qui peut interrompre le script par st.stop()).
+    """
+    st.markdown(_MODERN_CSS_DEFERRED, unsafe_allow_html=True)
+
+
+# ==============================================================================
+# HEADER
+# ==============================================================================
+
+
+_STEP_NAMES = {
+    "upload": "Upload",
+    "classify": "Classification",
+    "results": "Résultats",
+}
+
+_STEP_ICONS = {
+    "upload": "<i class='fas fa-upload'></i>",
+    "classify": "<i class='fas fa-cogs'></i>",
+    "results": "<i class='fas fa-chart-bar'></i>",
+}
+
+# (icône, libellé) du statut système indexés par disponibilité des modules
+_STATUS_HTML = {
+    True: ("<i class='fas fa-check-circle' style='color:#10AC84;'></i>", "Opérationnel"),
+    False: ("<i class='fas fa-times-circle' style='color:#EE5A6F;'></i>", "Erreur"),
+}
+
+
+def _render_header():
+    """
+    Affiche l'en-tête principal de l'application.
+
+    Présente le titre, le statut du système et l'étape actuelle du workflow.
+    """
+    # Statut système
+    modules = _load_classification_modules()
+    status_icon, status_text = _STATUS_HTML[bool(modules.get("available"))]
+
+    # Étape workflow
+    step = st.session_state.get("workflow_step", "upload")
+    step_display = _STEP_NAMES.get(step, "N/A")
+    step_icon = _STEP_ICONS.get(step, "<i class='fas fa-list'></i>")
+
+    # En-tête en un seul bloc HTML (grille 3 colonnes) au lieu de st.columns + st.metric
+    st.markdown(
+        f"""
+    <div style="display: grid; grid-template-columns: 2fr 1fr 1fr; gap: 1rem;
+                align-items: center; margin-top: 1rem;">
+        <div>
+            <h3 style="margin: 0 0 0.25rem 0;">Système de Classification Automatisé</h3>
+            <strong>NLP Avancé avec Mistral AI, BERT et Classification par Règles</strong>
+        </div>
+        <div class="metric-card" title="État des modules de classification">
+            <div class="metric-label">Statut Système</div>
+            <div class="metric-body">{status_icon} {status_text}</div>
+        </div>
+        <div class="metric-card" title="Progression workflow">
+            <div class="metric-label">Étape Actuelle</div>
+            <div class="metric-body">{step_icon} {step_display}</div>
+        </div>
+    </div>
+    """,
+        unsafe_allow_html=True,
+    )
+
+    st.markdown("---")
+
 
-    steps = {
-        "upload": {"num": 1, "name": "Upload & Nettoyage", "icon": "fa-upload"},
-        "classify": {"num": 2, "name": "Classification", "icon": "fa-cogs"},
-        "results": {"num": 3, "name": "Résultats & Export", "icon": "fa-chart-bar"},
+# ==============================================================================
+# WORKFLOW INDICATOR
+# ==============================================================================
+
+
+# Étapes du workflow, dans l'ordre d'affichage
+_WORKFLOW_STEPS = {
+    "upload": {"num": 1, "name": "Upload & Nettoyage", "icon": "fa-upload"},
+    "classify": {"num": 2, "name": "Classification", "icon": "fa-cogs"},
+    "results": {"num": 3, "name": "Résultats & Export", "icon": "fa-chart-bar"},
+}
+
+# Statut de chaque étape selon l'étape courante: 'current' | 'completed' | 'pending'
+_WORKFLOW_STATUS = {
+    "upload": {"upload": "current", "classify": "pending", "results": "pending"},
+    "classify": {"upload": "completed", "classify": "current", "results": "pending"},
+    "results": {"upload": "completed", "classify": "completed", "results": "current"},
+}
+_WORKFLOW_STATUS_PENDING = dict.fromkeys(_WORKFLOW_STEPS, "pending")
+
+# Contenu HTML pré-formaté pour chaque (étape, statut)
+_WORKFLOW_LABELS = {
+    step_key: {
+        "current": f"[{info['num']}] {info['name']}<small>En cours...</small>",
+        "completed": f"[{info['num']}] {info['name']}<small>Terminé</small>",
+        "pending": f"[{info['num']}] {info['name']}",
     }
+    for step_key, info in _WORKFLOW_STEPS.items()
+}
 
-    cols = st.columns(3)
 
-    for idx, (step_key, step_info) in enumerate(steps.items()):
-        with cols[idx]:
-            is_current = step_key == current_step
-            is_completed = (
-                step_key == "upload" and current_step in ["classify", "results"]
-            ) or (step_key == "classify" and current_step == "results")
+@st.cache_resource(show_spinner=False)
+def _workflow_indicator_html(current_step: str) -> str:
+    """
+    Construit la grille HTML de l'indicateur pour une étape courante donnée.
 
-            if is_current:
-                st.info(f"**[{step_info['num']}] {step_info['name']}**\n\nEn cours...")
-            elif is_completed:
-                st.success(f"**[{step_info['num']}] {step_info['name']}**\n\nTerminé")
-            else:
-                st.caption(f"[{step_info['num']}] {step_info['name']}")
+    Mis en cache: le HTML n'est reconstruit que lorsque l'étape change.
+    """
+    step_status = _WORKFLOW_STATUS.get(current_step, _WORKFLOW_STATUS_PENDING)
+    cards = "".join(
+        f'<div class="wf-card wf-{step_status[step_key]}">'
+        f"{_WORKFLOW_LABELS[step_key][step_status[step_key]]}</div>"
+        for step_key in _WORKFLOW_STEPS
+    )
+    return f'<div class="wf-grid">{cards}</div>'
+
+
+def _render_workflow_indicator():
+    """
+    Affiche un indicateur visuel de progression dans le workflow.
+
+    Montre les trois étapes principales (Upload, Classification, Résultats)
+    et met en évidence l'étape courante ainsi que les étapes complétées.
+    Les trois cartes sont émises en un seul bloc HTML (classes wf-*).
+    """
+    current_step = st.session_state.get("workflow_step", "upload")
+    st.markdown(_workflow_indicator_html(current_step), unsafe_allow_html=True)
 
     st.markdown("---")
 
@@ -760,253 +1056,268 @@ def _render_workflow_indicator():
 # ==============================================================================
 
 
+# Gabarits HTML statiques de la sidebar
+_MODE_HEADER_HTML = """
+<div style="margin-bottom: 1rem;">
+    <h3 style="font-size: 1.15rem; font-weight: 700; color: #1E293B; margin-bottom: 0.5rem; 
+                display: flex; align-items: center; gap: 0.5rem;">
+        <i class="fas fa-sliders-h" style="color: #667eea;"></i>
+        Mode de Classification
+    </h3>
+</div>
+"""
+
+_PROVIDER_SIDEBAR_HEADER_HTML = """
+<div style="margin-bottom: 1rem;">
+    <h3 style="font-size: 1.15rem; font-weight: 700; color: #1E293B; margin-bottom: 0.75rem; 
+                display: flex; align-items: center; gap: 0.5rem;">
+        <i class="fas fa-microchip" style="color: #667eea;"></i>
+        Fournisseur de Traitement
+    </h3>
+</div>
+"""
+
+# Bandeau affiché sous les boutons selon le provider retenu
+_SELECTED_PROVIDER_BANNERS = {
+    "mistral": """
+<div style="background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(5, 150, 105, 0.05) 100%);
+            padding: 0.75rem 1rem; border-radius: 10px; margin-top: 0.5rem;
+            border-left: 4px solid #10B981;">
+    <div style="display: flex; align-items: center; gap: 0.5rem;">
+        <i class="fas fa-check-circle" style="color: #10B981;"></i>
+        <span style="font-weight: 600; color: #059669; font-size: 0.875rem;">
+            Traitement local avec Mistral AI
+        </span>
+    </div>
+    <p style="margin: 0.5rem 0 0 0; font-size: 0.8rem; color: #047857;">
+        Vos données restent sur votre machine
+    </p>
+</div>
+""",
+    "gemini": """
+<div style="background: linear-gradient(135deg, rgba(59, 130, 246, 0.1) 0%, rgba(37, 99, 235, 0.05) 100%);
+            padding: 0.75rem 1rem; border-radius: 10px; margin-top: 0.5rem;
+            border-left: 4px solid #3B82F6;">
+    <div style="display: flex; align-items: center; gap: 0.5rem;">
+        <i class="fas fa-cloud" style="color: #3B82F6;"></i>
+        <span style="font-weight: 600; color: #2563EB; font-size: 0.875rem;">
+            Traitement cloud avec Google Gemini
+        </span>
+    </div>
+    <p style="margin: 0.5rem 0 0 0; font-size: 0.8rem; color: #1D4ED8;">
+        Précision maximale avec l'IA de Google
+    </p>
+</div>
+""",
+    "auto": """
+<div style="background: linear-gradient(135deg, rgba(100, 116, 139, 0.1) 0%, rgba(71, 85, 105, 0.05) 100%);
+            padding: 0.75rem 1rem; border-radius: 10px; margin-top: 0.5rem;
+            border-left: 4px solid #64748B;">
+    <div style="display: flex; align-items: center; gap: 0.5rem;">
+        <i class="fas fa-magic" style="color: #64748B;"></i>
+        <span style="font-weight: 600; color: #475569; font-size: 0.875rem;">
+            Sélection automatique
+        </span>
+    </div>
+    <p style="margin: 0.5rem 0 0 0; font-size: 0.8rem; color: #334155;">
+        Le meilleur fournisseur sera choisi automatiquement
+    </p>
+</div>
+""",
+}
+
+# Modes de classification: libellés du radio et détails affichés dans la sidebar
+_MODE_LABELS = {
+    "fast": "RAPIDE (20s)",
+    "balanced": "ÉQUILIBRÉ (2min)",
+    "precise": "PRÉCIS (10min)",
+}
+
+_MODE_DETAILS = {
+    "fast": {
+        "models": "BERT + Règles",
+        "precision": "75%",
+        "time": "20s",
+        "desc": "Tests rapides",
+    },
+    "balanced": {
+        "models": "BERT + Règles + Mistral (20%)",
+        "precision": "88%",
+        "time": "2min",
+        "desc": "Recommandé - Production",
+    },
+    "precise": {
+        "models": "BERT + Mistral (100%)",
+        "precision": "95%",
+        "time": "10min",
+        "desc": "Analyses critiques",
+    },
+}
+
+_MODE_INFO_TEXT = {
+    mode: (
+        f"**Mode {mode.upper()}**\n\n"
+        f"Modèles: {detail['models']}  \n"
+        f"Précision: {detail['precision']}  \n"
+        f"Temps: {detail['time']}\n\n"
+        f"{detail['desc']}"
+    )
+    for mode, detail in _MODE_DETAILS.items()
+}
+
+
+@st.fragment
 def _render_sidebar_complete():
     """
     Affiche la barre latérale complète avec tous les paramètres de configuration.
 
     Inclut la sélection du provider API (Mistral/Gemini), les modes de classification,
     les paramètres de nettoyage et la gestion des rôles utilisateurs.
-    """
-    with st.sidebar:
-        # Mode de classification
-        st.markdown(
-            """
-        <div style="margin-bottom: 1rem;">
-            <h3 style="font-size: 1.15rem; font-weight: 700; color: #1E293B; margin-bottom: 0.5rem; 
-                        display: flex; align-items: center; gap: 0.5rem;">
-                <i class="fas fa-sliders-h" style="color: #667eea;"></i>
-                Mode de Classification
-            </h3>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
 
-        mode = st.radio(
-            "Sélectionnez votre stratégie:",
-            options=["fast", "balanced", "precise"],
-            format_func=lambda x: {
-                "fast": "RAPIDE (20s)",
-                "balanced": "ÉQUILIBRÉ (2min)",
-                "precise": "PRÉCIS (10min)",
-            }[x],
-            index=1,
-            key="classification_mode_radio",
-        )
-
-        # Info du mode
-        mode_details = {
-            "fast": {
-                "models": "BERT + Règles",
-                "precision": "75%",
-                "time": "20s",
-                "desc": "Tests rapides",
-            },
-            "balanced": {
-                "models": "BERT + Règles + Mistral (20%)",
-                "precision": "88%",
-                "time": "2min",
-                "desc": "Recommandé - Production",
-            },
-            "precise": {
-                "models": "BERT + Mistral (100%)",
-                "precision": "95%",
-                "time": "10min",
-                "desc": "Analyses critiques",
-            },
-        }
+    Exécutée comme fragment (à appeler dans `with st.sidebar`): un changement de
+    widget ne relance que la sidebar. Si la configuration lue par la page
+    principale change, un rerun complet est déclenché.
+    """
+    # Mode de classification
+    st.markdown(_MODE_HEADER_HTML, unsafe_allow_html=True)
+
+    mode = st.radio(
+        "Sélectionnez votre stratégie:",
+        options=["fast", "balanced", "precise"],
+        format_func=_MODE_LABELS.__getitem__,
+        index=1,
+        key="classification_mode_radio",
+    )
 
-        detail = mode_details[mode]
+    # Info du mode (texte formaté d'avance pour chaque mode, cf. _MODE_INFO_TEXT)
+    st.info(_MODE_INFO_TEXT[mode])
 
-        st.info(
-            f"""
-**Mode {mode.upper()}**
+    st.markdown("---")
 
-Modèles: {detail['models']}  
-Précision: {detail['precision']}  
-Temps: {detail['time']}
+    # Modern Provider Selection with ProviderManager
+    if PROVIDER_MANAGER_AVAILABLE and render_provider_selector:
+        # Utiliser le nouveau composant provider_selector
+        render_provider_selector(_provider_statuses())
 
-{detail['desc']}
-        """
-        )
+        # Identifiant canonique posé par le sélecteur ("mistral" | "gemini" | "auto")
+        selected_provider = st.session_state.get("selected_provider_id", "auto")
 
-        st.markdown("---")
+        config = {"mode": mode, "provider": selected_provider}
+    else:
+        # Fallback vers l'ancien système si ProviderManager n'est pas disponible
+        st.markdown(_PROVIDER_SIDEBAR_HEADER_HTML, unsafe_allow_html=True)
 
-        # Modern Provider Selection with ProviderManager
-        if PROVIDER_MANAGER_AVAILABLE and render_provider_selector:
-            # Utiliser le nouveau composant provider_selector
-            render_provider_selector()
-
-            # Mapper le provider sélectionné au format attendu
-            selected_provider_name = st.session_state.get("selected_provider")
-            if selected_provider_name:
-                if "Mistral" in selected_provider_name:
-                    selected_provider = "mistral"
-                elif "Gemini" in selected_provider_name:
-                    selected_provider = "gemini"
-                else:
-                    selected_provider = "auto"
-            else:
-                selected_provider = "auto"
+        # Check provider availability (ancien système)
+        mistral_status = _cached_mistral_status()
+        gemini_status = _cached_gemini_status()
 
-            st.session_state.config = {"mode": mode, "provider": selected_provider}
-        else:
-            # Fallback vers l'ancien système si ProviderManager n'est pas disponible
-            st.markdown(
-                """
-            <div style="margin-bottom: 1rem;">
-                <h3 style="font-size: 1.15rem; font-weight: 700; color: #1E293B; margin-bottom: 0.75rem; 
-                            display: flex; align-items: center; gap: 0.5rem;">
-                    <i class="fas fa-microchip" style="color: #667eea;"></i>
-                    Fournisseur de Traitement
-                </h3>
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
+        # Provider selection with modern toggle buttons
+        col1, col2 = st.columns(2)
 
-            # Check provider availability (ancien système)
-            mistral_status = _check_mistral_availability()
-            gemini_status = _check_gemini_availability()
+        with col1:
+            mistral_available = mistral_status.get("available", False)
 
-            # Provider selection with modern toggle buttons
-            col1, col2 = st.columns(2)
+            if st.button(
+                "Local (Mistral)",
+                key="provider_mistral",
+                disabled=not mistral_available,
+                use_container_width=True,
+            ):
+                st.session_state.selected_provider = "mistral"
 
-            with col1:
-                mistral_available = mistral_status.get("available", False)
+            # Status indicator
+            if mistral_available:
+                st.success("Disponible", icon="✓")
+            else:
+                st.warning("Non disponible", icon="⚠")
 
-                if st.button(
-                    "Local (Mistral)",
-                    key="provider_mistral",
-                    disabled=not mistral_available,
-                    use_container_width=True,
-                ):
-                    st.session_state.selected_provider = "mistral"
-                    st.rerun()
+        with col2:
+            gemini_available = gemini_status.get("available", False)
 
-                # Status indicator
-                if mistral_available:
-                    st.success("Disponible", icon="✓")
-                else:
-                    st.warning("Non disponible", icon="⚠")
+            if st.button(
+                "Cloud (Gemini)",
+                key="provider_gemini",
+                disabled=not gemini_available,
+                use_container_width=True,
+            ):
+                st.session_state.selected_provider = "gemini"
 
-            with col2:
-                gemini_available = gemini_status.get("available", False)
+            # Status indicator
+            if gemini_available:
+                st.success("Disponible", icon="✓")
+            else:
+                st.info("Configuration requise", icon="ℹ")
 
-                if st.button(
-                    "Cloud (Gemini)",
-                    key="provider_gemini",
-                    disabled=not gemini_available,
-                    use_container_width=True,
-                ):
-                    st.session_state.selected_provider = "gemini"
-                    st.rerun()
+        # Show selected provider
+        selected_provider = st.session_state.setdefault("selected_provider", "auto")
 
-                # Status indicator
-                if gemini_available:
-                    st.success("Disponible", icon="✓")
-                else:
-                    st.info("Configuration requise", icon="ℹ")
-
-            # Show selected provider
-            selected_provider = st.session_state.get("selected_provider", "auto")
-
-            if selected_provider == "mistral" and mistral_available:
-                st.markdown(
-                    """
-                <div style="background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(5, 150, 105, 0.05) 100%);
-                            padding: 0.75rem 1rem; border-radius: 10px; margin-top: 0.5rem;
-                            border-left: 4px solid #10B981;">
-                    <div style="display: flex; align-items: center; gap: 0.5rem;">
-                        <i class="fas fa-check-circle" style="color: #10B981;"></i>
-                        <span style="font-weight: 600; color: #059669; font-size: 0.875rem;">
-                            Traitement local avec Mistral AI
-                        </span>
-                    </div>
-                    <p style="margin: 0.5rem 0 0 0; font-size: 0.8rem; color: #047857;">
-                        Vos données restent sur votre machine
-                    </p>
-                </div>
-                """,
-                    unsafe_allow_html=True,
-                )
-            elif selected_provider == "gemini" and gemini_available:
-                st.markdown(
-                    """
-                <div style="background: linear-gradient(135deg, rgba(59, 130, 246, 0.1) 0%, rgba(37, 99, 235, 0.05) 100%);
-                            padding: 0.75rem 1rem; border-radius: 10px; margin-top: 0.5rem;
-                            border-left: 4px solid #3B82F6;">
-                    <div style="display: flex; align-items: center; gap: 0.5rem;">
-                        <i class="fas fa-cloud" style="color: #3B82F6;"></i>
-                        <span style="font-weight: 600; color: #2563EB; font-size: 0.875rem;">
-                            Traitement cloud avec Google Gemini
-                        </span>
-                    </div>
-                    <p style="margin: 0.5rem 0 0 0; font-size: 0.8rem; color: #1D4ED8;">
-                        Précision maximale avec l'IA de Google
-                    </p>
-                </div>
-                """,
-                    unsafe_allow_html=True,
-                )
-            else:
-                # Auto mode or no provider available
-                st.markdown(
-                    """
-                <div style="background: linear-gradient(135deg, rgba(100, 116, 139, 0.1) 0%, rgba(71, 85, 105, 0.05) 100%);
-                            padding: 0.75rem 1rem; border-radius: 10px; margin-top: 0.5rem;
-                            border-left: 4px solid #64748B;">
-                    <div style="display: flex; align-items: center; gap: 0.5rem;">
-                        <i class="fas fa-magic" style="color: #64748B;"></i>
-                        <span style="font-weight: 600; color: #475569; font-size: 0.875rem;">
-                            Sélection automatique
-                        </span>
-                    </div>
-                    <p style="margin: 0.5rem 0 0 0; font-size: 0.8rem; color: #334155;">
-                        Le meilleur fournisseur sera choisi automatiquement
-                    </p>
-                </div>
-                """,
-                    unsafe_allow_html=True,
-                )
+        if selected_provider == "mistral" and mistral_available:
+            banner = "mistral"
+        elif selected_provider == "gemini" and gemini_available:
+            banner = "gemini"
+        else:
+            # Auto mode or no provider available
+            banner = "auto"
+        st.markdown(_SELECTED_PROVIDER_BANNERS[banner], unsafe_allow_html=True)
 
-            st.session_state.config = {"mode": mode, "provider": selected_provider}
+        config = {"mode": mode, "provider": selected_provider}
 
-        st.markdown("---")
+    # La page principale affiche la configuration: rerun complet si elle change
+    previous_config = st.session_state.get("config")
+    if previous_config != config:
+        st.session_state.config = config
+        if previous_config is not None:
+            st.rerun()
 
-        # Paramètres de nettoyage
-        with st.expander("⚙️ Paramètres de Nettoyage", expanded=False):
-            st.caption("Options de prétraitement des données")
-
-            remove_duplicates = st.checkbox("Supprimer les doublons", value=True)
-            remove_urls = st.checkbox("Supprimer les URLs", value=True)
-            remove_mentions = st.checkbox("Supprimer les @mentions", value=True)
-            remove_hashtags = st.checkbox("Supprimer les #hashtags", value=False)
-            convert_emojis = st.checkbox("Convertir les emojis en texte", value=True)
-
-            st.session_state.cleaning_config = {
-                "remove_duplicates": remove_duplicates,
-                "remove_urls": remove_urls,
-                "remove_mentions": remove_mentions,
-                "remove_hashtags": remove_hashtags,
-                "convert_emojis": convert_emojis,
-            }
+    st.markdown("---")
 
-        # Informations système (en bas de sidebar)
-        with st.expander("ℹ️ Informations Système", expanded=False):
+    # Paramètres de nettoyage
+    with st.expander("⚙️ Paramètres de Nettoyage", expanded=False):
+        st.caption("Options de prétraitement des données")
+
+        remove_duplicates = st.checkbox("Supprimer les doublons", value=True)
+        remove_urls = st.checkbox("Supprimer les URLs", value=True)
+        remove_mentions = st.checkbox("Supprimer les @mentions", value=True)
+        remove_hashtags = st.checkbox("Supprimer les #hashtags", value=False)
+        convert_emojis = st.checkbox("Convertir les emojis en texte", value=True)
+
+        cleaning_config = {
+            "remove_duplicates": remove_duplicates,
+            "remove_urls": remove_urls,
+            "remove_mentions": remove_mentions,
+            "remove_hashtags": remove_hashtags,
+            "convert_emojis": convert_emojis,
+        }
+        # N'écrire en session que si la configuration a changé
+        if st.session_state.get("cleaning_config") != cleaning_config:
+            st.session_state.cleaning_config = cleaning_config
+
+    # Informations système (en bas de sidebar)
+    # Le contenu d'un expander replié est exécuté à chaque rerun: les onglets
+    # coûteux (instanciation BERT, système de rôles) ne sont rendus qu'à la demande
+    with st.expander("ℹ️ Informations Système", expanded=False):
+        if st.toggle("Afficher les détails", key="show_system_info"):
             _render_system_info_tab()
 
-        # Gestion des rôles
-        with st.expander("👥 Gestion des Rôles", expanded=False):
+    # Gestion des rôles
+    with st.expander("👥 Gestion des Rôles", expanded=False):
+        if st.toggle("Afficher la gestion des rôles", key="show_role_management"):
             _render_role_management_tab()
 
-        # Footer compact
-        st.markdown("---")
-        st.caption(f"💻 FreeMobilaChat v2.0 | {datetime.now().strftime('%Y-%m-%d')}")
+    # Footer compact
+    st.markdown("---")
+    st.caption(f"💻 FreeMobilaChat v2.0 | {datetime.now().strftime('%Y-%m-%d')}")
+
+    # Afficher la modal de configuration si nécessaire
+    if PROVIDER_MANAGER_AVAILABLE and render_provider_configuration_modal:
+        render_provider_configuration_modal(on_key_saved=_clear_provider_caches)
 
-        # Afficher la modal de configuration si nécessaire
-        if PROVIDER_MANAGER_AVAILABLE and render_provider_configuration_modal:
-            render_provider_configuration_modal()
+
+def _short_err(error: Any, limit: int = 100) -> str:
+    """Première ligne d'un message d'erreur, tronquée à `limit` caractères."""
+    message = str(error)
+    newline = message.find("\n")
+    return (message[:newline] if newline >= 0 else message)[:limit]
 
 
 def _check_mistral_availability() -> dict:
@@ -1027,8 +1338,8 @@ def _check_mistral_availability() -> dict:
 
     try:
         modules = _load_classification_modules()
-        modules_dict = modules.get("modules", {})
         modules_status = modules.get("modules_status", {})
+        modules_dict = modules_status.get("modules", {})
 
         # Vérifier si MistralClassifier est chargé
         if "MistralClassifier" not in modules_dict:
@@ -1036,7 +1347,7 @@ def _check_mistral_availability() -> dict:
                 "MistralClassifier", "Erreur inconnue"
             )
             result["message"] = "Module MistralClassifier non chargé"
-            result["details"] = str(error_msg)[:100]  # Limiter la longueur
+            result["details"] = _short_err(error_msg)
             if "ollama" in str(error_msg).lower() or "import" in str(error_msg).lower():
                 result["solution"] = "Installation: pip install ollama"
             else:
@@ -1075,7 +1386,7 @@ def _check_mistral_availability() -> dict:
                 )
         except Exception as e:
             result["message"] = "Erreur lors de la vérification Ollama"
-            result["details"] = str(e)[:100]
+            result["details"] = _short_err(e)
             result["solution"] = (
                 "Vérifiez que Ollama est installé: pip install ollama\nPuis démarrez: ollama serve"
             )
@@ -1104,23 +1415,13 @@ def _check_gemini_availability() -> dict:
         "color": "#F79F1F",
     }
 
-    # S'assurer que le .env est chargé avant la vérification
-    try:
-        env_path = Path(__file__).parent.parent.parent / ".env"
-        if env_path.exists():
-            load_dotenv(env_path, override=True)
-            logger.debug(f"Fichier .env rechargé depuis: {env_path}")
-        else:
-            root_env = Path(__file__).parent.parent.parent.parent / ".env"
-            if root_env.exists():
-                load_dotenv(root_env, override=True)
-                logger.debug(f"Fichier .env rechargé depuis: {root_env}")
-    except Exception as e:
-        logger.debug(f"Erreur lors du chargement .env (non bloquant): {e}")
+    # S'assurer que le .env est chargé avant la vérification, puis lire la clé une fois
+    _ensure_env_loaded()
+    api_key = os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
 
     try:
         modules = _load_classification_modules()
-        modules_dict = modules.get("modules", {})
+        modules_dict = modules.get("modules_status", {}).get("modules", {})
 
         # Vérifier si GeminiClassifier est chargé
         if "GeminiClassifier" not in modules_dict:
@@ -1130,7 +1431,7 @@ def _check_gemini_availability() -> dict:
                 .get("GeminiClassifier", "Erreur inconnue")
             )
             result["message"] = "Module GeminiClassifier non chargé"
-            result["details"] = str(error_msg)[:100]
+            result["details"] = _short_err(error_msg)
             if (
                 "google-generativeai" in str(error_msg).lower()
                 or "import" in str(error_msg).lower()
@@ -1156,7 +1457,6 @@ def _check_gemini_availability() -> dict:
                     result["solution"] = ""
                 else:
                     # Vérifier directement la clé API
-                    api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
                     if not api_key:
                         result["message"] = "Gemini API non configurée"
                         result["details"] = "La clé API Gemini n'est pas définie"
@@ -1173,11 +1473,10 @@ def _check_gemini_availability() -> dict:
                         )
             except Exception as e:
                 result["message"] = "Erreur lors de la vérification Gemini"
-                result["details"] = str(e)[:100]
+                result["details"] = _short_err(e)
                 result["solution"] = "Vérifiez la configuration de votre clé API"
         else:
             # Fallback: vérifier directement la clé API
-            api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
             if api_key:
                 result["available"] = True
                 result["message"] = "Gemini API configurée"
@@ -1194,7 +1493,6 @@ def _check_gemini_availability() -> dict:
     except Exception as e:
         logger.warning(f"Erreur vérification Gemini: {e}")
         # Fallback: vérifier directement la clé API
-        api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
         if api_key:
             result["available"] = True
             result["message"] = "Gemini API configurée"
@@ -1203,89 +1501,161 @@ def _check_gemini_availability() -> dict:
             result["color"] = "#10AC84"
         else:
             result["message"] = "Gemini API non configurée"
-            result["details"] = str(e)[:100]
+            result["details"] = _short_err(e)
             result["solution"] = (
                 "Ajoutez GEMINI_API_KEY=votre_cle dans le fichier .env\nObtenez votre clé sur: https://makersuite.google.com/app/apikey"
             )
 
-    try:
-        from services.gemini_classifier import check_gemini_availability
+    return result
 
-        try:
-            is_available = check_gemini_availability()
-            if is_available:
-                result["available"] = True
-                result["message"] = "Gemini API disponible"
-                result["details"] = "Clé API configurée et valide"
-                result["icon"] = "fa-check-circle"
-                result["color"] = "#10AC84"
-                result["solution"] = ""
-            else:
-                if api_key:
-                    result["message"] = "Gemini API non accessible"
-                    result["details"] = (
-                        "La clé API est présente mais la connexion échoue"
-                    )
-                    result["solution"] = (
-                        "Vérifiez que la clé est valide et que google-generativeai est installé"
-                    )
-                else:
-                    result["message"] = "Gemini API non configurée"
-                    result["details"] = "La clé API Gemini n'est pas définie"
-                    result["solution"] = (
-                        "Ajoutez GEMINI_API_KEY=votre_cle dans le fichier .env à la racine du projet"
-                    )
-        except Exception as e:
-            result["message"] = "Erreur lors de la vérification Gemini"
-            result["details"] = str(e)[:100]
-            if "google-generativeai" in str(e).lower() or "import" in str(e).lower():
-                result["solution"] = "Installez: pip install google-generativeai"
-            else:
-                result["solution"] = "Vérifiez la configuration de la clé API"
 
-    except ImportError as e:
-        result["message"] = "Module GeminiClassifier non disponible"
-        result["details"] = str(e)[:100]
-        result["solution"] = (
-            "Vérifiez que le module gemini_classifier.py existe et que google-generativeai est installé"
-        )
-    except Exception as e:
-        logger.warning(f"Erreur vérification Gemini: {e}")
-        result["details"] = str(e)[:100]
-        result["solution"] = "Vérifiez les logs pour plus de détails"
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_mistral_status() -> dict:
+    """Statut Mistral mis en cache 30s (évite la sonde Ollama à chaque rerun)."""
+    return _check_mistral_availability()
 
-    return result
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_gemini_status() -> dict:
+    """Statut Gemini mis en cache 30s (évite la vérification API à chaque rerun)."""
+    return _check_gemini_availability()
 
-def _render_system_status():
-    """
-    Affiche le statut système avec design épuré et professionnel.
 
-    Présente le statut de manière concise sans surcharge visuelle.
-    """
-    modules = _load_classification_modules()
-    modules_status = modules.get("modules_status", {})
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_ollama_available() -> Optional[bool]:
+    """Sonde du service Ollama mise en cache 30s (None si le module manque)."""
+    check_ollama = _load_classification_modules().get("check_ollama_availability")
+    return check_ollama() if check_ollama else None
 
-    # Statut global simplifié
-    overall_status = modules.get("available", False)
-    status_color = "#10AC84" if overall_status else "#EE5A6F"
-    status_icon = "fa-check-circle" if overall_status else "fa-exclamation-triangle"
-    status_text = "Opérationnel" if overall_status else "Partiellement Disponible"
 
-    st.markdown(
-        f"""
-    <div style="background: {'#F0FDF4' if overall_status else '#FEF2F2'};
-                padding: 0.75rem 1rem; border-radius: 8px; margin-bottom: 1rem;
-                border-left: 3px solid {status_color};">
-        <div style="display: flex; align-items: center; gap: 0.5rem;">
-            <i class="fas {status_icon}" style="color: {status_color}; font-size: 1rem;"></i>
-            <span style="font-weight: 600; color: #1E3A5F; font-size: 0.9rem;">{status_text}</span>
-        </div>
-    </div>
-    """,
-        unsafe_allow_html=True,
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_ollama_models() -> List[str]:
+    """Liste des modèles Ollama installés, mise en cache 30s."""
+    list_models = _load_classification_modules().get("list_available_models")
+    return list_models() if list_models else []
+
+
+# ==============================================================================
+# GABARITS HTML - STATUT ET CARDS PROVIDERS
+# ==============================================================================
+
+# Bandeau de statut global indexé par disponibilité des modules
+_SYSTEM_STATUS_TMPL = Template(
+    """
+<div style="background: $bg;
+            padding: 0.75rem 1rem; border-radius: 8px; margin-bottom: 1rem;
+            border-left: 3px solid $color;">
+    <div style="display: flex; align-items: center; gap: 0.5rem;">
+        <i class="fas $icon" style="color: $color; font-size: 1rem;"></i>
+        <span style="font-weight: 600; color: #1E3A5F; font-size: 0.9rem;">$text</span>
+    </div>
+</div>
+"""
+)
+_SYSTEM_STATUS_HTML = {
+    True: _SYSTEM_STATUS_TMPL.substitute(
+        bg="#F0FDF4", color="#10AC84", icon="fa-check-circle", text="Opérationnel"
+    ),
+    False: _SYSTEM_STATUS_TMPL.substitute(
+        bg="#FEF2F2",
+        color="#EE5A6F",
+        icon="fa-exclamation-triangle",
+        text="Partiellement Disponible",
+    ),
+}
+
+_PROVIDER_HEADER_HTML = """
+<div style="margin-bottom: 1.5rem;">
+    <h3 style="font-size: 1.25rem; font-weight: 700; color: #1E293B; margin-bottom: 0.5rem; 
+                display: flex; align-items: center; gap: 0.5rem;">
+        <i class="fas fa-plug" style="color: #667eea;"></i>
+        Provider de Classification
+    </h3>
+    <p style="color: #64748B; font-size: 0.875rem; margin: 0;">Sélectionnez votre modèle d'IA préféré</p>
+</div>
+"""
+
+# Icône de statut par palette (couleurs définies par .provider-card--<palette>)
+_CARD_STATUS_ICONS = {
+    "success": "fa-check-circle",
+    "danger": "fa-exclamation-circle",
+    "warning": "fa-exclamation-circle",
+}
+
+# Identité visuelle de chaque provider et rendu lorsqu'il est indisponible
+_PROVIDER_CARDS = {
+    "mistral": {
+        "icon": "fa-robot",
+        "title": "Mistral AI",
+        "origin_icon": "fa-server",
+        "origin": "Local via Ollama",
+        "unavailable_palette": "danger",
+        "unavailable_text": "Indisponible",
+    },
+    "gemini": {
+        "icon": "fa-cloud",
+        "title": "Gemini API",
+        "origin_icon": "fa-globe",
+        "origin": "Google Cloud",
+        "unavailable_palette": "warning",
+        "unavailable_text": "Configuration requise",
+    },
+}
+
+# Gabarit compact: tout le style statique vit dans la feuille de style de la page
+_PROVIDER_CARD_TMPL = Template(
+    '<div class="provider-card provider-card--$palette">'
+    '<div class="provider-card-glow"></div>'
+    '<div class="provider-card-head">'
+    '<div class="provider-card-id">'
+    '<div class="provider-card-badge"><i class="fas $icon"></i></div>'
+    '<div><div class="provider-card-title">$title</div>'
+    '<div class="provider-card-origin"><i class="fas $origin_icon"></i>$origin</div></div>'
+    "</div>"
+    '<div class="provider-card-status"><i class="fas $status_icon"></i>'
+    "<span>$status_text</span></div>"
+    "</div>"
+    '<div class="provider-card-message"><i class="fas fa-info-circle"></i>$message</div>'
+    "</div>"
+)
+
+
+def _provider_card_html(provider_key: str, status: Dict[str, Any]) -> str:
+    """
+    Construit le HTML d'une card provider à partir du gabarit pré-compilé.
+
+    Args:
+        provider_key: Clé dans _PROVIDER_CARDS ('mistral' ou 'gemini')
+        status: Résultat de _check_mistral_availability / _check_gemini_availability
+    """
+    provider = _PROVIDER_CARDS[provider_key]
+    if status.get("available", False):
+        palette, status_text = "success", "Disponible"
+    else:
+        palette = provider["unavailable_palette"]
+        status_text = provider["unavailable_text"]
+    return _PROVIDER_CARD_TMPL.safe_substitute(
+        provider,
+        palette=palette,
+        status_icon=_CARD_STATUS_ICONS[palette],
+        status_text=status_text,
+        message=status.get("message", "Non disponible"),
     )
 
+
+def _render_system_status():
+    """
+    Affiche le statut système avec design épuré et professionnel.
+
+    Présente le statut de manière concise sans surcharge visuelle.
+    """
+    modules = _load_classification_modules()
+    modules_status = modules.get("modules_status", {})
+
+    # Statut global simplifié
+    overall_status = modules.get("available", False)
+    st.markdown(_SYSTEM_STATUS_HTML[bool(overall_status)], unsafe_allow_html=True)
+
     # Liste compacte des modules
     available_modules = modules_status.get("modules", {})
     error_modules = modules_status.get("errors", {})
@@ -1318,193 +1688,44 @@ def _render_system_status():
                 st.caption("💡 Solution: `pip install torch transformers`")
 
 
+# Options du sélecteur de provider: (clé, libellé), dans l'ordre d'affichage
+_PROVIDER_OPTION_LABELS = (
+    ("mistral", "Mistral (Local)"),
+    ("gemini", "Gemini API"),
+)
+
+
 def _render_provider_cards():
     """
     Affiche les cards visuelles modernes avec design glassmorphism pour les providers Mistral et Gemini.
 
     Design premium avec animations, gradients et effets de profondeur.
     """
-    mistral_status = _check_mistral_availability()
-    gemini_status = _check_gemini_availability()
-
-    st.markdown(
-        """
-    <div style="margin-bottom: 1.5rem;">
-        <h3 style="font-size: 1.25rem; font-weight: 700; color: #1E293B; margin-bottom: 0.5rem; 
-                    display: flex; align-items: center; gap: 0.5rem;">
-            <i class="fas fa-plug" style="color: #667eea;"></i>
-            Provider de Classification
-        </h3>
-        <p style="color: #64748B; font-size: 0.875rem; margin: 0;">Sélectionnez votre modèle d'IA préféré</p>
-    </div>
-    """,
-        unsafe_allow_html=True,
+    mistral_status = _cached_mistral_status()
+    gemini_status = _cached_gemini_status()
+
+    mistral_available = mistral_status.get("available", False)
+    gemini_available = gemini_status.get("available", False)
+
+    # En-tête + cards glassmorphism en un seul bloc HTML (aucun widget dans les cards),
+    # reconstruit seulement si le statut d'un provider a changé depuis le dernier rendu
+    cards_key = (
+        mistral_available,
+        mistral_status.get("message"),
+        gemini_available,
+        gemini_status.get("message"),
     )
-
-    # Cards modernes avec glassmorphism
-    col1, col2 = st.columns(2, gap="large")
-
-    with col1:
-        # Card Mistral - Design premium avec glassmorphism
-        mistral_available = mistral_status.get("available", False)
-        mistral_color = "#10B981" if mistral_available else "#EF4444"
-        mistral_bg_gradient = (
-            "linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(5, 150, 105, 0.05) 100%)"
-            if mistral_available
-            else "linear-gradient(135deg, rgba(239, 68, 68, 0.1) 0%, rgba(220, 38, 38, 0.05) 100%)"
-        )
-        mistral_icon = (
-            "fa-check-circle" if mistral_available else "fa-exclamation-circle"
-        )
-        mistral_message = mistral_status.get("message", "Non disponible")
-        mistral_status_text = "Disponible" if mistral_available else "Indisponible"
-
-        st.markdown(
-            f"""
-        <div class="provider-card" style="
-            background: {mistral_bg_gradient};
-            backdrop-filter: blur(10px);
-            border: 1px solid {'rgba(16, 185, 129, 0.2)' if mistral_available else 'rgba(239, 68, 68, 0.2)'};
-            padding: 1.5rem;
-            border-radius: 16px;
-            margin-bottom: 1rem;
-            box-shadow: 0 4px 20px {'rgba(16, 185, 129, 0.15)' if mistral_available else 'rgba(239, 68, 68, 0.15)'};
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            position: relative;
-            overflow: hidden;
-        ">
-            <div style="position: absolute; top: 0; right: 0; width: 100px; height: 100px; 
-                        background: radial-gradient(circle, {'rgba(16, 185, 129, 0.1)' if mistral_available else 'rgba(239, 68, 68, 0.1)'} 0%, transparent 70%);
-                        border-radius: 50%; transform: translate(30px, -30px);"></div>
-            
-            <div style="display: flex; align-items: flex-start; justify-content: space-between; 
-                        margin-bottom: 1rem; position: relative; z-index: 1;">
-                <div style="display: flex; align-items: center; gap: 0.75rem;">
-                    <div style="
-                        width: 48px; height: 48px;
-                        background: {'linear-gradient(135deg, #10B981 0%, #059669 100%)' if mistral_available else 'linear-gradient(135deg, #EF4444 0%, #DC2626 100%)'};
-                        border-radius: 12px;
-                        display: flex;
-                        align-items: center;
-                        justify-content: center;
-                        box-shadow: 0 4px 12px {'rgba(16, 185, 129, 0.3)' if mistral_available else 'rgba(239, 68, 68, 0.3)'};
-                    ">
-                        <i class="fas fa-robot" style="color: white; font-size: 1.25rem;"></i>
-                    </div>
-                    <div>
-                        <div style="font-weight: 700; color: #0F172A; font-size: 1rem; margin-bottom: 0.25rem;">
-                            Mistral AI
-                        </div>
-                        <div style="font-size: 0.75rem; color: #64748B; font-weight: 500;">
-                            <i class="fas fa-server" style="margin-right: 0.25rem;"></i>Local via Ollama
-                        </div>
-                    </div>
-                </div>
-                <div style="
-                    padding: 0.375rem 0.75rem;
-                    background: {'rgba(16, 185, 129, 0.15)' if mistral_available else 'rgba(239, 68, 68, 0.15)'};
-                    border-radius: 20px;
-                    display: flex;
-                    align-items: center;
-                    gap: 0.375rem;
-                ">
-                    <i class="fas {mistral_icon}" style="color: {mistral_color}; font-size: 0.75rem;"></i>
-                    <span style="font-size: 0.75rem; font-weight: 600; color: {mistral_color};">
-                        {mistral_status_text}
-                    </span>
-                </div>
-            </div>
-            
-            <div style="font-size: 0.8125rem; color: #475569; line-height: 1.5; position: relative; z-index: 1;
-                        padding-top: 0.75rem; border-top: 1px solid {'rgba(16, 185, 129, 0.1)' if mistral_available else 'rgba(239, 68, 68, 0.1)'};">
-                <i class="fas fa-info-circle" style="color: #64748B; margin-right: 0.375rem; font-size: 0.75rem;"></i>
-                {mistral_message}
-            </div>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
-
-    with col2:
-        # Card Gemini - Design premium avec glassmorphism
-        gemini_available = gemini_status.get("available", False)
-        gemini_color = "#10B981" if gemini_available else "#F59E0B"
-        gemini_bg_gradient = (
-            "linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(5, 150, 105, 0.05) 100%)"
-            if gemini_available
-            else "linear-gradient(135deg, rgba(245, 158, 11, 0.1) 0%, rgba(217, 119, 6, 0.05) 100%)"
-        )
-        gemini_icon = "fa-check-circle" if gemini_available else "fa-exclamation-circle"
-        gemini_message = gemini_status.get("message", "Non disponible")
-        gemini_status_text = (
-            "Disponible" if gemini_available else "Configuration requise"
-        )
-
-        st.markdown(
-            f"""
-        <div class="provider-card" style="
-            background: {gemini_bg_gradient};
-            backdrop-filter: blur(10px);
-            border: 1px solid {'rgba(16, 185, 129, 0.2)' if gemini_available else 'rgba(245, 158, 11, 0.2)'};
-            padding: 1.5rem;
-            border-radius: 16px;
-            margin-bottom: 1rem;
-            box-shadow: 0 4px 20px {'rgba(16, 185, 129, 0.15)' if gemini_available else 'rgba(245, 158, 11, 0.15)'};
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            position: relative;
-            overflow: hidden;
-        ">
-            <div style="position: absolute; top: 0; right: 0; width: 100px; height: 100px; 
-                        background: radial-gradient(circle, {'rgba(16, 185, 129, 0.1)' if gemini_available else 'rgba(245, 158, 11, 0.1)'} 0%, transparent 70%);
-                        border-radius: 50%; transform: translate(30px, -30px);"></div>
-            
-            <div style="display: flex; align-items: flex-start; justify-content: space-between; 
-                        margin-bottom: 1rem; position: relative; z-index: 1;">
-                <div style="display: flex; align-items: center; gap: 0.75rem;">
-                    <div style="
-                        width: 48px; height: 48px;
-                        background: {'linear-gradient(135deg, #10B981 0%, #059669 100%)' if gemini_available else 'linear-gradient(135deg, #F59E0B 0%, #D97706 100%)'};
-                        border-radius: 12px;
-                        display: flex;
-                        align-items: center;
-                        justify-content: center;
-                        box-shadow: 0 4px 12px {'rgba(16, 185, 129, 0.3)' if gemini_available else 'rgba(245, 158, 11, 0.3)'};
-                    ">
-                        <i class="fas fa-cloud" style="color: white; font-size: 1.25rem;"></i>
-                    </div>
-                    <div>
-                        <div style="font-weight: 700; color: #0F172A; font-size: 1rem; margin-bottom: 0.25rem;">
-                            Gemini API
-                        </div>
-                        <div style="font-size: 0.75rem; color: #64748B; font-weight: 500;">
-                            <i class="fas fa-globe" style="margin-right: 0.25rem;"></i>Google Cloud
-                        </div>
-                    </div>
-                </div>
-                <div style="
-                    padding: 0.375rem 0.75rem;
-                    background: {'rgba(16, 185, 129, 0.15)' if gemini_available else 'rgba(245, 158, 11, 0.15)'};
-                    border-radius: 20px;
-                    display: flex;
-                    align-items: center;
-                    gap: 0.375rem;
-                ">
-                    <i class="fas {gemini_icon}" style="color: {gemini_color}; font-size: 0.75rem;"></i>
-                    <span style="font-size: 0.75rem; font-weight: 600; color: {gemini_color};">
-                        {gemini_status_text}
-                    </span>
-                </div>
-            </div>
-            
-            <div style="font-size: 0.8125rem; color: #475569; line-height: 1.5; position: relative; z-index: 1;
-                        padding-top: 0.75rem; border-top: 1px solid {'rgba(16, 185, 129, 0.1)' if gemini_available else 'rgba(245, 158, 11, 0.1)'};">
-                <i class="fas fa-info-circle" style="color: #64748B; margin-right: 0.375rem; font-size: 0.75rem;"></i>
-                {gemini_message}
-            </div>
-        </div>
-        """,
-            unsafe_allow_html=True,
+    if st.session_state.get("_provider_cards_key") != cards_key:
+        cards_html = _provider_card_html(
+            "mistral", mistral_status
+        ) + _provider_card_html("gemini", gemini_status)
+        st.session_state["_provider_cards_html"] = (
+            f"{_PROVIDER_HEADER_HTML}"
+            f'<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 2rem;">'
+            f"{cards_html}</div>"
         )
+        st.session_state["_provider_cards_key"] = cards_key
+    st.markdown(st.session_state["_provider_cards_html"], unsafe_allow_html=True)
 
     # Messages d'aide compacts uniquement si nécessaire
     if not gemini_available and gemini_status.get("solution"):
@@ -1515,35 +1736,21 @@ def _render_provider_cards():
         with st.expander("💡 Configuration Mistral", expanded=False):
             st.caption(mistral_status.get("solution", ""))
 
-    # Sélection du provider
-    provider_options = []
-    provider_labels = {}
-
-    if mistral_available:
-        provider_options.append("mistral")
-        provider_labels["mistral"] = "Mistral (Local)"
-
-    if gemini_available:
-        provider_options.append("gemini")
-        provider_labels["gemini"] = "Gemini API"
-
-    # Si aucun provider disponible, ajouter quand même les options
-    if not provider_options:
-        provider_options = ["mistral", "gemini"]
-        provider_labels = {
-            "mistral": "Mistral (Local) - Non disponible",
-            "gemini": "Gemini API - Non disponible",
-        }
+    # Sélection du provider (ordre mistral puis gemini)
+    availability = {"mistral": mistral_available, "gemini": gemini_available}
+    provider_labels = {
+        key: label for key, label in _PROVIDER_OPTION_LABELS if availability[key]
+    } or {
+        # Si aucun provider disponible, proposer quand même les options
+        key: f"{label} - Non disponible"
+        for key, label in _PROVIDER_OPTION_LABELS
+    }
 
     selected_provider = st.radio(
         "Choisissez le modèle:",
-        options=provider_options,
-        format_func=lambda x: provider_labels.get(x, x),
-        index=(
-            0
-            if "mistral" in provider_options
-            else (1 if "gemini" in provider_options else 0)
-        ),
+        options=tuple(provider_labels),
+        format_func=provider_labels.__getitem__,
+        index=0,
         key="api_provider_selector",
         help="Mistral: Local via Ollama | Gemini: API externe Google",
     )
@@ -1554,6 +1761,170 @@ def _render_provider_cards():
     return selected_provider
 
 
+# Gabarits HTML statiques de l'onglet classificateurs
+_AVAILABLE_HEADER_HTML = """
+<div style="background: linear-gradient(135deg, rgba(16, 172, 132, 0.15) 0%, rgba(16, 172, 132, 0.08) 100%);
+            padding: 0.75rem 1rem; border-radius: 10px; margin-bottom: 1rem;
+            border-left: 4px solid #10AC84;">
+    <strong style="color: #10AC84;"><i class="fas fa-check-circle"></i> Classificateurs Disponibles</strong>
+</div>
+"""
+
+_PARTIAL_HEADER_HTML = """
+<div style="background: linear-gradient(135deg, rgba(238, 90, 111, 0.15) 0%, rgba(238, 90, 111, 0.08) 100%);
+            padding: 0.75rem 1rem; border-radius: 10px; margin-bottom: 1rem;
+            border-left: 4px solid #EE5A6F;">
+    <strong style="color: #EE5A6F;"><i class="fas fa-exclamation-triangle"></i> Modules Partiellement Disponibles</strong>
+</div>
+"""
+
+_OLLAMA_ACTIVE_HTML = """
+<div style="background: linear-gradient(135deg, rgba(16, 172, 132, 0.15) 0%, rgba(16, 172, 132, 0.08) 100%);
+            padding: 0.75rem 1rem; border-radius: 10px; margin-bottom: 1rem;
+            border-left: 4px solid #10AC84;">
+    <strong style="color: #10AC84;"><i class="fas fa-check-circle"></i> Ollama actif</strong>
+    <span style="color: #666;"> | Service LLM opérationnel</span>
+</div>
+"""
+
+_OLLAMA_INACTIVE_HTML = """
+<div style="background: linear-gradient(135deg, rgba(238, 90, 111, 0.15) 0%, rgba(238, 90, 111, 0.08) 100%);
+            padding: 0.75rem 1rem; border-radius: 10px; margin-bottom: 1rem;
+            border-left: 4px solid #EE5A6F;">
+    <strong style="color: #EE5A6F;"><i class="fas fa-exclamation-circle"></i> Ollama inactif</strong>
+    <div style="font-size: 0.85rem; color: #666; margin-top: 0.5rem;">
+        Service LLM non disponible
+    </div>
+    <div style="margin-top: 0.5rem;">
+        <i class="fas fa-terminal"></i> <code style="font-size: 0.75rem;">ollama serve</code>
+    </div>
+</div>
+"""
+
+_OLLAMA_MODEL_ROW_TMPL = Template(
+    """
+<div style="background: #F8F9FA; padding: 0.75rem; border-radius: 8px;
+            margin-bottom: 0.5rem; border-left: 3px solid #2E86DE;">
+    <div style="font-weight: 700; color: #1E3A5F;">$model</div>
+    <div style="font-size: 0.75rem; color: #10AC84; font-weight: 600;">
+        $status
+    </div>
+</div>
+"""
+)
+
+
+def _ollama_models_html(models: List[str]) -> str:
+    """Lignes HTML des modèles Ollama (le premier est le modèle recommandé)."""
+    statuses = ["Recommandé"] + ["Disponible"] * (len(models) - 1)
+    return "".join(
+        [
+            _OLLAMA_MODEL_ROW_TMPL.safe_substitute(model=model, status=status)
+            for model, status in zip(models, statuses)
+        ]
+    )
+
+
+_CLASSIFIER_CARD_TMPL = Template(
+    """
+<div style="background: linear-gradient(135deg, rgba(16, 172, 132, 0.1) 0%, rgba(16, 172, 132, 0.05) 100%);
+            padding: 0.75rem; border-radius: 8px; margin-bottom: 0.5rem;
+            border-left: 3px solid #10AC84;">
+    <div style="display: flex; align-items: center; gap: 0.5rem;">
+        <i class="fas fa-check-circle" style="color: #10AC84;"></i>
+        <div style="flex: 1;">
+            <div style="font-weight: 700; color: #1E3A5F; font-size: 0.95rem;">$name</div>
+            <div style="font-size: 0.8rem; color: #666;">$desc</div>
+        </div>
+        <span style="background: #10AC84; color: white; padding: 0.25rem 0.5rem; border-radius: 12px; font-size: 0.7rem; font-weight: 600;">Actif</span>
+    </div>
+</div>
+"""
+)
+
+_CLASSIFIER_ERROR_CARD_TMPL = Template(
+    """
+<div style="background: linear-gradient(135deg, ${color}15 0%, ${color}08 100%);
+            padding: 0.75rem; border-radius: 8px; margin-bottom: 0.5rem;
+            border-left: 3px solid $color;">
+    <div style="display: flex; align-items: flex-start; gap: 0.5rem;">
+        <i class="fas fa-times-circle" style="color: $color; margin-top: 0.2rem;"></i>
+        <div style="flex: 1;">
+            <div style="font-weight: 700; color: #1E3A5F; font-size: 0.95rem;">$name</div>
+            <div style="font-size: 0.8rem; color: #666; margin-top: 0.25rem;">$desc</div>
+            <div style="font-size: 0.75rem; color: $color; margin-top: 0.5rem; font-weight: 600;">
+                <i class="fas fa-exclamation-circle"></i> $error
+            </div>
+        </div>
+        <span style="background: $color; color: white; padding: 0.25rem 0.5rem; border-radius: 12px; font-size: 0.7rem; font-weight: 600;">$label</span>
+    </div>
+</div>
+"""
+)
+
+# Liste des classificateurs avec statut détaillé: clé -> (nom, description, essentiel)
+_CLASSIFICATEURS_INFO = {
+    "TweetCleaner": ("Tweet Cleaner", "Nettoyage et préprocessing", True),
+    "EnhancedRuleClassifier": (
+        "Rule Classifier",
+        "Classification par règles métier",
+        True,
+    ),
+    "BERTClassifier": (
+        "BERT Classifier",
+        "Deep Learning - Analyse de sentiment",
+        False,
+    ),
+    "MistralClassifier": ("Mistral Classifier", "LLM Mistral AI via Ollama", False),
+    "MultiModelOrchestrator": (
+        "Multi-Model Orchestrator",
+        "Orchestration intelligente",
+        False,
+    ),
+}
+
+# Couleur et libellé d'une card en erreur, indexés par le caractère essentiel
+_CLASSIFIER_SEVERITY = {
+    True: {"color": "#EE5A6F", "label": "Critique"},
+    False: {"color": "#F79F1F", "label": "Optionnel"},
+}
+
+
+# Position d'affichage de chaque classificateur
+_CLASSIFIER_RANK = {key: idx for idx, key in enumerate(_CLASSIFICATEURS_INFO)}
+
+
+def _classifier_keys_in(modules_map: Dict[str, Any]) -> List[str]:
+    """Classificateurs connus présents dans modules_map, dans l'ordre d'affichage."""
+    return sorted(
+        modules_map.keys() & _CLASSIFICATEURS_INFO.keys(),
+        key=_CLASSIFIER_RANK.__getitem__,
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _available_card_html(key: str) -> str:
+    """
+    HTML de la card "Actif" d'un classificateur.
+
+    Entièrement constant: mis en cache par classificateur, il n'est rendu
+    qu'une fois par processus et seulement si l'onglet est affiché.
+    """
+    name, desc, _essential = _CLASSIFICATEURS_INFO[key]
+    return _CLASSIFIER_CARD_TMPL.safe_substitute(name=name, desc=desc)
+
+
+def _classifier_error_card_html(
+    name: str, desc: str, error_msg: str, essential: bool
+) -> str:
+    """HTML d'une card de classificateur indisponible (critique ou optionnel)."""
+    error = error_msg if len(error_msg) <= 80 else f"{error_msg[:80]}..."
+    return _CLASSIFIER_ERROR_CARD_TMPL.safe_substitute(
+        _CLASSIFIER_SEVERITY[essential], name=name, desc=desc, error=error
+    )
+
+
+@st.fragment
 def _render_classifiers_tab():
     """
     Affiche l'onglet des classificateurs disponibles avec affichage structuré.
@@ -1562,182 +1933,70 @@ def _render_classifiers_tab():
     et affiche leur statut ainsi que les modèles Ollama disponibles si applicable.
     Utilise la nouvelle structure de modules avec gestion gracieuse des erreurs.
     """
+    # Lectures du dict de modules regroupées en tête de fonction
     modules = _load_classification_modules()
-    modules_status = modules.get("modules_status", {})
-    available_modules = modules_status.get("modules", {})
-    error_modules = modules_status.get("errors", {})
+    modules_status = modules.get("modules_status") or {}
+    available_modules = modules_status.get("modules") or {}
+    error_modules = modules_status.get("errors") or {}
+    is_available = modules.get("available")
 
     # Header avec statut
-    if modules.get("available"):
-        st.markdown(
-            """
-        <div style="background: linear-gradient(135deg, rgba(16, 172, 132, 0.15) 0%, rgba(16, 172, 132, 0.08) 100%);
-                    padding: 0.75rem 1rem; border-radius: 10px; margin-bottom: 1rem;
-                    border-left: 4px solid #10AC84;">
-            <strong style="color: #10AC84;"><i class="fas fa-check-circle"></i> Classificateurs Disponibles</strong>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
-    else:
-        st.markdown(
-            """
-        <div style="background: linear-gradient(135deg, rgba(238, 90, 111, 0.15) 0%, rgba(238, 90, 111, 0.08) 100%);
-                    padding: 0.75rem 1rem; border-radius: 10px; margin-bottom: 1rem;
-                    border-left: 4px solid #EE5A6F;">
-            <strong style="color: #EE5A6F;"><i class="fas fa-exclamation-triangle"></i> Modules Partiellement Disponibles</strong>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
-
-    # Liste des classificateurs avec statut détaillé
-    classificateurs_info = {
-        "TweetCleaner": ("Tweet Cleaner", "Nettoyage et préprocessing", True),
-        "EnhancedRuleClassifier": (
-            "Rule Classifier",
-            "Classification par règles métier",
-            True,
-        ),
-        "BERTClassifier": (
-            "BERT Classifier",
-            "Deep Learning - Analyse de sentiment",
-            False,
-        ),
-        "MistralClassifier": ("Mistral Classifier", "LLM Mistral AI via Ollama", False),
-        "MultiModelOrchestrator": (
-            "Multi-Model Orchestrator",
-            "Orchestration intelligente",
-            False,
-        ),
-    }
+    st.markdown(
+        _AVAILABLE_HEADER_HTML if is_available else _PARTIAL_HEADER_HTML,
+        unsafe_allow_html=True,
+    )
 
     # Afficher les classificateurs disponibles
-    available_count = len(
-        [
-            k
-            for k in available_modules.keys()
-            if k in classificateurs_info and k != "torch_available"
-        ]
-    )
-    if available_count > 0:
+    # Intersection de vues de clés ("torch_available" n'est pas un classificateur),
+    # remise dans l'ordre d'affichage de _CLASSIFICATEURS_INFO
+    available_keys = _classifier_keys_in(available_modules)
+    if available_keys:
         with st.expander(
-            f"Classificateurs Disponibles ({available_count})", expanded=True
+            f"Classificateurs Disponibles ({len(available_keys)})", expanded=True
         ):
-            for module_key, (name, desc, essential) in classificateurs_info.items():
-                if module_key in available_modules:
-                    st.markdown(
-                        f"""
-                    <div style="background: linear-gradient(135deg, rgba(16, 172, 132, 0.1) 0%, rgba(16, 172, 132, 0.05) 100%);
-                                padding: 0.75rem; border-radius: 8px; margin-bottom: 0.5rem;
-                                border-left: 3px solid #10AC84;">
-                        <div style="display: flex; align-items: center; gap: 0.5rem;">
-                            <i class="fas fa-check-circle" style="color: #10AC84;"></i>
-                            <div style="flex: 1;">
-                                <div style="font-weight: 700; color: #1E3A5F; font-size: 0.95rem;">{name}</div>
-                                <div style="font-size: 0.8rem; color: #666;">{desc}</div>
-                            </div>
-                            <span style="background: #10AC84; color: white; padding: 0.25rem 0.5rem; border-radius: 12px; font-size: 0.7rem; font-weight: 600;">Actif</span>
-                        </div>
-                    </div>
-                    """,
-                        unsafe_allow_html=True,
-                    )
+            # Toutes les cards en un seul delta Streamlit
+            st.markdown(
+                "".join(_available_card_html(key) for key in available_keys),
+                unsafe_allow_html=True,
+            )
 
     # Afficher les classificateurs indisponibles
-    if error_modules:
-        error_count = len(
-            [k for k in error_modules.keys() if k in classificateurs_info]
-        )
-        if error_count > 0:
-            with st.expander(
-                f"Classificateurs Indisponibles ({error_count})", expanded=False
-            ):
-                for module_key, error_msg in error_modules.items():
-                    if module_key in classificateurs_info:
-                        name, desc, essential = classificateurs_info[module_key]
-                        error_color = "#EE5A6F" if essential else "#F79F1F"
-
-                        st.markdown(
-                            f"""
-                        <div style="background: linear-gradient(135deg, {error_color}15 0%, {error_color}08 100%);
-                                    padding: 0.75rem; border-radius: 8px; margin-bottom: 0.5rem;
-                                    border-left: 3px solid {error_color};">
-                            <div style="display: flex; align-items: flex-start; gap: 0.5rem;">
-                                <i class="fas fa-times-circle" style="color: {error_color}; margin-top: 0.2rem;"></i>
-                                <div style="flex: 1;">
-                                    <div style="font-weight: 700; color: #1E3A5F; font-size: 0.95rem;">{name}</div>
-                                    <div style="font-size: 0.8rem; color: #666; margin-top: 0.25rem;">{desc}</div>
-                                    <div style="font-size: 0.75rem; color: {error_color}; margin-top: 0.5rem; font-weight: 600;">
-                                        <i class="fas fa-exclamation-circle"></i> {error_msg[:80]}{'...' if len(error_msg) > 80 else ''}
-                                    </div>
-                                </div>
-                                <span style="background: {error_color}; color: white; padding: 0.25rem 0.5rem; border-radius: 12px; font-size: 0.7rem; font-weight: 600;">{'Critique' if essential else 'Optionnel'}</span>
-                            </div>
-                        </div>
-                        """,
-                            unsafe_allow_html=True,
-                        )
+    error_keys = _classifier_keys_in(error_modules)
+    if error_keys:
+        with st.expander(
+            f"Classificateurs Indisponibles ({len(error_keys)})", expanded=False
+        ):
+            html_parts = []
+            for module_key in error_keys:
+                name, desc, essential = _CLASSIFICATEURS_INFO[module_key]
+                html_parts.append(
+                    _classifier_error_card_html(
+                        name, desc, error_modules[module_key], essential
+                    )
+                )
+            st.markdown("".join(html_parts), unsafe_allow_html=True)
 
     # ONGLET MODÈLES OLLAMA
     try:
-        check_ollama = modules.get("check_ollama_availability")
-        list_models = modules.get("list_available_models")
-
-        if check_ollama:
+        if "check_ollama_availability" in available_modules:
             try:
-                ollama_available = check_ollama()
+                ollama_available = _cached_ollama_available()
                 if ollama_available:
-                    st.markdown(
-                        """
-                    <div style="background: linear-gradient(135deg, rgba(16, 172, 132, 0.15) 0%, rgba(16, 172, 132, 0.08) 100%);
-                                padding: 0.75rem 1rem; border-radius: 10px; margin-bottom: 1rem;
-                                border-left: 4px solid #10AC84;">
-                        <strong style="color: #10AC84;"><i class="fas fa-check-circle"></i> Ollama actif</strong>
-                        <span style="color: #666;"> | Service LLM opérationnel</span>
-                    </div>
-                    """,
-                        unsafe_allow_html=True,
-                    )
+                    st.markdown(_OLLAMA_ACTIVE_HTML, unsafe_allow_html=True)
 
-                    if list_models:
-                        models = list_models()
+                    if "list_available_models" in available_modules:
+                        models = _cached_ollama_models()
                         if models:
                             with st.expander(
                                 f"Modèles LLM Disponibles ({len(models)})",
                                 expanded=False,
                             ):
-                                for idx, model in enumerate(models):
-                                    status = "Recommandé" if idx == 0 else "Disponible"
-                                    st.markdown(
-                                        f"""
-                                    <div style="background: #F8F9FA; padding: 0.75rem; border-radius: 8px;
-                                                margin-bottom: 0.5rem; border-left: 3px solid #2E86DE;">
-                                        <div style="font-weight: 700; color: #1E3A5F;">{model}</div>
-                                        <div style="font-size: 0.75rem; color: #10AC84; font-weight: 600;">
-                                            {status}
-                                        </div>
-                                    </div>
-                                    """,
-                                        unsafe_allow_html=True,
-                                    )
+                                st.markdown(
+                                    _ollama_models_html(models),
+                                    unsafe_allow_html=True,
+                                )
                 else:
-                    st.markdown(
-                        """
-                    <div style="background: linear-gradient(135deg, rgba(238, 90, 111, 0.15) 0%, rgba(238, 90, 111, 0.08) 100%);
-                                padding: 0.75rem 1rem; border-radius: 10px; margin-bottom: 1rem;
-                                border-left: 4px solid #EE5A6F;">
-                        <strong style="color: #EE5A6F;"><i class="fas fa-exclamation-circle"></i> Ollama inactif</strong>
-                        <div style="font-size: 0.85rem; color: #666; margin-top: 0.5rem;">
-                            Service LLM non disponible
-                        </div>
-                        <div style="margin-top: 0.5rem;">
-                            <i class="fas fa-terminal"></i> <code style="font-size: 0.75rem;">ollama serve</code>
-                        </div>
-                    </div>
-                    """,
-                        unsafe_allow_html=True,
-                    )
+                    st.markdown(_OLLAMA_INACTIVE_HTML, unsafe_allow_html=True)
             except Exception as e:
                 logger.warning(f"Ollama check error: {e}")
                 st.warning(f"Erreur lors de la vérification Ollama: {str(e)[:100]}")
@@ -1745,70 +2004,130 @@ def _render_classifiers_tab():
         logger.warning(f"Ollama check error: {e}")
 
 
+@st.cache_resource(show_spinner=False)
+def _bert_info() -> Optional[Dict[str, Any]]:
+    """
+    Configuration BERT pour l'onglet informations système.
+
+    Utilise BERTClassifier.describe() qui n'instancie pas le modèle (pas de
+    chargement du tokenizer ni des poids); calculé une fois par processus.
+    Retourne None si BERT est indisponible (l'échec n'est journalisé qu'une fois).
+    """
+    bert_classifier = _load_classification_modules()["modules_status"]["modules"].get(
+        "BERTClassifier"
+    )
+    if bert_classifier is None:
+        return None
+    try:
+        return bert_classifier.describe(use_gpu=False)
+    except Exception as e:
+        logger.warning(f"BERT info unavailable: {e}")
+        return None
+
+
+@st.cache_resource(show_spinner=False)
+def _python_env_caption() -> str:
+    """
+    Légende version Python / plateforme de l'onglet informations système.
+
+    L'environnement ne change pas pendant la vie du processus: mis en cache
+    pour ne pas rappeler platform.release() à chaque rerun.
+    """
+    return (
+        f"Version: {sys.version.split()[0]}  \n"
+        f"Plateforme: {platform.system()} {platform.release()}"
+    )
+
+
+# Libellés des modules affichés dans l'onglet informations système
+_MODULE_NAMES = {
+    "TweetCleaner": "✓ Nettoyage de texte",
+    "EnhancedRuleClassifier": "✓ Classification par règles",
+    "BERTClassifier": "✓ BERT (Deep Learning)",
+    "MistralClassifier": "✓ Mistral AI (LLM)",
+    "GeminiClassifier": "✓ Gemini API",
+    "MultiModelOrchestrator": "✓ Orchestrateur",
+}
+
+
+@st.fragment
 def _render_system_info_tab():
     """
     Affiche les informations système de manière simple et moderne.
     """
     try:
-        import sys
-        import platform
-
         # Version Python
         st.markdown("**🐍 Environnement Python**")
-        st.caption(f"Version: {sys.version.split()[0]}")
-        st.caption(f"Plateforme: {platform.system()} {platform.release()}")
+        st.caption(_python_env_caption())
 
         # Modules de classification
         modules = _load_classification_modules()
-        modules_dict = modules.get("modules", {})
+        modules_dict = modules.get("modules_status", {}).get("modules", {})
 
         st.markdown("---")
         st.markdown("**🤖 Modules Chargés**")
 
-        # Afficher statut simple des modules
-        module_names = {
-            "TweetCleaner": "✓ Nettoyage de texte",
-            "EnhancedRuleClassifier": "✓ Classification par règles",
-            "BERTClassifier": "✓ BERT (Deep Learning)",
-            "MistralClassifier": "✓ Mistral AI (LLM)",
-            "GeminiClassifier": "✓ Gemini API",
-            "MultiModelOrchestrator": "✓ Orchestrateur",
-        }
-
-        available_count = 0
-        for key, label in module_names.items():
-            if key in modules_dict:
-                st.caption(label)
-                available_count += 1
-            else:
-                st.caption(label.replace("✓", "✗"))
+        # Afficher statut simple des modules (une seule légende)
+        available_count = len(modules_dict.keys() & _MODULE_NAMES.keys())
+        st.caption(
+            "  \n".join(
+                label if key in modules_dict else label.replace("✓", "✗")
+                for key, label in _MODULE_NAMES.items()
+            )
+        )
 
         st.markdown("---")
-        st.caption(f"📊 {available_count}/{len(module_names)} modules disponibles")
+        st.caption(f"📊 {available_count}/{len(_MODULE_NAMES)} modules disponibles")
 
         # Info BERT si disponible
-        if "BERTClassifier" in modules_dict:
-            try:
-                BERTClassifier = modules_dict["BERTClassifier"]
-                bert = BERTClassifier(use_gpu=False)
-                info = bert.get_model_info()
-
-                st.markdown("---")
-                st.markdown("**🧠 Configuration BERT**")
-                st.caption(f"Device: {info['device'].upper()}")
-                st.caption(f"Batch size: {info['batch_size']}")
-            except:
-                pass
+        info = _bert_info() if "BERTClassifier" in modules_dict else None
+        if info is not None:
+            st.markdown("---")
+            st.markdown("**🧠 Configuration BERT**")
+            st.caption(
+                f"Device: {info['device'].upper()}  \nBatch size: {info['batch_size']}"
+            )
 
     except Exception as e:
         st.error(f"Erreur: {str(e)[:80]}")
 
 
+# Permissions clés affichées pour le rôle sélectionné: (permission, libellé)
+_KEY_PERMS = (
+    ("export_data", "Exporter Données"),
+    ("view_all_stats", "Voir Toutes Stats"),
+    ("access_advanced_analytics", "Analytics Avancées"),
+    ("create_reports", "Créer Rapports"),
+)
+
+# Card du rôle sélectionné, remplie avec les champs de RoleConfiguration
+_ROLE_CARD_TMPL = """
+<div style="background: {color}22; padding: 1rem; border-radius: 8px;
+            border-left: 4px solid {color};">
+    <div style="font-weight: 700; color: {color};">
+        <i class="fas {icon}"></i> {display_name}
+    </div>
+    <p style="font-size: 0.85rem; color: #666; margin-top: 0.5rem;">
+        {description}
+    </p>
+</div>
+"""
+
+# Icône d'une permission indexée par sa présence dans le rôle
+_PERM_ICONS = {
+    True: "<i class='fas fa-check' style='color:#10AC84;'></i>",
+    False: "<i class='fas fa-times' style='color:#95A5A6;'></i>",
+}
+
+
+@st.fragment
 def _render_role_management_tab():
     """
     Affiche la gestion des rôles utilisateurs (version simplifiée).
 
     Permet de changer de rôle et affiche les permissions associées.
+    Exécutée comme fragment: seul un changement effectif de rôle (lu par
+    l'export de la page principale) déclenche un rerun complet.
     """
     role_system = _load_role_system()
 
@@ -1819,71 +2138,54 @@ def _render_role_management_tab():
     st.markdown("**👥 Rôle Utilisateur**")
 
     try:
-        initialize_role_system = role_system["initialize_role_system"]
         get_current_role = role_system["get_current_role"]
 
-        role_manager, role_ui_manager = initialize_role_system()
-        roles = role_manager.get_all_roles()
-        role_options = {role.display_name: role.role_id for role in roles}
+        role_manager, role_ui_manager = role_system["initialize_role_system"]()
+
+        # Les rôles sont fixes pour un RoleManager: tables construites une fois par session
+        if "_role_options" not in st.session_state:
+            roles = role_manager.get_all_roles()
+            st.session_state["_role_options"] = {
+                role.display_name: role.role_id for role in roles
+            }
+            st.session_state["_role_index"] = {
+                role.role_id: idx for idx, role in enumerate(roles)
+            }
+        role_options = st.session_state["_role_options"]
+        role_index = st.session_state["_role_index"]
 
         current_role = get_current_role()
-        current_display = None
-        if current_role:
-            config = role_manager.get_role_config(current_role)
-            current_display = config.display_name if config else None
 
         selected_display = st.selectbox(
             "Changer de rôle:",
-            options=list(role_options.keys()),
-            index=(
-                list(role_options.values()).index(current_role)
-                if current_role and current_role in role_options.values()
-                else 1
-            ),
+            options=tuple(role_options),
+            index=role_index.get(current_role, 1),
             key="role_selector_sidebar",
         )
 
         selected_role = role_options[selected_display]
-        role_manager.set_current_role(selected_role)
+        if selected_role != current_role:
+            role_manager.set_current_role(selected_role)
+            st.rerun(scope="app")
 
         # Afficher info rôle
         role_config = role_manager.get_role_config(selected_role)
         if role_config:
             st.markdown(
-                f"""
-            <div style="background: {role_config.color}22; padding: 1rem; border-radius: 8px;
-                        border-left: 4px solid {role_config.color};">
-                <div style="font-weight: 700; color: {role_config.color};">
-                    <i class="fas {role_config.icon}"></i> {role_config.display_name}
-                </div>
-                <p style="font-size: 0.85rem; color: #666; margin-top: 0.5rem;">
-                    {role_config.description}
-                </p>
-            </div>
-            """,
-                unsafe_allow_html=True,
+                _ROLE_CARD_TMPL.format_map(vars(role_config)), unsafe_allow_html=True
             )
 
             # Permissions clés
             st.markdown("**Permissions:**")
-            key_perms = {
-                "export_data": "Exporter Données",
-                "view_all_stats": "Voir Toutes Stats",
-                "access_advanced_analytics": "Analytics Avancées",
-                "create_reports": "Créer Rapports",
-            }
-
-            for perm_key, perm_label in key_perms.items():
-                has_perm = (
-                    perm_key in role_config.permissions
-                    or "all" in role_config.permissions
-                )
-                icon = (
-                    "<i class='fas fa-check' style='color:#10AC84;'></i>"
-                    if has_perm
-                    else "<i class='fas fa-times' style='color:#95A5A6;'></i>"
-                )
-                st.markdown(f"{icon} {perm_label}", unsafe_allow_html=True)
+            all_perms = "all" in role_config.permissions
+            st.markdown(
+                "<br>".join(
+                    f"{_PERM_ICONS[all_perms or perm_key in role_config.permissions]}"
+                    f" {perm_label}"
+                    for perm_key, perm_label in _KEY_PERMS
+                ),
+                unsafe_allow_html=True,
+            )
 
             st.caption(
                 f"<i class='fas fa-th'></i> {len(role_config.features)} features disponibles",
@@ -1899,152 +2201,291 @@ def _render_role_management_tab():
 # ==============================================================================
 
 
-def _section_upload():
-    """Section upload avec design moderne et gestion complète des erreurs"""
-    # Header moderne avec gradient
-    st.markdown(
-        """
-    <div style="
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 16px;
-        margin-bottom: 2rem;
-        box-shadow: 0 8px 32px rgba(102, 126, 234, 0.25);
-        position: relative;
-        overflow: hidden;
-    ">
-        <div style="position: absolute; top: 0; right: 0; width: 200px; height: 200px; 
-                    background: radial-gradient(circle, rgba(255,255,255,0.1) 0%, transparent 70%);
-                    border-radius: 50%; transform: translate(50px, -50px);"></div>
-        <div style="position: relative; z-index: 1;">
-            <h2 style="color: white; font-size: 1.75rem; font-weight: 800; margin: 0 0 0.5rem 0; 
-                       display: flex; align-items: center; gap: 0.75rem;">
-                <i class="fas fa-cloud-upload-alt" style="font-size: 1.5rem;"></i>
-                Étape 1 | Upload et Nettoyage des Données
-            </h2>
-            <p style="color: rgba(255,255,255,0.9); font-size: 0.9375rem; margin: 0; font-weight: 400;">
-                Importez vos données CSV pour commencer l'analyse automatique
-            </p>
-        </div>
+# Gabarits HTML statiques de la section upload
+_UPLOAD_HEADER_HTML = """
+<div style="
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    padding: 2rem;
+    border-radius: 16px;
+    margin-bottom: 2rem;
+    box-shadow: 0 8px 32px rgba(102, 126, 234, 0.25);
+    position: relative;
+    overflow: hidden;
+">
+    <div style="position: absolute; top: 0; right: 0; width: 200px; height: 200px; 
+                background: radial-gradient(circle, rgba(255,255,255,0.1) 0%, transparent 70%);
+                border-radius: 50%; transform: translate(50px, -50px);"></div>
+    <div style="position: relative; z-index: 1;">
+        <h2 style="color: white; font-size: 1.75rem; font-weight: 800; margin: 0 0 0.5rem 0; 
+                   display: flex; align-items: center; gap: 0.75rem;">
+            <i class="fas fa-cloud-upload-alt" style="font-size: 1.5rem;"></i>
+            Étape 1 | Upload et Nettoyage des Données
+        </h2>
+        <p style="color: rgba(255,255,255,0.9); font-size: 0.9375rem; margin: 0; font-weight: 400;">
+            Importez vos données CSV pour commencer l'analyse automatique
+        </p>
     </div>
-    """,
-        unsafe_allow_html=True,
-    )
+</div>
+"""
 
-    # Instructions modernes avec design card
-    with st.expander("📋 Instructions d'Utilisation", expanded=False):
-        st.markdown(
-            """
-        <div style="background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-                    padding: 1.5rem; border-radius: 12px; margin-bottom: 1rem;">
-            <h4 style="color: #1E293B; font-weight: 700; margin-bottom: 1rem; 
-                      display: flex; align-items: center; gap: 0.5rem;">
-                <i class="fas fa-file-csv" style="color: #667eea;"></i>
-                Préparation des données
-            </h4>
-            <div style="display: grid; gap: 0.75rem;">
-                <div style="display: flex; align-items: start; gap: 0.75rem;">
-                    <div style="width: 24px; height: 24px; background: #667eea; border-radius: 6px; 
-                               display: flex; align-items: center; justify-content: center; flex-shrink: 0;">
-                        <span style="color: white; font-weight: 700; font-size: 0.75rem;">1</span>
-                    </div>
-                    <div>
-                        <strong style="color: #1E293B;">Format requis:</strong> Fichier CSV
-                    </div>
-                </div>
-                <div style="display: flex; align-items: start; gap: 0.75rem;">
-                    <div style="width: 24px; height: 24px; background: #667eea; border-radius: 6px; 
-                               display: flex; align-items: center; justify-content: center; flex-shrink: 0;">
-                        <span style="color: white; font-weight: 700; font-size: 0.75rem;">2</span>
-                    </div>
-                    <div>
-                        <strong style="color: #1E293B;">Contenu:</strong> Au moins une colonne de texte contenant les tweets à analyser
-                    </div>
-                </div>
-                <div style="display: flex; align-items: start; gap: 0.75rem;">
-                    <div style="width: 24px; height: 24px; background: #667eea; border-radius: 6px; 
-                               display: flex; align-items: center; justify-content: center; flex-shrink: 0;">
-                        <span style="color: white; font-weight: 700; font-size: 0.75rem;">3</span>
-                    </div>
-                    <div>
-                        <strong style="color: #1E293B;">Taille maximale:</strong> 500 MB (limite augmentée pour éviter les erreurs d'accès)
-                    </div>
-                </div>
-                <div style="display: flex; align-items: start; gap: 0.75rem;">
-                    <div style="width: 24px; height: 24px; background: #667eea; border-radius: 6px; 
-                               display: flex; align-items: center; justify-content: center; flex-shrink: 0;">
-                        <span style="color: white; font-weight: 700; font-size: 0.75rem;">4</span>
-                    </div>
-                    <div>
-                        <strong style="color: #1E293B;">Encodage:</strong> UTF-8 recommandé (détection automatique de 6 encodages supportés)
-                    </div>
-                </div>
+_UPLOAD_INSTRUCTIONS_HTML = """
+<div style="background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+            padding: 1.5rem; border-radius: 12px; margin-bottom: 1rem;">
+    <h4 style="color: #1E293B; font-weight: 700; margin-bottom: 1rem; 
+              display: flex; align-items: center; gap: 0.5rem;">
+        <i class="fas fa-file-csv" style="color: #667eea;"></i>
+        Préparation des données
+    </h4>
+    <div style="display: grid; gap: 0.75rem;">
+        <div style="display: flex; align-items: start; gap: 0.75rem;">
+            <div style="width: 24px; height: 24px; background: #667eea; border-radius: 6px; 
+                       display: flex; align-items: center; justify-content: center; flex-shrink: 0;">
+                <span style="color: white; font-weight: 700; font-size: 0.75rem;">1</span>
+            </div>
+            <div>
+                <strong style="color: #1E293B;">Format requis:</strong> Fichier CSV
             </div>
         </div>
-        """,
-            unsafe_allow_html=True,
-        )
-
-        st.markdown(
-            """
-        <div style="background: linear-gradient(135deg, #fff3cd 0%, #ffe69c 100%);
-                    padding: 1.25rem; border-radius: 12px; border-left: 4px solid #F59E0B;
-                    margin-top: 1rem;">
-            <h4 style="color: #92400E; font-weight: 700; margin-bottom: 0.75rem; 
-                      display: flex; align-items: center; gap: 0.5rem;">
-                <i class="fas fa-exclamation-triangle" style="color: #F59E0B;"></i>
-                En cas d'erreur 403 (Accès Interdit)
-            </h4>
-            <div style="color: #78350F; font-size: 0.875rem; line-height: 1.75;">
-                <div style="margin-bottom: 0.5rem;">
-                    <i class="fas fa-check-circle" style="color: #F59E0B; margin-right: 0.5rem;"></i>
-                    Vérifier que la taille du fichier est inférieure à 500 MB
-                </div>
-                <div style="margin-bottom: 0.5rem;">
-                    <i class="fas fa-sync-alt" style="color: #F59E0B; margin-right: 0.5rem;"></i>
-                    Rafraîchir la page (touche F5)
-                </div>
-                <div style="margin-bottom: 0.5rem;">
-                    <i class="fas fa-file-alt" style="color: #F59E0B; margin-right: 0.5rem;"></i>
-                    Vérifier que le fichier n'est pas en lecture seule
-                </div>
-                <div style="margin-bottom: 0.5rem;">
-                    <i class="fas fa-trash-alt" style="color: #F59E0B; margin-right: 0.5rem;"></i>
-                    Vider le cache du navigateur (Ctrl+Shift+Del)
-                </div>
-                <div style="margin-bottom: 0.5rem;">
-                    <i class="fas fa-shield-alt" style="color: #F59E0B; margin-right: 0.5rem;"></i>
-                    Désactiver temporairement l'anti-virus si nécessaire
-                </div>
-                <div>
-                    <i class="fas fa-redo" style="color: #F59E0B; margin-right: 0.5rem;"></i>
-                    Redémarrer l'application si le problème persiste
-                </div>
+        <div style="display: flex; align-items: start; gap: 0.75rem;">
+            <div style="width: 24px; height: 24px; background: #667eea; border-radius: 6px; 
+                       display: flex; align-items: center; justify-content: center; flex-shrink: 0;">
+                <span style="color: white; font-weight: 700; font-size: 0.75rem;">2</span>
             </div>
-            <div style="margin-top: 1rem; padding-top: 1rem; border-top: 1px solid rgba(245, 158, 11, 0.2);">
-                <code style="background: rgba(0,0,0,0.05); padding: 0.5rem 1rem; border-radius: 6px; 
-                            display: inline-block; color: #78350F; font-size: 0.8125rem;">
-                    streamlit run streamlit_app/app.py --server.port=8503
-                </code>
+            <div>
+                <strong style="color: #1E293B;">Contenu:</strong> Au moins une colonne de texte contenant les tweets à analyser
             </div>
         </div>
-        """,
-            unsafe_allow_html=True,
-        )
+        <div style="display: flex; align-items: start; gap: 0.75rem;">
+            <div style="width: 24px; height: 24px; background: #667eea; border-radius: 6px; 
+                       display: flex; align-items: center; justify-content: center; flex-shrink: 0;">
+                <span style="color: white; font-weight: 700; font-size: 0.75rem;">3</span>
+            </div>
+            <div>
+                <strong style="color: #1E293B;">Taille maximale:</strong> 500 MB (limite augmentée pour éviter les erreurs d'accès)
+            </div>
+        </div>
+        <div style="display: flex; align-items: start; gap: 0.75rem;">
+            <div style="width: 24px; height: 24px; background: #667eea; border-radius: 6px; 
+                       display: flex; align-items: center; justify-content: center; flex-shrink: 0;">
+                <span style="color: white; font-weight: 700; font-size: 0.75rem;">4</span>
+            </div>
+            <div>
+                <strong style="color: #1E293B;">Encodage:</strong> UTF-8 recommandé (détection automatique de l'encodage)
+            </div>
+        </div>
+    </div>
+</div>
+"""
 
-    # Zone d'upload moderne
-    st.markdown(
-        """
-    <div style="margin: 2rem 0 1rem 0;">
-        <h3 style="font-size: 1.25rem; font-weight: 700; color: #1E293B; margin-bottom: 0.5rem;
-                   display: flex; align-items: center; gap: 0.5rem;">
-            <i class="fas fa-folder-open" style="color: #667eea;"></i>
-            Sélection du Fichier
-        </h3>
+_UPLOAD_403_TIPS_HTML = """
+<div style="background: linear-gradient(135deg, #fff3cd 0%, #ffe69c 100%);
+            padding: 1.25rem; border-radius: 12px; border-left: 4px solid #F59E0B;
+            margin-top: 1rem;">
+    <h4 style="color: #92400E; font-weight: 700; margin-bottom: 0.75rem; 
+              display: flex; align-items: center; gap: 0.5rem;">
+        <i class="fas fa-exclamation-triangle" style="color: #F59E0B;"></i>
+        En cas d'erreur 403 (Accès Interdit)
+    </h4>
+    <div style="color: #78350F; font-size: 0.875rem; line-height: 1.75;">
+        <div style="margin-bottom: 0.5rem;">
+            <i class="fas fa-check-circle" style="color: #F59E0B; margin-right: 0.5rem;"></i>
+            Vérifier que la taille du fichier est inférieure à 500 MB
+        </div>
+        <div style="margin-bottom: 0.5rem;">
+            <i class="fas fa-sync-alt" style="color: #F59E0B; margin-right: 0.5rem;"></i>
+            Rafraîchir la page (touche F5)
+        </div>
+        <div style="margin-bottom: 0.5rem;">
+            <i class="fas fa-file-alt" style="color: #F59E0B; margin-right: 0.5rem;"></i>
+            Vérifier que le fichier n'est pas en lecture seule
+        </div>
+        <div style="margin-bottom: 0.5rem;">
+            <i class="fas fa-trash-alt" style="color: #F59E0B; margin-right: 0.5rem;"></i>
+            Vider le cache du navigateur (Ctrl+Shift+Del)
+        </div>
+        <div style="margin-bottom: 0.5rem;">
+            <i class="fas fa-shield-alt" style="color: #F59E0B; margin-right: 0.5rem;"></i>
+            Désactiver temporairement l'anti-virus si nécessaire
+        </div>
+        <div>
+            <i class="fas fa-redo" style="color: #F59E0B; margin-right: 0.5rem;"></i>
+            Redémarrer l'application si le problème persiste
+        </div>
     </div>
-    """,
-        unsafe_allow_html=True,
-    )
+    <div style="margin-top: 1rem; padding-top: 1rem; border-top: 1px solid rgba(245, 158, 11, 0.2);">
+        <code style="background: rgba(0,0,0,0.05); padding: 0.5rem 1rem; border-radius: 6px; 
+                    display: inline-block; color: #78350F; font-size: 0.8125rem;">
+            streamlit run streamlit_app/app.py --server.port=8503
+        </code>
+    </div>
+</div>
+"""
+
+_UPLOAD_FILE_SECTION_HTML = """
+<div style="margin: 2rem 0 1rem 0;">
+    <h3 style="font-size: 1.25rem; font-weight: 700; color: #1E293B; margin-bottom: 0.5rem;
+               display: flex; align-items: center; gap: 0.5rem;">
+        <i class="fas fa-folder-open" style="color: #667eea;"></i>
+        Sélection du Fichier
+    </h3>
+</div>
+"""
+
+_UPLOADER_403_HTML = """
+<div style="background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%);
+            padding: 1.5rem; border-radius: 12px; border-left: 4px solid #EF4444;
+            margin: 1rem 0; box-shadow: 0 4px 12px rgba(239, 68, 68, 0.15);">
+    <h4 style="color: #991B1B; font-weight: 700; margin-bottom: 1rem;
+               display: flex; align-items: center; gap: 0.5rem;">
+        <i class="fas fa-ban" style="color: #EF4444; font-size: 1.25rem;"></i>
+        Erreur 403 - Accès Interdit
+    </h4>
+    <p style="color: #7F1D1D; margin-bottom: 1rem; line-height: 1.6;">
+        Cette erreur indique un problème de permissions. Solutions recommandées:
+    </p>
+    <div style="display: grid; gap: 0.5rem; color: #7F1D1D;">
+        <div style="display: flex; align-items: center; gap: 0.5rem;">
+            <i class="fas fa-weight" style="color: #EF4444;"></i>
+            Vérifier que la taille du fichier est inférieure à 500 MB
+        </div>
+        <div style="display: flex; align-items: center; gap: 0.5rem;">
+            <i class="fas fa-sync" style="color: #EF4444;"></i>
+            Rafraîchir la page (F5)
+        </div>
+        <div style="display: flex; align-items: center; gap: 0.5rem;">
+            <i class="fas fa-trash" style="color: #EF4444;"></i>
+            Vider le cache du navigateur
+        </div>
+        <div style="display: flex; align-items: center; gap: 0.5rem;">
+            <i class="fas fa-redo" style="color: #EF4444;"></i>
+            Redémarrer Streamlit
+        </div>
+    </div>
+</div>
+"""
+
+_UPLOADER_ERROR_TMPL = """
+<div style="background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%);
+            padding: 1.5rem; border-radius: 12px; border-left: 4px solid #EF4444;
+            margin: 1rem 0; box-shadow: 0 4px 12px rgba(239, 68, 68, 0.15);">
+    <h4 style="color: #991B1B; font-weight: 700; margin-bottom: 0.5rem;
+               display: flex; align-items: center; gap: 0.5rem;">
+        <i class="fas fa-exclamation-circle" style="color: #EF4444;"></i>
+        Erreur lors du chargement
+    </h4>
+    <p style="color: #7F1D1D; margin: 0;">{message}</p>
+</div>
+"""
+
+_FILE_TOO_LARGE_TMPL = """
+<div style="background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%);
+            padding: 1.25rem; border-radius: 12px; border-left: 4px solid #EF4444;
+            margin: 1rem 0; box-shadow: 0 4px 12px rgba(239, 68, 68, 0.15);">
+    <div style="display: flex; align-items: center; gap: 0.75rem; margin-bottom: 0.5rem;">
+        <i class="fas fa-exclamation-triangle" style="color: #EF4444; font-size: 1.25rem;"></i>
+        <h4 style="color: #991B1B; font-weight: 700; margin: 0;">Fichier trop volumineux</h4>
+    </div>
+    <p style="color: #7F1D1D; margin: 0 0 0.75rem 0;">
+        Taille actuelle: <strong>{size:.1f} MB</strong> | Maximum autorisé: <strong>500 MB</strong>
+    </p>
+    <p style="color: #7F1D1D; margin: 0; font-size: 0.875rem;">
+        <i class="fas fa-lightbulb" style="color: #F59E0B; margin-right: 0.375rem;"></i>
+        Réduisez la taille du fichier ou filtrez les données avant l'upload
+    </p>
+</div>
+"""
+
+_FILE_ACCEPTED_TMPL = """
+<div style="background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);
+            padding: 1.25rem; border-radius: 12px; border-left: 4px solid #10B981;
+            margin: 1rem 0; box-shadow: 0 4px 12px rgba(16, 185, 129, 0.15);
+            display: flex; align-items: center; gap: 1rem;">
+    <div style="width: 48px; height: 48px; background: linear-gradient(135deg, #10B981 0%, #059669 100%);
+               border-radius: 12px; display: flex; align-items: center; justify-content: center;
+               box-shadow: 0 4px 12px rgba(16, 185, 129, 0.3); flex-shrink: 0;">
+        <i class="fas fa-check-circle" style="color: white; font-size: 1.5rem;"></i>
+    </div>
+    <div style="flex: 1;">
+        <div style="font-weight: 700; color: #065F46; font-size: 1rem; margin-bottom: 0.25rem;">
+            Fichier accepté avec succès
+        </div>
+        <div style="color: #047857; font-size: 0.875rem;">
+            <i class="fas fa-file-csv" style="margin-right: 0.375rem;"></i>
+            <strong>{name}</strong> • {size:.1f} MB
+        </div>
+    </div>
+</div>
+"""
+
+_UPLOAD_403_HELP_TMPL = """
+<h4><i class='fas fa-ban'></i> Erreur 403 - Accès Interdit Détecté</h4>
+
+<strong><i class='fas fa-tools'></i> Solutions recommandées par ordre de priorité:</strong>
+
+1. <strong><i class='fas fa-sync-alt'></i> Rafraîchir la page</strong>
+   - Appuyez sur F5
+   - Ou cliquez sur l'icône de rafraîchissement du navigateur
+
+2. <strong><i class='fas fa-weight'></i> Vérifier la taille du fichier</strong>
+   - Limite: 500 MB maximum
+   - Votre fichier: {size:.1f} MB
+
+3. <strong><i class='fas fa-trash-alt'></i> Vider le cache du navigateur</strong>
+   - Chrome: Ctrl+Shift+Del
+   - Sélectionner "Images et fichiers en cache"
+   - Cliquer "Effacer les données"
+
+4. <strong><i class='fas fa-lock-open'></i> Vérifier les permissions du fichier</strong>
+   - Le fichier ne doit pas être en lecture seule
+   - Propriétés → Décocher "Lecture seule"
+
+5. <strong><i class='fas fa-shield-alt'></i> Désactiver temporairement l'anti-virus</strong>
+   - Certains anti-virus bloquent les uploads
+   - Réessayer après désactivation
+
+6. <strong><i class='fas fa-redo'></i> Redémarrer l'application</strong>
+   ```
+   taskkill /F /IM python.exe
+   streamlit run streamlit_app/app.py --server.port=8502
+   ```
+
+<strong><i class='fas fa-book'></i> Documentation complète:</strong> Voir le guide d'utilisation
+"""
+
+
+def _on_upload_change():
+    """
+    Callback du file uploader: libère le fichier précédent.
+
+    Appelé une seule fois quand le fichier change (nouveau fichier ou
+    suppression), avant le rerun. Les reruns suivants réutilisent le
+    DataFrame en session sans relire le CSV (voir _handle_upload_robust);
+    un réupload du même fichier (même empreinte) le conserve aussi.
+    """
+    new_file = st.session_state.get("csv_upload")
+    previous_id = st.session_state.get("last_file_id")
+    if new_file is not None and previous_id == _upload_fingerprint(new_file):
+        return
+    st.session_state.pop("last_file_id", None)
+    st.session_state.pop("df_original", None)
+    if previous_id is not None:
+        st.session_state.pop(f"enc_{previous_id}", None)
+    gc.collect()
+
+
+def _section_upload():
+    """Section upload avec design moderne et gestion complète des erreurs"""
+    # Header moderne avec gradient
+    st.markdown(_UPLOAD_HEADER_HTML, unsafe_allow_html=True)
+
+    # Instructions modernes avec design card
+    with st.expander("📋 Instructions d'Utilisation", expanded=False):
+        st.markdown(_UPLOAD_INSTRUCTIONS_HTML, unsafe_allow_html=True)
+
+        st.markdown(_UPLOAD_403_TIPS_HTML, unsafe_allow_html=True)
+
+    # Zone d'upload moderne
+    st.markdown(_UPLOAD_FILE_SECTION_HTML, unsafe_allow_html=True)
 
     _render_remote_importer()
 
@@ -2055,61 +2496,17 @@ def _section_upload():
             type=["csv"],
             help="Glissez-déposez ou cliquez pour parcourir. Max: 500 MB",
             label_visibility="collapsed",
+            key="csv_upload",
+            on_change=_on_upload_change,
         )
     except Exception as e:
         logger.error(f"File uploader error: {e}", exc_info=True)
 
         if "403" in str(e) or "Forbidden" in str(e):
-            st.markdown(
-                """
-            <div style="background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%);
-                        padding: 1.5rem; border-radius: 12px; border-left: 4px solid #EF4444;
-                        margin: 1rem 0; box-shadow: 0 4px 12px rgba(239, 68, 68, 0.15);">
-                <h4 style="color: #991B1B; font-weight: 700; margin-bottom: 1rem;
-                           display: flex; align-items: center; gap: 0.5rem;">
-                    <i class="fas fa-ban" style="color: #EF4444; font-size: 1.25rem;"></i>
-                    Erreur 403 - Accès Interdit
-                </h4>
-                <p style="color: #7F1D1D; margin-bottom: 1rem; line-height: 1.6;">
-                    Cette erreur indique un problème de permissions. Solutions recommandées:
-                </p>
-                <div style="display: grid; gap: 0.5rem; color: #7F1D1D;">
-                    <div style="display: flex; align-items: center; gap: 0.5rem;">
-                        <i class="fas fa-weight" style="color: #EF4444;"></i>
-                        Vérifier que la taille du fichier est inférieure à 500 MB
-                    </div>
-                    <div style="display: flex; align-items: center; gap: 0.5rem;">
-                        <i class="fas fa-sync" style="color: #EF4444;"></i>
-                        Rafraîchir la page (F5)
-                    </div>
-                    <div style="display: flex; align-items: center; gap: 0.5rem;">
-                        <i class="fas fa-trash" style="color: #EF4444;"></i>
-                        Vider le cache du navigateur
-                    </div>
-                    <div style="display: flex; align-items: center; gap: 0.5rem;">
-                        <i class="fas fa-redo" style="color: #EF4444;"></i>
-                        Redémarrer Streamlit
-                    </div>
-                </div>
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
+            st.markdown(_UPLOADER_403_HTML, unsafe_allow_html=True)
         else:
             st.markdown(
-                f"""
-            <div style="background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%);
-                        padding: 1.5rem; border-radius: 12px; border-left: 4px solid #EF4444;
-                        margin: 1rem 0; box-shadow: 0 4px 12px rgba(239, 68, 68, 0.15);">
-                <h4 style="color: #991B1B; font-weight: 700; margin-bottom: 0.5rem;
-                           display: flex; align-items: center; gap: 0.5rem;">
-                    <i class="fas fa-exclamation-circle" style="color: #EF4444;"></i>
-                    Erreur lors du chargement
-                </h4>
-                <p style="color: #7F1D1D; margin: 0;">{str(e)}</p>
-            </div>
-            """,
-                unsafe_allow_html=True,
+                _UPLOADER_ERROR_TMPL.format(message=str(e)), unsafe_allow_html=True
             )
         return
 
@@ -2117,46 +2514,75 @@ def _section_upload():
         _handle_upload_robust(uploaded_file)
 
 
+# Bandeau de statut de l'import distant, indexé par type de statut
+_REMOTE_STATUS_STYLES = {
+    "success": {
+        "color": "#d1fae5",
+        "border": "#10B981",
+        "icon": "fa-cloud-arrow-down",
+        "title": "Import distant réussi",
+    },
+    "error": {
+        "color": "#fee2e2",
+        "border": "#EF4444",
+        "icon": "fa-triangle-exclamation",
+        "title": "Import distant échoué",
+    },
+}
+
+_REMOTE_STATUS_TMPL = Template(
+    """
+<div style="background:$color;border-left:4px solid $border;border-radius:12px;
+            padding:1rem 1.25rem;margin:0.5rem 0 1.25rem 0;">
+    <div style="display:flex;align-items:center;gap:0.5rem;color:$border;font-weight:600;">
+        <i class="fas $icon"></i> $title
+    </div>
+    <div style="color:#1F2937;font-size:0.9rem;margin-top:0.35rem;">
+        $message
+    </div>
+    $detail
+</div>
+"""
+)
+
+_REMOTE_STATUS_DETAIL_TMPL = Template(
+    """
+<div style="color:#065F46;font-size:0.9rem;margin-top:0.5rem;">
+    <strong>$filename</strong> • $size
+    <div style="font-size:0.8rem;color:#047857;">Stocké: $saved_path</div>
+</div>
+"""
+)
+
+
+def _remote_status_html(status: Dict[str, Any]) -> str:
+    """
+    Bandeau HTML du dernier import distant.
+
+    Args:
+        status: Statut en session ("type", "message" et "details" si succès)
+    """
+    kind = status.get("type")
+    detail = ""
+    if kind == "success":
+        meta = status.get("details", {})
+        detail = _REMOTE_STATUS_DETAIL_TMPL.safe_substitute(
+            filename=meta.get("filename", ""),
+            size=meta.get("size", "--"),
+            saved_path=meta.get("saved_path", ""),
+        )
+    return _REMOTE_STATUS_TMPL.safe_substitute(
+        _REMOTE_STATUS_STYLES.get(kind, _REMOTE_STATUS_STYLES["error"]),
+        message=status.get("message", ""),
+        detail=detail,
+    )
+
+
 def _render_remote_importer():
     """Interface moderne pour importer un CSV via API/URL sécurisée."""
     status = st.session_state.get("remote_import_status")
     if status:
-        color = "#d1fae5" if status.get("type") == "success" else "#fee2e2"
-        border = "#10B981" if status.get("type") == "success" else "#EF4444"
-        icon = (
-            "fa-cloud-arrow-down"
-            if status.get("type") == "success"
-            else "fa-triangle-exclamation"
-        )
-        title = (
-            "Import distant réussi"
-            if status.get("type") == "success"
-            else "Import distant échoué"
-        )
-        detail = ""
-        if status.get("type") == "success":
-            meta = status.get("details", {})
-            detail = f"""
-            <div style="color:#065F46;font-size:0.9rem;margin-top:0.5rem;">
-                <strong>{meta.get('filename','')}</strong> • {meta.get('size','--')}
-                <div style="font-size:0.8rem;color:#047857;">Stocké: {meta.get('saved_path','')}</div>
-            </div>
-            """
-        st.markdown(
-            f"""
-        <div style="background:{color};border-left:4px solid {border};border-radius:12px;
-                    padding:1rem 1.25rem;margin:0.5rem 0 1.25rem 0;">
-            <div style="display:flex;align-items:center;gap:0.5rem;color:{border};font-weight:600;">
-                <i class="fas {icon}"></i> {title}
-            </div>
-            <div style="color:#1F2937;font-size:0.9rem;margin-top:0.35rem;">
-                {status.get('message','')}
-            </div>
-            {detail}
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
+        st.markdown(_remote_status_html(status), unsafe_allow_html=True)
 
     with st.expander("Importer via une API / un lien sécurisé", expanded=False):
         remote_url = st.text_input(
@@ -2187,83 +2613,414 @@ def _render_remote_importer():
             key="remote_import_header",
         )
 
-        payload = ""
-        if method == "POST":
-            payload = st.text_area(
-                "Payload JSON (optionnel)",
-                key="remote_import_payload",
-                placeholder='{"filter": "last_30_days"}',
-                height=110,
-            )
+        payload = ""
+        if method == "POST":
+            payload = st.text_area(
+                "Payload JSON (optionnel)",
+                key="remote_import_payload",
+                placeholder='{"filter": "last_30_days"}',
+                height=110,
+            )
+
+        max_size = st.slider(
+            "Taille maximale autorisée (MB)",
+            min_value=50,
+            max_value=500,
+            value=200,
+            step=10,
+            key="remote_import_size",
+        )
+
+        fetching = st.session_state.get("remote_import_loading", False)
+        fetch_btn = st.button(
+            "Importer via l'API",
+            type="primary",
+            use_container_width=True,
+            disabled=fetching,
+        )
+
+        if fetch_btn:
+            if not remote_url:
+                st.warning("Merci de renseigner un lien valide.")
+                return
+
+            st.session_state["remote_import_loading"] = True
+            headers = {}
+            if token:
+                header_key = (header_name or "Authorization").strip() or "Authorization"
+                header_value = token.strip()
+                if (
+                    header_key.lower() == "authorization"
+                    and header_value
+                    and not header_value.lower().startswith("bearer")
+                ):
+                    header_value = f"Bearer {header_value}"
+                headers[header_key] = header_value
+
+            try:
+                with st.spinner("Connexion à la source distante..."):
+                    dataset = fetch_remote_dataset(
+                        url=remote_url,
+                        method=method,
+                        headers=headers if headers else None,
+                        payload=payload if payload else None,
+                        timeout=timeout,
+                        max_size_mb=max_size,
+                        dest_dir=REMOTE_UPLOAD_DIR,
+                    )
+
+                st.session_state["remote_import_status"] = {
+                    "type": "success",
+                    "message": "Dataset importé depuis la source distante.",
+                    "details": {
+                        "filename": dataset.get("filename", "remote_dataset.csv"),
+                        "size": format_file_size(dataset.get("size", 0)),
+                    },
+                }
+                saved_path = persist_remote_dataset(dataset, base_dir=REMOTE_UPLOAD_DIR)
+                st.session_state["remote_import_status"]["details"]["saved_path"] = str(
+                    saved_path
+                )
+                with dataset["uploaded_file"] as remote_file:
+                    _handle_upload_robust(remote_file)
+            except Exception as exc:
+                message = str(exc)
+                st.session_state["remote_import_status"] = {
+                    "type": "error",
+                    "message": message,
+                }
+                st.error(f"Impossible de récupérer le fichier distant: {message}")
+            finally:
+                st.session_state["remote_import_loading"] = False
+
+
+# Séparateurs reconnus par le sniffer (les exports Excel FR utilisent ";")
+_CSV_DELIMITERS = ",;\t|"
+
+
+def _sniff_delimiter(uploaded_file, encoding: str) -> str:
+    """
+    Détecte le séparateur du CSV sur l'échantillon de 64 Ko.
+
+    Retourne "," (défaut de pandas) si csv.Sniffer ne conclut pas, ou si le
+    séparateur trouvé est absent de la ligne d'en-tête: c'est alors un
+    caractère du texte d'une colonne unique (ex: "bonjour; ma box").
+    """
+    sample = _head_bytes(uploaded_file, 65536).decode(encoding, errors="replace")
+    try:
+        delimiter = csv.Sniffer().sniff(sample, delimiters=_CSV_DELIMITERS).delimiter
+    except csv.Error:
+        return ","
+    header = sample.split("\n", 1)[0]
+    return delimiter if delimiter in header else ","
+
+
+def _read_csv(uploaded_file, encoding: str) -> pd.DataFrame:
+    """
+    Lit un CSV uploadé en un seul appel à pd.read_csv.
+
+    Le séparateur est détecté sur l'échantillon; un fichier bien formé est lu
+    en mode strict, les lignes malformées ne sont ignorées qu'en second essai.
+    Les colonnes entières sont ensuite réduites (_downcast).
+
+    Raises:
+        UnicodeDecodeError: Si l'encodage ne convient pas
+    """
+    sep = _sniff_delimiter(uploaded_file, encoding)
+    try:
+        uploaded_file.seek(0)
+        df = pd.read_csv(uploaded_file, encoding=encoding, sep=sep)
+    except pd.errors.ParserError as e:
+        logger.info(f"CSV malformé ({e}), lecture en ignorant les lignes invalides")
+        uploaded_file.seek(0)
+        df = pd.read_csv(uploaded_file, encoding=encoding, sep=sep, on_bad_lines="skip")
+    return _downcast(df)
+
+
+def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Réduit les colonnes entières au plus petit type qui contient leurs valeurs.
+
+    Les colonnes texte restent en object: la sélection de la colonne à
+    classifier et le nettoyage s'appuient sur ce dtype.
+    """
+    for col in df.select_dtypes(include=["integer"]).columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
+
+
+def _head_bytes(uploaded_file, size: int) -> bytes:
+    """
+    Premiers octets d'un fichier uploadé sans déplacer sa position de lecture.
+
+    Pas de getbuffer(): un UploadedFile Streamlit est un BytesIO qui partage
+    les octets de l'upload, et exporter son tampon le forcerait à copier
+    tout le fichier. read() ne copie que l'échantillon.
+    """
+    position = uploaded_file.tell()
+    uploaded_file.seek(0)
+    sample = uploaded_file.read(size)
+    uploaded_file.seek(position)
+    return sample
+
+
+def _upload_fingerprint(uploaded_file) -> str:
+    """
+    Empreinte d'un fichier uploadé: blake2b du nom et de tout le contenu.
+
+    Sert d'identifiant de fichier: réuploader le même CSV donne la même
+    empreinte et le DataFrame déjà lu en session est réutilisé, alors qu'un
+    fichier modifié (même de nom et de taille identiques) en change.
+    Le hachage complet (moins d'une seconde pour 500 Mo) n'est payé qu'une
+    fois par upload: il est conservé en session sous le file_id Streamlit
+    de l'upload, que les reruns suivants comparent avant de le réutiliser.
+    """
+    upload_id = getattr(uploaded_file, "file_id", None)
+    cached = st.session_state.get("_upload_digest")
+    if upload_id is not None and cached is not None and cached[0] == upload_id:
+        return cached[1]
+
+    # Lecture par blocs de 1 Mo (pas de getbuffer(), cf. _head_bytes)
+    digest = hashlib.blake2b(uploaded_file.name.encode(), digest_size=16)
+    position = uploaded_file.tell()
+    uploaded_file.seek(0)
+    for chunk in iter(lambda: uploaded_file.read(1 << 20), b""):
+        digest.update(chunk)
+    uploaded_file.seek(position)
+    fingerprint = digest.hexdigest()
+
+    if upload_id is not None:
+        st.session_state["_upload_digest"] = (upload_id, fingerprint)
+    return fingerprint
+
+
+def _detect_csv_encoding(uploaded_file, file_id: str) -> str:
+    """
+    Détecte l'encodage d'un CSV uploadé sur un échantillon de 64 Ko.
+
+    Le résultat est conservé en session par file_id: les reruns suivants
+    (changement de colonne, boutons) ne refont pas la détection.
+    Cas courant traité sans chardet: BOM UTF-8 ou échantillon UTF-8 valide.
+    Retourne "utf-8" si chardet est absent ou peu confiant (< 0.5).
+    """
+    cache_key = f"enc_{file_id}"
+    if cache_key in st.session_state:
+        return st.session_state[cache_key]
+
+    sample = _head_bytes(uploaded_file, 65536)
+
+    if sample.startswith(b"\xef\xbb\xbf"):
+        st.session_state[cache_key] = "utf-8-sig"
+        return "utf-8-sig"
+    try:
+        sample.decode("utf-8")
+        utf8_sample = True
+    except UnicodeDecodeError as e:
+        # Un caractère multi-octets coupé en fin d'échantillon reste de l'UTF-8
+        utf8_sample = e.reason == "unexpected end of data"
+    if utf8_sample:
+        st.session_state[cache_key] = "utf-8"
+        return "utf-8"
+
+    encoding = "utf-8"
+    try:
+        import chardet  # type: ignore
+
+        result = chardet.detect(sample)
+        if result and result["encoding"] and result["confidence"] >= 0.5:
+            # Un échantillon ASCII peut précéder des caractères UTF-8 plus loin
+            encoding = "utf-8" if result["encoding"] == "ascii" else result["encoding"]
+            logger.info(
+                f"Encodage détecté par chardet: {encoding} (confiance: {result['confidence']:.2f})"
+            )
+    except ImportError:
+        logger.debug("chardet non disponible, utilisation de utf-8")
+    except Exception as e:
+        logger.warning(f"Erreur détection chardet: {e}")
+
+    st.session_state[cache_key] = encoding
+    return encoding
+
+
+# Statistiques d'aperçu: le file_id identifie le fichier uploadé, le DataFrame
+# (paramètre préfixé par "_") n'est pas haché par Streamlit
+@st.cache_data(show_spinner=False, max_entries=8)
+def _preview_head(file_id: str, _df: pd.DataFrame) -> pd.DataFrame:
+    """10 premières lignes du fichier uploadé."""
+    return _df.head(10)
+
+
+# Taille de l'échantillon utilisé pour estimer la mémoire des colonnes texte
+_MEMORY_SAMPLE_ROWS = 10_000
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _frame_memory_mb(file_id: str, _df: pd.DataFrame) -> float:
+    """
+    Empreinte mémoire estimée du DataFrame uploadé, en MB.
+
+    memory_usage(deep=True) parcourt chaque chaîne Python des colonnes object;
+    ici seul un échantillon de _MEMORY_SAMPLE_ROWS lignes est mesuré en
+    profondeur et le ratio profond/superficiel est extrapolé au reste.
+    """
+    shallow = _df.memory_usage(deep=False).sum()
+    obj_cols = _df.select_dtypes(include=["object"]).columns
+    if len(obj_cols) and len(_df) > _MEMORY_SAMPLE_ROWS:
+        sample = _df[obj_cols].sample(_MEMORY_SAMPLE_ROWS, random_state=0)
+        factor = sample.memory_usage(deep=True, index=False).sum() / max(
+            sample.memory_usage(deep=False, index=False).sum(), 1
+        )
+        obj_shallow = _df[obj_cols].memory_usage(deep=False, index=False).sum()
+        estimate = shallow + obj_shallow * (factor - 1)
+    elif len(obj_cols):
+        estimate = _df.memory_usage(deep=True).sum()
+    else:
+        estimate = shallow
+    return float(estimate / 1024 / 1024)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _preview_stats(file_id: str, col: str, _df: pd.DataFrame) -> Dict[str, Any]:
+    """Textes valides, longueur moyenne et doublons de la colonne sélectionnée."""
+    series = _df[col]
+    return {
+        "valid": int(series.notna().sum()),
+        "avg_len": _mean_text_length(series),
+        "dupes": _duplicate_count(series),
+    }
+
+
+def _duplicate_count(series: pd.Series) -> int:
+    """
+    Nombre de doublons d'une colonne, identique à duplicated().sum().
+
+    Calculé par pyarrow.compute.unique (les valeurs manquantes comptent pour
+    une seule valeur, comme avec pandas); repli pandas si pyarrow est absent
+    ou si la colonne mélange plusieurs types.
+    """
+    if PYARROW_AVAILABLE and len(series):
+        try:
+            arr = pa.array(series.to_numpy(), from_pandas=True)
+            return len(arr) - len(pc.unique(arr))
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass
+    return int(series.duplicated().sum())
+
+
+def _mean_text_length(series: pd.Series) -> float:
+    """
+    Longueur moyenne (en caractères) des textes d'une colonne.
+
+    Calculée par pyarrow.compute.utf8_length sur un tableau Arrow, sans la
+    copie astype(str) de toute la colonne; repli pandas si pyarrow est absent
+    ou si la colonne mélange textes et autres types.
+    """
+    if PYARROW_AVAILABLE and len(series):
+        try:
+            arr = pa.array(series.fillna("").to_numpy(), type=pa.string())
+            return float(pc.mean(pc.utf8_length(arr)).as_py())
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+    return float(series.fillna("").astype(str).str.len().mean())
+
+
+@st.fragment
+def _preview_and_actions(df: pd.DataFrame, file_id: str):
+    """
+    Sélection de la colonne de texte, statistiques et boutons d'action.
+
+    Isolé dans un fragment: changer de colonne ne réexécute que ce bloc, pas
+    l'en-tête de la section upload ni l'import distant. Les boutons qui
+    changent d'étape relancent toute l'application.
+
+    Args:
+        df: DataFrame uploadé
+        file_id: Identifiant du fichier uploadé (clé des caches d'aperçu)
+    """
+    # Sélection colonne
+    st.markdown("### Sélection de la Colonne de Texte")
+
+    text_columns = df.select_dtypes(include=["object"]).columns.tolist()
 
-        max_size = st.slider(
-            "Taille maximale autorisée (MB)",
-            min_value=50,
-            max_value=500,
-            value=200,
-            step=10,
-            key="remote_import_size",
-        )
+    if not text_columns:
+        st.error("Aucune colonne de texte trouvée")
+        return
 
-        fetching = st.session_state.get("remote_import_loading", False)
-        fetch_btn = st.button(
-            "Importer via l'API",
+    selected_column = st.selectbox(
+        "Choisissez la colonne contenant le texte:",
+        options=text_columns,
+        key="text_column_selector",
+    )
+
+    st.session_state.selected_text_column = selected_column
+
+    # Sample texte
+    sample = str(df[selected_column].iloc[0])
+    st.info(f"**Exemple de texte:**\n\n{sample[:300]}...")
+
+    # Stats colonne
+    stats = _preview_stats(file_id, selected_column, df)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Textes valides", f"{stats['valid']:,}")
+    with col2:
+        st.metric("Longueur moyenne", f"{stats['avg_len']:.0f} car.")
+    with col3:
+        st.metric("Doublons", f"{stats['dupes']:,}")
+
+    # Bouton nettoyage
+    st.markdown("### Démarrer le Nettoyage")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        if st.button(
+            "Nettoyer et Préparer les Données",
             type="primary",
             use_container_width=True,
-            disabled=fetching,
-        )
+        ):
+            with st.spinner("Nettoyage des données en cours..."):
+                modules = _load_classification_modules()
 
-        if fetch_btn:
-            if not remote_url:
-                st.warning("Merci de renseigner un lien valide.")
-                return
+                if modules.get("available"):
+                    TweetCleaner = modules["TweetCleaner"]
+                    cleaner = TweetCleaner()
 
-            st.session_state["remote_import_loading"] = True
-            headers = {}
-            if token:
-                header_key = (header_name or "Authorization").strip() or "Authorization"
-                header_value = token.strip()
-                if (
-                    header_key.lower() == "authorization"
-                    and header_value
-                    and not header_value.lower().startswith("bearer")
-                ):
-                    header_value = f"Bearer {header_value}"
-                headers[header_key] = header_value
+                    progress_bar = st.progress(0)
+                    progress_bar.progress(0.3)
 
-            try:
-                with st.spinner("Connexion à la source distante..."):
-                    dataset = fetch_remote_dataset(
-                        url=remote_url,
-                        method=method,
-                        headers=headers if headers else None,
-                        payload=payload if payload else None,
-                        timeout=timeout,
-                        max_size_mb=max_size,
+                    # process_dataframe travaille déjà sur sa propre copie
+                    df_cleaned, stats = cleaner.process_dataframe(
+                        df,
+                        selected_column,
+                        progress_callback=lambda done: progress_bar.progress(
+                            0.3 + 0.7 * done
+                        ),
                     )
 
-                st.session_state["remote_import_status"] = {
-                    "type": "success",
-                    "message": "Dataset importé depuis la source distante.",
-                    "details": {
-                        "filename": dataset.get("filename", "remote_dataset.csv"),
-                        "size": format_file_size(dataset.get("size", 0)),
-                    },
-                }
-                saved_path = persist_remote_dataset(dataset, base_dir=REMOTE_UPLOAD_DIR)
-                st.session_state["remote_import_status"]["details"]["saved_path"] = str(
-                    saved_path
-                )
-                _handle_upload_robust(dataset["uploaded_file"])
-            except Exception as exc:
-                message = str(exc)
-                st.session_state["remote_import_status"] = {
-                    "type": "error",
-                    "message": message,
-                }
-                st.error(f"Impossible de récupérer le fichier distant: {message}")
-            finally:
-                st.session_state["remote_import_loading"] = False
+                    progress_bar.progress(1.0)
+
+                    st.session_state.df_cleaned = df_cleaned
+                    st.session_state.cleaning_stats = stats
+                    st.session_state.workflow_step = "classify"
+
+                    st.success("Nettoyage terminé!")
+                    time.sleep(1)
+                    st.rerun(scope="app")
+                else:
+                    st.error("Modules de nettoyage non disponibles")
+
+    with col2:
+        if st.button("Réinitialiser", use_container_width=True):
+            for key in [
+                k
+                for k in st.session_state
+                if k.startswith("df_") or k == "selected_text_column"
+            ]:
+                del st.session_state[key]
+            # Libérer tout de suite les DataFrames retirés de la session
+            gc.collect()
+            st.rerun(scope="app")
 
 
 def _handle_upload_robust(uploaded_file):
@@ -2282,115 +3039,60 @@ def _handle_upload_robust(uploaded_file):
 
         if file_size_mb > 500:
             st.markdown(
-                f"""
-            <div style="background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%);
-                        padding: 1.25rem; border-radius: 12px; border-left: 4px solid #EF4444;
-                        margin: 1rem 0; box-shadow: 0 4px 12px rgba(239, 68, 68, 0.15);">
-                <div style="display: flex; align-items: center; gap: 0.75rem; margin-bottom: 0.5rem;">
-                    <i class="fas fa-exclamation-triangle" style="color: #EF4444; font-size: 1.25rem;"></i>
-                    <h4 style="color: #991B1B; font-weight: 700; margin: 0;">Fichier trop volumineux</h4>
-                </div>
-                <p style="color: #7F1D1D; margin: 0 0 0.75rem 0;">
-                    Taille actuelle: <strong>{file_size_mb:.1f} MB</strong> | Maximum autorisé: <strong>500 MB</strong>
-                </p>
-                <p style="color: #7F1D1D; margin: 0; font-size: 0.875rem;">
-                    <i class="fas fa-lightbulb" style="color: #F59E0B; margin-right: 0.375rem;"></i>
-                    Réduisez la taille du fichier ou filtrez les données avant l'upload
-                </p>
-            </div>
-            """,
-                unsafe_allow_html=True,
+                _FILE_TOO_LARGE_TMPL.format(size=file_size_mb), unsafe_allow_html=True
             )
             return
 
         # Info fichier avec design moderne
         st.markdown(
-            f"""
-        <div style="background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);
-                    padding: 1.25rem; border-radius: 12px; border-left: 4px solid #10B981;
-                    margin: 1rem 0; box-shadow: 0 4px 12px rgba(16, 185, 129, 0.15);
-                    display: flex; align-items: center; gap: 1rem;">
-            <div style="width: 48px; height: 48px; background: linear-gradient(135deg, #10B981 0%, #059669 100%);
-                       border-radius: 12px; display: flex; align-items: center; justify-content: center;
-                       box-shadow: 0 4px 12px rgba(16, 185, 129, 0.3); flex-shrink: 0;">
-                <i class="fas fa-check-circle" style="color: white; font-size: 1.5rem;"></i>
-            </div>
-            <div style="flex: 1;">
-                <div style="font-weight: 700; color: #065F46; font-size: 1rem; margin-bottom: 0.25rem;">
-                    Fichier accepté avec succès
-                </div>
-                <div style="color: #047857; font-size: 0.875rem;">
-                    <i class="fas fa-file-csv" style="margin-right: 0.375rem;"></i>
-                    <strong>{uploaded_file.name}</strong> • {file_size_mb:.1f} MB
-                </div>
-            </div>
-        </div>
-        """,
+            _FILE_ACCEPTED_TMPL.format(name=uploaded_file.name, size=file_size_mb),
             unsafe_allow_html=True,
         )
 
-        # Lecture robuste avec multi-encodage
-        with st.spinner("Lecture du fichier en cours..."):
-            df = None
+        # Lecture robuste avec multi-encodage, uniquement pour un nouveau fichier:
+        # les reruns (sélecteur de colonne, boutons) réutilisent le DataFrame en session
+        file_id = _upload_fingerprint(uploaded_file)
+        if (
+            st.session_state.get("last_file_id") == file_id
+            and "df_original" in st.session_state
+        ):
+            df = st.session_state.df_original
+        else:
+            with st.spinner("Lecture du fichier en cours..."):
+                df = None
 
-            # Détection automatique d'encodage avec chardet (si disponible)
-            detected_encoding = None
-            try:
-                import chardet  # type: ignore
-
-                # Lire un échantillon pour détecter l'encodage
-                sample = uploaded_file.read(10000)
-                uploaded_file.seek(0)  # Reset file pointer
-                result = chardet.detect(sample)
-                if result and result["encoding"] and result["confidence"] > 0.7:
-                    detected_encoding = result["encoding"]
-                    logger.info(
-                        f"Encodage détecté par chardet: {detected_encoding} (confiance: {result['confidence']:.2f})"
-                    )
-            except ImportError:
-                logger.debug(
-                    "chardet non disponible, utilisation de la détection manuelle"
-                )
-            except Exception as e:
-                logger.warning(f"Erreur détection chardet: {e}")
-
-            # Liste des encodages à essayer (chardet en premier si détecté)
-            encodings_to_try = []
-            if detected_encoding:
-                encodings_to_try.append(detected_encoding)
-            encodings_to_try.extend(
-                [
-                    "utf-8-sig",
-                    "utf-8",
-                    "latin-1",
-                    "iso-8859-1",
-                    "cp1252",
-                    "windows-1252",
-                ]
-            )
+                # Un seul parse avec l'encodage détecté; latin-1 (qui décode tout
+                # octet) ne sert que si la détection s'est trompée
+                detected_encoding = _detect_csv_encoding(uploaded_file, file_id)
+                encodings_to_try = [detected_encoding]
+                if detected_encoding.lower() not in ("latin-1", "iso-8859-1"):
+                    encodings_to_try.append("latin-1")
 
-            for encoding in encodings_to_try:
-                try:
-                    uploaded_file.seek(0)
-                    df = pd.read_csv(
-                        uploaded_file, encoding=encoding, on_bad_lines="skip"
-                    )
-                    logger.info(f"Lecture réussie avec encodage: {encoding}")
-                    st.caption(
-                        f"<i class='fas fa-check'></i> Encodage détecté: {encoding}",
-                        unsafe_allow_html=True,
+                for encoding in encodings_to_try:
+                    try:
+                        df = _read_csv(uploaded_file, encoding)
+                        logger.info(f"Lecture réussie avec encodage: {encoding}")
+                        # Mémoriser l'encodage effectivement utilisé pour ce fichier
+                        st.session_state[f"enc_{file_id}"] = encoding
+                        break
+                    except UnicodeDecodeError:
+                        continue
+                    except Exception as e:
+                        logger.warning(f"Erreur avec {encoding}: {e}")
+                        continue
+
+                if df is None:
+                    st.error("Impossible de lire le fichier")
+                    st.info(
+                        "Essayez de sauvegarder le CSV avec encodage UTF-8 dans Excel"
                     )
-                    break
-                except UnicodeDecodeError:
-                    continue
-                except Exception as e:
-                    logger.warning(f"Erreur avec {encoding}: {e}")
-                    continue
-
-            if df is None:
-                st.error("Impossible de lire le fichier")
-                st.info("Essayez de sauvegarder le CSV avec encodage UTF-8 dans Excel")
-                return
+                    return
+
+        encoding = st.session_state.get(f"enc_{file_id}", "utf-8")
+        st.caption(
+            f"<i class='fas fa-check'></i> Encodage détecté: {encoding}",
+            unsafe_allow_html=True,
+        )
 
         if df.empty:
             st.error("Fichier vide")
@@ -2400,9 +3102,11 @@ def _handle_upload_robust(uploaded_file):
             f"Chargé avec succès: {len(df):,} lignes • {len(df.columns)} colonnes"
         )
 
-        # Preview
+        # Preview (calculs mis en cache par fichier uploadé)
         with st.expander("Aperçu des Données (10 premières lignes)", expanded=True):
-            st.dataframe(df.head(10), use_container_width=True, height=300)
+            st.dataframe(
+                _preview_head(file_id, df), use_container_width=True, height=300
+            )
 
             col1, col2, col3 = st.columns(3)
             with col1:
@@ -2410,85 +3114,12 @@ def _handle_upload_robust(uploaded_file):
             with col2:
                 st.metric("Colonnes", len(df.columns))
             with col3:
-                memory_mb = df.memory_usage(deep=True).sum() / 1024 / 1024
-                st.metric("Mémoire", f"{memory_mb:.1f} MB")
-
-        # Sélection colonne
-        st.markdown("### Sélection de la Colonne de Texte")
-
-        text_columns = df.select_dtypes(include=["object"]).columns.tolist()
-
-        if not text_columns:
-            st.error("Aucune colonne de texte trouvée")
-            return
-
-        selected_column = st.selectbox(
-            "Choisissez la colonne contenant le texte:",
-            options=text_columns,
-            key="text_column_selector",
-        )
+                st.metric("Mémoire", f"{_frame_memory_mb(file_id, df):.1f} MB")
 
-        st.session_state.selected_text_column = selected_column
         st.session_state.df_original = df
+        st.session_state.last_file_id = file_id
 
-        # Sample texte
-        sample = str(df[selected_column].iloc[0])
-        st.info(f"**Exemple de texte:**\n\n{sample[:300]}...")
-
-        # Stats colonne
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Textes valides", f"{df[selected_column].notna().sum():,}")
-        with col2:
-            avg_length = df[selected_column].astype(str).str.len().mean()
-            st.metric("Longueur moyenne", f"{avg_length:.0f} car.")
-        with col3:
-            duplicates = df[selected_column].duplicated().sum()
-            st.metric("Doublons", f"{duplicates:,}")
-
-        # Bouton nettoyage
-        st.markdown("### Démarrer le Nettoyage")
-
-        col1, col2 = st.columns([2, 1])
-
-        with col1:
-            if st.button(
-                "Nettoyer et Préparer les Données",
-                type="primary",
-                use_container_width=True,
-            ):
-                with st.spinner("Nettoyage des données en cours..."):
-                    modules = _load_classification_modules()
-
-                    if modules.get("available"):
-                        TweetCleaner = modules["TweetCleaner"]
-                        cleaner = TweetCleaner()
-
-                        progress_bar = st.progress(0)
-                        progress_bar.progress(0.3)
-
-                        df_cleaned, stats = cleaner.process_dataframe(
-                            df.copy(), selected_column
-                        )
-
-                        progress_bar.progress(1.0)
-
-                        st.session_state.df_cleaned = df_cleaned
-                        st.session_state.cleaning_stats = stats
-                        st.session_state.workflow_step = "classify"
-
-                        st.success("Nettoyage terminé!")
-                        time.sleep(1)
-                        st.rerun()
-                    else:
-                        st.error("Modules de nettoyage non disponibles")
-
-        with col2:
-            if st.button("Réinitialiser", use_container_width=True):
-                for key in list(st.session_state.keys()):
-                    if key.startswith("df_") or key == "selected_text_column":
-                        del st.session_state[key]
-                st.rerun()
+        _preview_and_actions(df, file_id)
 
     except Exception as e:
         st.error("Erreur lors du traitement:")
@@ -2499,44 +3130,7 @@ def _handle_upload_robust(uploaded_file):
         error_str = str(e).lower()
         if "403" in error_str or "forbidden" in error_str or "permission" in error_str:
             st.error(
-                """
-            <h4><i class='fas fa-ban'></i> Erreur 403 - Accès Interdit Détecté</h4>
-            
-            <strong><i class='fas fa-tools'></i> Solutions recommandées par ordre de priorité:</strong>
-            
-            1. <strong><i class='fas fa-sync-alt'></i> Rafraîchir la page</strong>
-               - Appuyez sur F5
-               - Ou cliquez sur l'icône de rafraîchissement du navigateur
-            
-            2. <strong><i class='fas fa-weight'></i> Vérifier la taille du fichier</strong>
-               - Limite: 500 MB maximum
-               - Votre fichier: {:.1f} MB
-            
-            3. <strong><i class='fas fa-trash-alt'></i> Vider le cache du navigateur</strong>
-               - Chrome: Ctrl+Shift+Del
-               - Sélectionner "Images et fichiers en cache"
-               - Cliquer "Effacer les données"
-            
-            4. <strong><i class='fas fa-lock-open'></i> Vérifier les permissions du fichier</strong>
-               - Le fichier ne doit pas être en lecture seule
-               - Propriétés → Décocher "Lecture seule"
-            
-            5. <strong><i class='fas fa-shield-alt'></i> Désactiver temporairement l'anti-virus</strong>
-               - Certains anti-virus bloquent les uploads
-               - Réessayer après désactivation
-            
-            6. <strong><i class='fas fa-redo'></i> Redémarrer l'application</strong>
-               ```
-               taskkill /F /IM python.exe
-               streamlit run streamlit_app/app.py --server.port=8502
-               ```
-            
-            <strong><i class='fas fa-book'></i> Documentation complète:</strong> Voir le guide d'utilisation
-            """.format(
-                    uploaded_file.size / (1024 * 1024)
-                    if "uploaded_file" in locals()
-                    else 0
-                ),
+                _UPLOAD_403_HELP_TMPL.format(size=uploaded_file.size / (1024 * 1024)),
                 icon="error",
             )
 
@@ -2643,6 +3237,153 @@ def _section_classification():
         _perform_classification(df_cleaned, text_col, mode, use_optimized)
 
 
+# Message affiché quand aucun provider de classification n'est disponible
+_NO_PROVIDER_HTML = """
+<div style="
+    background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%);
+    padding: 2rem;
+    border-radius: 16px;
+    border-left: 4px solid #EF4444;
+    box-shadow: 0 8px 32px rgba(239, 68, 68, 0.25);
+    margin: 1rem 0;
+">
+    <h3 style="color: #991B1B; font-weight: 700; margin-bottom: 1rem;
+               display: flex; align-items: center; gap: 0.75rem;">
+        <i class="fas fa-exclamation-triangle" style="color: #EF4444; font-size: 1.5rem;"></i>
+        ❌ Aucun Provider de Classification Disponible
+    </h3>
+    <p style="color: #7F1D1D; margin-bottom: 1.5rem; line-height: 1.6; font-size: 1rem;">
+        Aucun provider de classification n'est disponible ou configuré. 
+        Veuillez configurer au moins l'un des éléments suivants:
+    </p>
+    <div style="display: grid; gap: 1rem; margin-bottom: 1.5rem;">
+        <div style="
+            background: rgba(16, 185, 129, 0.1);
+            border-left: 3px solid #10B981;
+            padding: 1rem;
+            border-radius: 8px;
+        ">
+            <h4 style="color: #059669; font-weight: 700; margin-bottom: 0.5rem;
+                       display: flex; align-items: center; gap: 0.5rem;">
+                <i class="fas fa-server" style="color: #10B981;"></i>
+                1. Mistral Local (Ollama)
+            </h4>
+            <p style="color: #047857; margin: 0; font-size: 0.9375rem;">
+                <strong>Installation:</strong>
+            </p>
+            <ul style="color: #047857; margin: 0.5rem 0 0 1.5rem; font-size: 0.9375rem;">
+                <li>Téléchargez Ollama: <a href="https://ollama.ai" target="_blank" style="color: #059669;">https://ollama.ai</a></li>
+                <li>Installez le modèle: <code style="background: rgba(5, 150, 105, 0.2); padding: 0.2rem 0.4rem; border-radius: 4px;">ollama pull mistral</code></li>
+                <li>Lancez le serveur: <code style="background: rgba(5, 150, 105, 0.2); padding: 0.2rem 0.4rem; border-radius: 4px;">ollama serve</code></li>
+            </ul>
+            <p style="color: #047857; margin: 0.5rem 0 0 0; font-size: 0.9375rem;">
+                <strong>Ou utilisez Docker:</strong>
+            </p>
+            <code style="
+                background: rgba(5, 150, 105, 0.2);
+                padding: 0.75rem 1rem;
+                border-radius: 6px;
+                display: block;
+                margin-top: 0.5rem;
+                color: #065F46;
+                font-size: 0.875rem;
+            ">docker run -d --name ollama -p 11434:11434 ollama/ollama<br>docker exec ollama ollama pull mistral</code>
+        </div>
+        <div style="
+            background: rgba(59, 130, 246, 0.1);
+            border-left: 3px solid #3B82F6;
+            padding: 1rem;
+            border-radius: 8px;
+        ">
+            <h4 style="color: #2563EB; font-weight: 700; margin-bottom: 0.5rem;
+                       display: flex; align-items: center; gap: 0.5rem;">
+                <i class="fas fa-cloud" style="color: #3B82F6;"></i>
+                2. Gemini API (Google Cloud)
+            </h4>
+            <p style="color: #1D4ED8; margin: 0; font-size: 0.9375rem;">
+                <strong>Étapes:</strong>
+            </p>
+            <ul style="color: #1D4ED8; margin: 0.5rem 0 0 1.5rem; font-size: 0.9375rem;">
+                <li>Créez un compte Google Cloud: <a href="https://console.cloud.google.com" target="_blank" style="color: #2563EB;">https://console.cloud.google.com</a></li>
+                <li>Générez une clé API: <a href="https://ai.google.dev/api" target="_blank" style="color: #2563EB;">https://ai.google.dev/api</a></li>
+                <li>Ajoutez la clé dans le fichier <code style="background: rgba(37, 99, 235, 0.2); padding: 0.2rem 0.4rem; border-radius: 4px;">.env</code> à la racine du projet</li>
+                <li>Ou configurez-la via le sidebar → Configuration Provider</li>
+            </ul>
+        </div>
+    </div>
+    <p style="color: #7F1D1D; margin: 0; font-size: 0.9375rem;">
+        <strong>💡 Astuce:</strong> Utilisez le bouton "⚙️ Configuration Provider" dans le sidebar pour configurer facilement vos providers.
+    </p>
+</div>
+"""
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _provider_statuses() -> Dict[str, Any]:
+    """
+    Statuts des providers par clé ("mistral_local", "gemini_cloud"),
+    revérifiés au plus toutes les 30 s.
+
+    Chaque vérification interroge Ollama et l'API Gemini: un seul passage
+    sert toutes les lectures de la fenêtre (sélecteur du sidebar et
+    classification) au lieu d'un par appel.
+    """
+    return provider_manager.get_all_statuses()
+
+
+def _clear_provider_caches():
+    """Invalide les statuts de providers en cache (ex: nouvelle clé Gemini)."""
+    _provider_statuses.clear()
+    _cached_gemini_status.clear()
+    _cached_mistral_status.clear()
+
+
+def _providers_available() -> bool:
+    """Disponibilité d'au moins un provider (statuts en cache)."""
+    return any(status.available for status in _provider_statuses().values())
+
+
+@st.cache_resource(show_spinner=False)
+def _get_gemini_classifier(
+    api_key: Optional[str],
+    batch_size: int = 50,
+    temperature: float = 0.3,
+    max_retries: int = 3,
+    model_name: str = "gemini-2.0-flash-exp",
+):
+    """
+    GeminiClassifier construit une fois par processus et par configuration.
+
+    La clé API fait partie de la clé de cache: une clé modifiée (sidebar,
+    .env) produit un nouveau client.
+    """
+    from services.gemini_classifier import GeminiClassifier
+
+    return GeminiClassifier(
+        api_key=api_key,
+        batch_size=batch_size,
+        temperature=temperature,  # Optimisé selon documentation
+        max_retries=max_retries,
+        model_name=model_name,  # Modèle optimal
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _get_ultra_classifier(batch_size: int, max_workers: int, use_cache: bool):
+    """
+    UltraOptimizedClassifier partagé entre reruns et entre sessions: ses
+    modèles (BERT, règles, Mistral), chargés une seule fois sous verrou à la
+    première utilisation, ne sont pas rechargés. Les statistiques de chaque
+    run restent locales à classify_tweets_batch (RunStats), ce qui permet
+    des classifications concurrentes sur la même instance.
+    """
+    from services.ultra_optimized_classifier import UltraOptimizedClassifier
+
+    return UltraOptimizedClassifier(
+        batch_size=batch_size, max_workers=max_workers, use_cache=use_cache
+    )
+
+
 def _perform_classification(df, text_col, mode, use_optimized):
     """
     Exécute la classification des données avec support multi-providers.
@@ -2662,88 +3403,8 @@ def _perform_classification(df, text_col, mode, use_optimized):
     try:
         # ✅ VÉRIFICATION CRITIQUE: S'assurer qu'au moins un provider est disponible
         if PROVIDER_MANAGER_AVAILABLE and provider_manager:
-            if not provider_manager.is_any_provider_available():
-                st.error(
-                    """
-                <div style="
-                    background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%);
-                    padding: 2rem;
-                    border-radius: 16px;
-                    border-left: 4px solid #EF4444;
-                    box-shadow: 0 8px 32px rgba(239, 68, 68, 0.25);
-                    margin: 1rem 0;
-                ">
-                    <h3 style="color: #991B1B; font-weight: 700; margin-bottom: 1rem;
-                               display: flex; align-items: center; gap: 0.75rem;">
-                        <i class="fas fa-exclamation-triangle" style="color: #EF4444; font-size: 1.5rem;"></i>
-                        ❌ Aucun Provider de Classification Disponible
-                    </h3>
-                    <p style="color: #7F1D1D; margin-bottom: 1.5rem; line-height: 1.6; font-size: 1rem;">
-                        Aucun provider de classification n'est disponible ou configuré. 
-                        Veuillez configurer au moins l'un des éléments suivants:
-                    </p>
-                    <div style="display: grid; gap: 1rem; margin-bottom: 1.5rem;">
-                        <div style="
-                            background: rgba(16, 185, 129, 0.1);
-                            border-left: 3px solid #10B981;
-                            padding: 1rem;
-                            border-radius: 8px;
-                        ">
-                            <h4 style="color: #059669; font-weight: 700; margin-bottom: 0.5rem;
-                                       display: flex; align-items: center; gap: 0.5rem;">
-                                <i class="fas fa-server" style="color: #10B981;"></i>
-                                1. Mistral Local (Ollama)
-                            </h4>
-                            <p style="color: #047857; margin: 0; font-size: 0.9375rem;">
-                                <strong>Installation:</strong>
-                            </p>
-                            <ul style="color: #047857; margin: 0.5rem 0 0 1.5rem; font-size: 0.9375rem;">
-                                <li>Téléchargez Ollama: <a href="https://ollama.ai" target="_blank" style="color: #059669;">https://ollama.ai</a></li>
-                                <li>Installez le modèle: <code style="background: rgba(5, 150, 105, 0.2); padding: 0.2rem 0.4rem; border-radius: 4px;">ollama pull mistral</code></li>
-                                <li>Lancez le serveur: <code style="background: rgba(5, 150, 105, 0.2); padding: 0.2rem 0.4rem; border-radius: 4px;">ollama serve</code></li>
-                            </ul>
-                            <p style="color: #047857; margin: 0.5rem 0 0 0; font-size: 0.9375rem;">
-                                <strong>Ou utilisez Docker:</strong>
-                            </p>
-                            <code style="
-                                background: rgba(5, 150, 105, 0.2);
-                                padding: 0.75rem 1rem;
-                                border-radius: 6px;
-                                display: block;
-                                margin-top: 0.5rem;
-                                color: #065F46;
-                                font-size: 0.875rem;
-                            ">docker run -d --name ollama -p 11434:11434 ollama/ollama<br>docker exec ollama ollama pull mistral</code>
-                        </div>
-                        <div style="
-                            background: rgba(59, 130, 246, 0.1);
-                            border-left: 3px solid #3B82F6;
-                            padding: 1rem;
-                            border-radius: 8px;
-                        ">
-                            <h4 style="color: #2563EB; font-weight: 700; margin-bottom: 0.5rem;
-                                       display: flex; align-items: center; gap: 0.5rem;">
-                                <i class="fas fa-cloud" style="color: #3B82F6;"></i>
-                                2. Gemini API (Google Cloud)
-                            </h4>
-                            <p style="color: #1D4ED8; margin: 0; font-size: 0.9375rem;">
-                                <strong>Étapes:</strong>
-                            </p>
-                            <ul style="color: #1D4ED8; margin: 0.5rem 0 0 1.5rem; font-size: 0.9375rem;">
-                                <li>Créez un compte Google Cloud: <a href="https://console.cloud.google.com" target="_blank" style="color: #2563EB;">https://console.cloud.google.com</a></li>
-                                <li>Générez une clé API: <a href="https://ai.google.dev/api" target="_blank" style="color: #2563EB;">https://ai.google.dev/api</a></li>
-                                <li>Ajoutez la clé dans le fichier <code style="background: rgba(37, 99, 235, 0.2); padding: 0.2rem 0.4rem; border-radius: 4px;">.env</code> à la racine du projet</li>
-                                <li>Ou configurez-la via le sidebar → Configuration Provider</li>
-                            </ul>
-                        </div>
-                    </div>
-                    <p style="color: #7F1D1D; margin: 0; font-size: 0.9375rem;">
-                        <strong>💡 Astuce:</strong> Utilisez le bouton "⚙️ Configuration Provider" dans le sidebar pour configurer facilement vos providers.
-                    </p>
-                </div>
-                """,
-                    unsafe_allow_html=True,
-                )
+            if not _providers_available():
+                st.markdown(_NO_PROVIDER_HTML, unsafe_allow_html=True)
                 status.empty()
                 progress_bar.empty()
                 st.stop()
@@ -2756,30 +3417,21 @@ def _perform_classification(df, text_col, mode, use_optimized):
         config = st.session_state.get("config", {})
         selected_provider = config.get("provider", selected_provider)
 
-        # Mapper depuis le nom du provider si nécessaire (nouveau système)
+        # Identifiant canonique posé par le sélecteur (nouveau système)
         if PROVIDER_MANAGER_AVAILABLE and provider_manager:
-            selected_provider_name = st.session_state.get("selected_provider")
-            if selected_provider_name:
-                if "Mistral" in selected_provider_name:
-                    selected_provider = "mistral"
-                elif "Gemini" in selected_provider_name:
-                    selected_provider = "gemini"
-                else:
-                    selected_provider = config.get("provider", "mistral")
+            selected_provider_id = st.session_state.get("selected_provider_id")
+            if selected_provider_id in ("mistral", "gemini"):
+                selected_provider = selected_provider_id
 
             # Vérifier que le provider sélectionné est disponible
             if selected_provider == "mistral":
-                mistral_status = provider_manager.get_provider_status(
-                    "Mistral Local (Ollama)"
-                )
+                mistral_status = _provider_statuses().get("mistral_local")
                 if not mistral_status or not mistral_status.available:
                     st.warning(
                         "⚠️ Mistral n'est pas disponible. Basculement vers Gemini ou fallback..."
                     )
                     # Essayer Gemini
-                    gemini_status = provider_manager.get_provider_status(
-                        "Gemini API (Google Cloud)"
-                    )
+                    gemini_status = _provider_statuses().get("gemini_cloud")
                     if gemini_status and gemini_status.available:
                         selected_provider = "gemini"
                         logger.info(
@@ -2793,17 +3445,13 @@ def _perform_classification(df, text_col, mode, use_optimized):
                         progress_bar.empty()
                         st.stop()
             elif selected_provider == "gemini":
-                gemini_status = provider_manager.get_provider_status(
-                    "Gemini API (Google Cloud)"
-                )
+                gemini_status = _provider_statuses().get("gemini_cloud")
                 if not gemini_status or not gemini_status.available:
                     st.warning(
                         "⚠️ Gemini n'est pas disponible. Basculement vers Mistral ou fallback..."
                     )
                     # Essayer Mistral
-                    mistral_status = provider_manager.get_provider_status(
-                        "Mistral Local (Ollama)"
-                    )
+                    mistral_status = _provider_statuses().get("mistral_local")
                     if mistral_status and mistral_status.available:
                         selected_provider = "mistral"
                         logger.info(
@@ -2822,17 +3470,12 @@ def _perform_classification(df, text_col, mode, use_optimized):
         # Si Gemini est sélectionné, utiliser GeminiClassifier
         if selected_provider == "gemini":
             try:
-                from services.gemini_classifier import GeminiClassifier
-
                 status.info("Initialisation Gemini API...")
                 progress_bar.progress(0.15)
 
-                # Initialiser GeminiClassifier avec paramètres optimaux
-                gemini_classifier = GeminiClassifier(
-                    batch_size=50,
-                    temperature=0.3,  # Optimisé selon documentation
-                    max_retries=3,
-                    model_name="gemini-2.0-flash-exp",  # Modèle optimal
+                # GeminiClassifier partagé entre reruns (clé API lue à chaque run)
+                gemini_classifier = _get_gemini_classifier(
+                    os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
                 )
 
                 status.info("Classification avec Gemini API...")
@@ -2893,14 +3536,10 @@ def _perform_classification(df, text_col, mode, use_optimized):
             else:
                 if use_optimized:
                     try:
-                        from services.ultra_optimized_classifier import (
-                            UltraOptimizedClassifier,
-                        )
-
                         status.info("Classificateur ultra-optimisé...")
                         progress_bar.progress(0.2)
 
-                        classifier = UltraOptimizedClassifier(
+                        classifier = _get_ultra_classifier(
                             batch_size=50, max_workers=4, use_cache=True
                         )
 
@@ -2979,6 +3618,32 @@ def _perform_classification(df, text_col, mode, use_optimized):
             st.code(str(e))
 
 
+# Mots-clés de la classification de secours, par groupe (recherche en sous-chaîne).
+# "panne" appartient aussi aux groupes claim, negative et urgent: il n'est
+# recherché qu'une fois et ajouté à ces groupes (_FALLBACK_PANNE_GROUPS).
+_FALLBACK_KEYWORDS = {
+    "claim": ("@free", "problème", "bug"),
+    "positive": ("merci", "super", "bravo", "excellent"),
+    "negative": ("nul", "mauvais", "honte"),
+    "urgent": ("urgent", "critique"),
+    "fibre": ("fibre",),
+    "mobile": ("mobile",),
+    "facture": ("facture",),
+    "panne": ("panne",),
+}
+
+_FALLBACK_PANNE_GROUPS = ("claim", "negative", "urgent")
+
+# Expressions compilées hors de la boucle de classification (à chaque rerun,
+# re.compile les retrouve dans le cache interne du module re). Ce sont des
+# alternances de littéraux (aucun retour arrière coûteux avec re), et
+# Series.str.contains n'accepte que des motifs du module re standard
+_FALLBACK_PATTERNS = {
+    group: re.compile("|".join(map(re.escape, words)))
+    for group, words in _FALLBACK_KEYWORDS.items()
+}
+
+
 def _classify_fallback(df: pd.DataFrame, text_col: str) -> pd.DataFrame:
     """
     Classification de secours basée sur des règles métier.
@@ -2993,56 +3658,166 @@ def _classify_fallback(df: pd.DataFrame, text_col: str) -> pd.DataFrame:
     Returns:
         DataFrame enrichi avec les classifications
     """
-    df_copy = df.copy()
+    # Copie superficielle: seules des colonnes sont ajoutées ou remplacées
+    # (jamais modifiées sur place), les données de df ne sont pas dupliquées
+    df_copy = df.copy(deep=False)
+    # Chaque groupe de mots-clés est testé en un seul passage vectorisé
+    t = df_copy[text_col].astype(str).str.lower()
+    has = {
+        group: t.str.contains(pattern, regex=True, na=False)
+        for group, pattern in _FALLBACK_PATTERNS.items()
+    }
+    for group in _FALLBACK_PANNE_GROUPS:
+        has[group] |= has["panne"]
+
+    # CORRECTION: "réclamation" au lieu de "claim"
+    claim = has["claim"]
+    df_copy["is_claim"] = np.where(claim, "oui", "non")
+    df_copy["sentiment"] = np.select(
+        [has["positive"], has["negative"]], ["positif", "negatif"], default="neutre"
+    )
+    df_copy["urgence"] = np.select(
+        [has["urgent"], claim], ["haute", "moyenne"], default="faible"
+    )
+    df_copy["topics"] = np.select(
+        [has["fibre"], has["mobile"], has["facture"]],
+        ["fibre", "mobile", "facture"],
+        default="autre",
+    )
+    df_copy["incident"] = np.select(
+        [has["panne"], has["facture"]],
+        ["incident_reseau", "facturation"],
+        default="autre",
+    )
+    df_copy["confidence"] = 0.75
+    return df_copy
+
+
+# Synonymes (en minuscules) des labels KPI produits par les classificateurs
+_SENTIMENT_MAP = {
+    "positive": "positif",
+    "pos": "positif",
+    "good": "positif",
+    "happy": "positif",
+    "negative": "negatif",
+    "neg": "negatif",
+    "bad": "negatif",
+    "angry": "negatif",
+    "négatif": "negatif",
+    "neutral": "neutre",
+    "neu": "neutre",
+    "ok": "neutre",
+}
+
+_IS_CLAIM_MAP = {
+    "yes": "oui",
+    "true": "oui",
+    "1": "oui",
+    "oui": "oui",
+    "no": "non",
+    "false": "non",
+    "0": "non",
+    "non": "non",
+}
+
+_URGENCE_MAP = {
+    "critical": "haute",
+    "critique": "haute",
+    "urgent": "haute",
+    "très haute": "haute",
+    "tres haute": "haute",
+    "high": "haute",
+    "elevee": "haute",
+    "élevée": "haute",
+    "medium": "moyenne",
+    "moyenne": "moyenne",
+    "moderee": "moyenne",
+    "modéré": "moyenne",
+    "low": "faible",
+    "faible": "faible",
+    "basse": "faible",
+    "normale": "faible",
+}
+
+
+# Valeurs (en minuscules) signalant une réclamation / un sentiment négatif
+_CLAIM_VALUES = frozenset({"oui", "yes", "1", "true"})
+_NEGATIVE_SENTIMENTS = frozenset({"negatif", "negative", "neg"})
+
+# Labels acceptés tels quels après normalisation (préservés des classificateurs)
+_VALID_URGENCES = frozenset({"haute", "moyenne", "faible"})
+_VALID_INCIDENTS = frozenset(
+    {
+        "panne_connexion",
+        "bug_freebox",
+        "probleme_facturation",
+        "probleme_mobile",
+        "retard_activation",
+        "debit_insuffisant",
+        "information",
+        "aucun",
+        "non_specifie",
+        "autre",
+        "incident_reseau",
+        "facturation",
+        "reseau",
+        "mobile",
+    }
+)
 
-    def classify_row(text):
-        t = str(text).lower()
 
-        # CORRECTION: "réclamation" au lieu de "claim"
-        is_claim = (
-            "oui"
-            if any(w in t for w in ["panne", "@free", "problème", "bug"])
-            else "non"
-        )
+def _claim_mask(is_claim: pd.Series) -> pd.Series:
+    """Masque booléen des lignes marquées comme réclamation."""
+    return _normalize_labels(is_claim).isin(_CLAIM_VALUES)
 
-        if any(w in t for w in ["merci", "super", "bravo", "excellent"]):
-            sentiment = "positif"
-        elif any(w in t for w in ["panne", "nul", "mauvais", "honte"]):
-            sentiment = "negatif"
-        else:
-            sentiment = "neutre"
 
-        urgence = (
-            "haute"
-            if any(w in t for w in ["panne", "urgent", "critique"])
-            else "moyenne" if is_claim == "oui" else "faible"
-        )
+# Types inférés sans collision pour pd.factorize (qui confond True, 1 et 1.0)
+_FACTORIZE_SAFE_KINDS = frozenset({"string", "empty", "boolean", "integer", "floating"})
+_value_types = np.frompyfunc(type, 1, 1)
 
-        topics = (
-            "fibre"
-            if "fibre" in t
-            else "mobile" if "mobile" in t else "facture" if "facture" in t else "autre"
-        )
 
-        incident = (
-            "incident_reseau"
-            if "panne" in t
-            else "facturation" if "facture" in t else "autre"
-        )
+def _clean_labels(labels: pd.Index, mapping: Optional[Dict[str, str]]) -> np.ndarray:
+    """Minuscules, espaces retirés et synonymes remplacés (labels distincts)."""
+    labels = labels.astype(str).str.lower().str.strip()
+    if mapping:
+        labels = labels.map(lambda label: mapping.get(label, label))
+    return np.asarray(labels, dtype=object)
 
-        return pd.Series(
-            {
-                "is_claim": is_claim,
-                "sentiment": sentiment,
-                "urgence": urgence,
-                "topics": topics,
-                "incident": incident,
-                "confidence": 0.75,
-            }
-        )
 
-    classifications = df_copy[text_col].apply(classify_row)
-    return pd.concat([df_copy, classifications], axis=1)
+def _normalize_labels(
+    series: pd.Series, mapping: Optional[Dict[str, str]] = None
+) -> pd.Series:
+    """
+    Met les labels en minuscules et remplace les synonymes connus.
+
+    Une colonne KPI n'a que quelques labels distincts: la colonne est codée
+    en entiers (pd.factorize), seuls les labels distincts sont normalisés,
+    puis le résultat est redéployé par les codes. Le résultat est celui de
+    astype(str).str.lower().str.strip() suivi de Series.replace(mapping):
+    une colonne objet de types mélangés (True, 1, "Yes") est codée sur son
+    texte, et les valeurs manquantes sont converties une à une.
+    """
+    values = series
+    if (
+        series.dtype == object
+        and pd.api.types.infer_dtype(series, skipna=True) not in _FACTORIZE_SAFE_KINDS
+    ):
+        values = series.astype(str)
+    codes, uniques = pd.factorize(values)
+
+    result = np.empty(len(series), dtype=object)
+    present = codes >= 0
+    result[present] = _clean_labels(pd.Index(uniques), mapping)[codes[present]]
+    if not present.all():
+        # factorize confond None et NaN, que astype(str) distingue sous
+        # pandas 2 ("none" / "nan"): une conversion par type de manquant
+        missing = series[~present].to_numpy(dtype=object)
+        kind_codes, _kinds = pd.factorize(_value_types(missing))
+        first = np.unique(kind_codes, return_index=True)[1]
+        result[~present] = _clean_labels(pd.Index(missing[first]), mapping)[
+            kind_codes
+        ]
+    return pd.Series(result, index=series.index, name=series.name)
 
 
 def _normalize_kpi_fields(df: pd.DataFrame) -> pd.DataFrame:
@@ -3053,14 +3828,17 @@ def _normalize_kpi_fields(df: pd.DataFrame) -> pd.DataFrame:
     des KPIs sont présentes et normalisées, avec des valeurs par défaut
     appropriées pour les champs manquants.
 
+    Le DataFrame est modifié en place (pas de copie complète): les appelants
+    passent le résultat frais d'un classificateur. Les écritures partielles
+    (.loc) ne portent que sur des colonnes recréées ici, jamais sur des
+    tableaux partagés avec un autre DataFrame.
+
     Args:
-        df: DataFrame avec les résultats de classification
+        df: DataFrame avec les résultats de classification (modifié)
 
     Returns:
-        DataFrame avec les champs KPI normalisés et complétés
+        Le même DataFrame, avec les champs KPI normalisés et complétés
     """
-    df = df.copy()
-
     # 1. Normaliser la colonne sentiment
     if "sentiment" not in df.columns:
         # Chercher des colonnes alternatives
@@ -3072,23 +3850,7 @@ def _normalize_kpi_fields(df: pd.DataFrame) -> pd.DataFrame:
             df["sentiment"] = "neutre"
     else:
         # Normaliser les valeurs de sentiment en LOWERCASE pour matching dynamique
-        df["sentiment"] = df["sentiment"].astype(str).str.lower().str.strip()
-        df["sentiment"] = df["sentiment"].replace(
-            {
-                "positive": "positif",
-                "pos": "positif",
-                "good": "positif",
-                "happy": "positif",
-                "negative": "negatif",
-                "neg": "negatif",
-                "bad": "negatif",
-                "angry": "negatif",
-                "négatif": "negatif",
-                "neutral": "neutre",
-                "neu": "neutre",
-                "ok": "neutre",
-            }
-        )
+        df["sentiment"] = _normalize_labels(df["sentiment"], _SENTIMENT_MAP)
 
     # 2. Normaliser la colonne is_claim
     if "is_claim" not in df.columns:
@@ -3107,19 +3869,11 @@ def _normalize_kpi_fields(df: pd.DataFrame) -> pd.DataFrame:
             df["is_claim"] = "non"
     else:
         # Normaliser les valeurs en LOWERCASE pour matching dynamique
-        df["is_claim"] = df["is_claim"].astype(str).str.lower().str.strip()
-        df["is_claim"] = df["is_claim"].replace(
-            {
-                "yes": "oui",
-                "true": "oui",
-                "1": "oui",
-                "oui": "oui",
-                "no": "non",
-                "false": "non",
-                "0": "non",
-                "non": "non",
-            }
-        )
+        df["is_claim"] = _normalize_labels(df["is_claim"], _IS_CLAIM_MAP)
+
+    # is_claim ne change plus ensuite: masque calculé une fois, partagé par
+    # les inférences d'urgence (étape 3) et d'incident (étape 5)
+    claims = _claim_mask(df["is_claim"])
 
     # 3. Normaliser la colonne urgence (PRESERVER LOWERCASE POUR MATCHING DYNAMIQUE)
     if "urgence" not in df.columns:
@@ -3132,67 +3886,20 @@ def _normalize_kpi_fields(df: pd.DataFrame) -> pd.DataFrame:
             df["urgence"] = "faible"
     else:
         # Normaliser les valeurs d'urgence en LOWERCASE pour matching dynamique
-        df["urgence"] = df["urgence"].astype(str).str.lower().str.strip()
         # Mapping intelligent qui préserve les valeurs des classificateurs (lowercase)
-        df["urgence"] = df["urgence"].replace(
-            {
-                "critical": "haute",
-                "critique": "haute",
-                "urgent": "haute",
-                "très haute": "haute",
-                "tres haute": "haute",
-                "high": "haute",
-                "elevee": "haute",
-                "élevée": "haute",
-                "élevée": "haute",
-                "medium": "moyenne",
-                "moyenne": "moyenne",
-                "moderee": "moyenne",
-                "modéré": "moyenne",
-                "modéré": "moyenne",
-                "low": "faible",
-                "faible": "faible",
-                "basse": "faible",
-                "normale": "faible",
-            }
-        )
+        df["urgence"] = _normalize_labels(df["urgence"], _URGENCE_MAP)
         # Si valeur invalide, inférer depuis is_claim si disponible
-        invalid_mask = ~df["urgence"].isin(["haute", "moyenne", "faible"])
+        invalid_mask = ~df["urgence"].isin(_VALID_URGENCES)
         if invalid_mask.any() and "is_claim" in df.columns:
-            is_claim_col = df["is_claim"].astype(str).str.lower().str.strip()
-            sentiment_col = (
-                df["sentiment"].astype(str).str.lower().str.strip()
-                if "sentiment" in df.columns
-                else pd.Series()
+            # Inférer urgence depuis is_claim et sentiment (sentiment existe
+            # toujours ici, cf. étape 1), sur toutes les lignes invalides à la fois
+            claim = claims[invalid_mask]
+            negative = _normalize_labels(df.loc[invalid_mask, "sentiment"]).isin(
+                _NEGATIVE_SENTIMENTS
+            )
+            df.loc[invalid_mask, "urgence"] = np.select(
+                [claim & negative, claim], ["haute", "moyenne"], default="faible"
             )
-
-            # Inférer urgence depuis is_claim et sentiment
-            for idx in df[invalid_mask].index:
-                if idx < len(is_claim_col):
-                    is_claim_val = (
-                        is_claim_col.iloc[idx] if idx < len(is_claim_col) else "non"
-                    )
-                    sentiment_val = (
-                        sentiment_col.iloc[idx]
-                        if "sentiment" in df.columns and idx < len(sentiment_col)
-                        else "neutre"
-                    )
-
-                    if is_claim_val in [
-                        "oui",
-                        "yes",
-                        "1",
-                        "true",
-                    ] and sentiment_val in [
-                        "negatif",
-                        "negative",
-                        "neg",
-                    ]:
-                        df.loc[idx, "urgence"] = "haute"
-                    elif is_claim_val in ["oui", "yes", "1", "true"]:
-                        df.loc[idx, "urgence"] = "moyenne"
-                    else:
-                        df.loc[idx, "urgence"] = "faible"
         else:
             # Valeur par défaut pour valeurs invalides
             df.loc[invalid_mask, "urgence"] = "faible"
@@ -3225,43 +3932,23 @@ def _normalize_kpi_fields(df: pd.DataFrame) -> pd.DataFrame:
             df["incident"] = "aucun"
     else:
         # Normaliser les valeurs d'incident en LOWERCASE pour matching dynamique
-        df["incident"] = df["incident"].astype(str).str.lower().str.strip()
+        df["incident"] = _normalize_labels(df["incident"])
         # Préserver les valeurs des classificateurs (panne_connexion, bug_freebox, etc.)
         # Ne remplacer que les valeurs vraiment invalides ou vides
-        valid_incidents = [
-            "panne_connexion",
-            "bug_freebox",
-            "probleme_facturation",
-            "probleme_mobile",
-            "retard_activation",
-            "debit_insuffisant",
-            "information",
-            "aucun",
-            "non_specifie",
-            "autre",
-            "incident_reseau",
-            "facturation",
-            "reseau",
-            "mobile",
-        ]
+        # Les manquants restent NaN sous pandas 3 (astype(str)): exclus ici,
+        # ils deviennent "aucun" plus bas comme les "nan" de pandas 2
         invalid_mask = (
-            ~df["incident"].isin(valid_incidents)
+            ~df["incident"].isin(_VALID_INCIDENTS)
+            & df["incident"].notna()
             & (df["incident"] != "")
             & (df["incident"] != "nan")
         )
 
         # Si incident invalide, inférer depuis is_claim si disponible
         if invalid_mask.any() and "is_claim" in df.columns:
-            is_claim_col = df["is_claim"].astype(str).str.lower().str.strip()
-            for idx in df[invalid_mask].index:
-                if idx < len(is_claim_col):
-                    is_claim_val = (
-                        is_claim_col.iloc[idx] if idx < len(is_claim_col) else "non"
-                    )
-                    if is_claim_val in ["oui", "yes", "1", "true"]:
-                        df.loc[idx, "incident"] = "non_specifie"
-                    else:
-                        df.loc[idx, "incident"] = "aucun"
+            df.loc[invalid_mask, "incident"] = np.where(
+                claims[invalid_mask], "non_specifie", "aucun"
+            )
         else:
             # Valeur par défaut pour valeurs invalides
             df.loc[invalid_mask, "incident"] = "non_specifie"
@@ -3316,28 +4003,37 @@ def _calculate_metrics(df: pd.DataFrame) -> Dict[str, Any]:
         Dictionnaire contenant toutes les métriques calculées
     """
 
+    # Distributions des colonnes KPI, calculées une seule fois: elles servent
+    # au rapport et aux comptages ci-dessous
+    dists = {
+        column: df[column].value_counts() if column in df.columns else pd.Series()
+        for column in ("is_claim", "sentiment", "urgence", "topics", "incident")
+    }
+
     # Fonction helper pour matching robuste case-insensitive
-    def count_matches(df, column, values):
+    def count_matches(column, values):
         """Compte les occurrences en ignorant la casse"""
-        if column not in df.columns:
+        counts = dists[column]
+        if counts.empty:
             return 0
-        # Normaliser la colonne en lowercase pour comparaison
-        normalized = df[column].astype(str).str.lower().str.strip()
+        # Les colonnes KPI n'ont que quelques labels distincts: normaliser en
+        # lowercase les seuls labels (pas chaque ligne)
+        labels = counts.index.astype(str).str.lower().str.strip()
         # Normaliser les valeurs de recherche en lowercase
         values_lower = [str(v).lower().strip() for v in values]
-        return int(normalized.isin(values_lower).sum())
+        return int(counts[labels.isin(values_lower)].sum())
 
     total = len(df)
 
     # Réclamations: supporter 'oui', 'OUI', 'yes', 'YES', '1', 'true', 'TRUE'
-    reclamations_count = count_matches(df, "is_claim", ["oui", "yes", "1", "true"])
+    reclamations_count = count_matches("is_claim", ["oui", "yes", "1", "true"])
 
     # Sentiments négatifs: supporter 'negatif', 'NEGATIF', 'negative', 'NEGATIVE', 'neg', 'NEG'
-    negative_count = count_matches(df, "sentiment", ["negatif", "negative", "neg"])
+    negative_count = count_matches("sentiment", ["negatif", "negative", "neg"])
 
     # Urgence haute: supporter 'haute', 'HAUTE', 'high', 'HIGH', 'elevee', 'ELEVEE', 'critique', 'CRITIQUE'
     urgence_haute_count = count_matches(
-        df, "urgence", ["haute", "high", "elevee", "élevée", "critique", "critical"]
+        "urgence", ["haute", "high", "elevee", "élevée", "critique", "critical"]
     )
 
     return {
@@ -3353,18 +4049,10 @@ def _calculate_metrics(df: pd.DataFrame) -> Dict[str, Any]:
             (urgence_haute_count / total * 100) if total > 0 else 0
         ),
         "confidence_avg": df["confidence"].mean() if "confidence" in df.columns else 0,
-        "sentiment_dist": (
-            df["sentiment"].value_counts() if "sentiment" in df.columns else pd.Series()
-        ),
-        "urgence_dist": (
-            df["urgence"].value_counts() if "urgence" in df.columns else pd.Series()
-        ),
-        "topics_dist": (
-            df["topics"].value_counts() if "topics" in df.columns else pd.Series()
-        ),
-        "incident_dist": (
-            df["incident"].value_counts() if "incident" in df.columns else pd.Series()
-        ),
+        "sentiment_dist": dists["sentiment"],
+        "urgence_dist": dists["urgence"],
+        "topics_dist": dists["topics"],
+        "incident_dist": dists["incident"],
     }
 
 
@@ -3391,8 +4079,7 @@ def _section_results():
 
     with col2:
         # NOUVEAU: Bouton affichage complet des indicateurs
-        if "show_all_indicators" not in st.session_state:
-            st.session_state.show_all_indicators = False
+        st.session_state.setdefault("show_all_indicators", False)
 
         if st.button(
             "Tout Afficher" if not st.session_state.show_all_indicators else "Réduire",
@@ -3675,6 +4362,9 @@ def _render_analytics_visualizations(df):
     Visualisations Analytiques - Graphiques interactifs pour analyser les tendances et patterns
     Matching exact style from screenshots provided by user
     """
+    # Import différé: plotly ne sert qu'à l'affichage des résultats
+    import plotly.graph_objects as go
+
     # En-tête moderne
     st.markdown(
         """
@@ -3877,6 +4567,7 @@ def _render_analytics_visualizations(df):
 
 def _render_sentiment_chart(df):
     """Graphique de distribution des sentiments"""
+    import plotly.graph_objects as go
     st.markdown("#### Distribution des Sentiments")
 
     if "sentiment" in df.columns:
@@ -3973,6 +4664,7 @@ def _render_sentiment_chart(df):
 
 def _render_reclamations_chart(df):
     """Graphique de répartition des réclamations - Style exact du screenshot"""
+    import plotly.graph_objects as go
     st.markdown("### Répartition Réclamations vs Non-Réclamations")
 
     if "is_claim" in df.columns:
@@ -4040,6 +4732,7 @@ def _render_reclamations_chart(df):
 
 def _render_urgence_chart(df):
     """Graphique de distribution des niveaux d'urgence - Style exact du screenshot"""
+    import plotly.graph_objects as go
     st.markdown("### Niveaux d'Urgence")
 
     if "urgence" in df.columns:
@@ -4150,6 +4843,7 @@ def _render_urgence_chart(df):
 
 def _render_topics_chart(df):
     """Graphique de distribution des thèmes"""
+    import plotly.express as px
     st.markdown("#### Distribution des Thèmes")
 
     if "topics" in df.columns:
@@ -4174,6 +4868,7 @@ def _render_topics_chart(df):
 
 def _render_incidents_chart(df):
     """Graphique de distribution des types d'incidents"""
+    import plotly.express as px
     st.markdown("#### Types d'Incidents")
 
     if "incident" in df.columns:
@@ -4390,6 +5085,14 @@ def _render_export_section(df, report):
             st.rerun()
 
 
+# Table de routage étape du workflow -> section (définie après les sections)
+_SECTIONS = {
+    "upload": _section_upload,
+    "classify": _section_classification,
+    "results": _section_results,
+}
+
+
 # ==============================================================================
 # POINT D'ENTRÉE
 # ==============================================================================
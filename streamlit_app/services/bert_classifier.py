@@ -105,45 +105,8 @@ class BERTClassifier:
 
         # Détection GPU avec validation de compatibilité
         gpu_available = use_gpu and torch.cuda.is_available()
-
-        # Vérifier compatibilité GPU (RTX 5060 = sm_120 non supporté PyTorch 2.5.1)
-        gpu_compatible = False
-        if gpu_available:
-            try:
-                # Obtenir la compute capability du GPU
-                compute_cap = torch.cuda.get_device_capability(0)
-                compute_cap_str = f"sm_{compute_cap[0]}{compute_cap[1]}"
-
-                # PyTorch 2.5.1 supporte : sm_50, sm_60, sm_61, sm_70, sm_75, sm_80, sm_86, sm_90
-                supported_caps = [
-                    (5, 0),
-                    (6, 0),
-                    (6, 1),
-                    (7, 0),
-                    (7, 5),
-                    (8, 0),
-                    (8, 6),
-                    (9, 0),
-                ]
-
-                if compute_cap in supported_caps:
-                    # Test complet avec une vraie opération
-                    test_tensor = torch.tensor([1.0]).cuda()
-                    result = test_tensor * 2
-                    gpu_compatible = True
-                    logger.info(f" GPU compatible détecté: {compute_cap_str}")
-                else:
-                    logger.warning(
-                        f"️  GPU {torch.cuda.get_device_name(0)} ({compute_cap_str}) non compatible - CPU utilisé"
-                    )
-                    logger.warning(
-                        f"   PyTorch 2.5.1 supporte: sm_50-90, votre GPU: {compute_cap_str}"
-                    )
-            except Exception as e:
-                logger.warning(f"️  Erreur test GPU ({e}) - Utilisation CPU")
-                gpu_compatible = False
-
-        self.device = "cpu" if not gpu_compatible else "cuda"
+        self.device = self._resolve_device(use_gpu)
+        gpu_compatible = self.device == "cuda"
 
         logger.info(f" Initialisation BERT sur {self.device.upper()}")
         if not gpu_compatible and gpu_available:
@@ -206,6 +169,89 @@ class BERTClassifier:
             else:
                 raise RuntimeError(error_msg)
 
+    @staticmethod
+    def _resolve_device(use_gpu: bool) -> str:
+        """
+        Détermine le device d'inférence ("cuda" ou "cpu")
+
+        Args:
+            use_gpu: Utiliser GPU si disponible
+
+        Returns:
+            "cuda" si un GPU compatible est détecté, sinon "cpu"
+        """
+        gpu_available = use_gpu and torch.cuda.is_available()
+
+        # Vérifier compatibilité GPU (RTX 5060 = sm_120 non supporté PyTorch 2.5.1)
+        gpu_compatible = False
+        if gpu_available:
+            try:
+                # Obtenir la compute capability du GPU
+                compute_cap = torch.cuda.get_device_capability(0)
+                compute_cap_str = f"sm_{compute_cap[0]}{compute_cap[1]}"
+
+                # PyTorch 2.5.1 supporte : sm_50, sm_60, sm_61, sm_70, sm_75, sm_80, sm_86, sm_90
+                supported_caps = [
+                    (5, 0),
+                    (6, 0),
+                    (6, 1),
+                    (7, 0),
+                    (7, 5),
+                    (8, 0),
+                    (8, 6),
+                    (9, 0),
+                ]
+
+                if compute_cap in supported_caps:
+                    # Test complet avec une vraie opération
+                    test_tensor = torch.tensor([1.0]).cuda()
+                    result = test_tensor * 2
+                    gpu_compatible = True
+                    logger.info(f" GPU compatible détecté: {compute_cap_str}")
+                else:
+                    logger.warning(
+                        f"️  GPU {torch.cuda.get_device_name(0)} ({compute_cap_str}) non compatible - CPU utilisé"
+                    )
+                    logger.warning(
+                        f"   PyTorch 2.5.1 supporte: sm_50-90, votre GPU: {compute_cap_str}"
+                    )
+            except Exception as e:
+                logger.warning(f"️  Erreur test GPU ({e}) - Utilisation CPU")
+                gpu_compatible = False
+
+        return "cuda" if gpu_compatible else "cpu"
+
+    @classmethod
+    def describe(
+        cls,
+        model_name: str = "nlptown/bert-base-multilingual-uncased-sentiment",
+        batch_size: int = 32,
+        use_gpu: bool = True,
+    ) -> Dict[str, any]:
+        """
+        Informations du modèle sans charger le tokenizer ni les poids
+
+        Mêmes clés que get_model_info(), pour les écrans de diagnostic.
+
+        Raises:
+            ImportError: Si PyTorch ou Transformers ne sont pas installés
+        """
+        if not TORCH_AVAILABLE:
+            raise ImportError(
+                "PyTorch et Transformers sont requis pour BERTClassifier. "
+                "Installation: pip install torch transformers"
+            )
+
+        return {
+            "model_name": model_name,
+            "device": cls._resolve_device(use_gpu),
+            "batch_size": batch_size,
+            "gpu_available": torch.cuda.is_available(),
+            "gpu_name": (
+                torch.cuda.get_device_name(0) if torch.cuda.is_available() else "N/A"
+            ),
+        }
+
     def predict_sentiment(self, text: str) -> Dict[str, any]:
         """
         Prédit le sentiment d'un tweet
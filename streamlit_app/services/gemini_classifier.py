@@ -16,12 +16,16 @@ Fonctionnalités:
 # Imports des bibliothèques tierces pour la manipulation de données
 from typing import List, Dict, Optional, Any  # Typage statique pour la validation
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed  # Lots en parallèle
+from functools import lru_cache  # Chargement unique du fichier .env
 import pandas as pd  # Manipulation de DataFrame pour le traitement par lot
 import json  # Parsing des réponses JSON du modèle Gemini
 import re  # Expressions régulières pour l'extraction de données structurées
 import time  # Gestion des délais entre les tentatives
 import logging  # Journalisation des opérations et erreurs
 import os  # Accès aux variables d'environnement
+import importlib  # Import différé de google-generativeai
+import importlib.util
 from pathlib import Path
 from dotenv import load_dotenv
 import streamlit as st  # Interface utilisateur et barre de progression
@@ -52,14 +56,14 @@ MAX_RETRIES = 3  # Nombre maximal de tentatives en cas d'échec de classificatio
 RETRY_DELAY_BASE = 1  # Délai de base pour backoff exponentiel (secondes)
 RETRY_DELAY_MAX = 10  # Délai maximum entre tentatives (secondes)
 TIMEOUT_SECONDS = 60  # Timeout pour les appels API (secondes)
+MAX_CONCURRENCY = 4  # Nombre maximal de lots envoyés simultanément à l'API
 
-# Import conditionnel de Google Generative AI avec gestion d'erreur gracieuse
+# Détection de Google Generative AI sans l'importer (import lourd différé au premier usage)
 try:
-    import google.generativeai as genai  # Bibliothèque cliente pour l'API Gemini
-
-    GEMINI_AVAILABLE = True  # Indicateur de disponibilité du module
-except ImportError:
-    GEMINI_AVAILABLE = False  # Désactivation si le module n'est pas installé
+    GEMINI_AVAILABLE = importlib.util.find_spec("google.generativeai") is not None
+except ModuleNotFoundError:  # Paquet parent 'google' absent
+    GEMINI_AVAILABLE = False
+if not GEMINI_AVAILABLE:
     logger.warning(
         "Module google-generativeai non disponible. Installation requise: pip install google-generativeai"
     )
@@ -104,6 +108,7 @@ class GeminiClassificationConfig:
     max_retries: int = MAX_RETRIES
     enable_preprocessing: bool = True
     response_timeout: int = TIMEOUT_SECONDS
+    max_concurrency: int = MAX_CONCURRENCY
 
 
 # Import du préprocesseur de texte avancé (PROMPT CURSOR.txt spec)
@@ -207,6 +212,7 @@ class GeminiClassifier:
             self.available = False
         else:
             try:
+                genai = _genai()  # Import différé au premier classifieur
                 genai.configure(api_key=self.api_key)
                 self.client = genai
                 self.available = True
@@ -1232,8 +1238,15 @@ IMPORTANT: Le nombre de résultats DOIT être exactement {len(tweets)} (un par t
             logger.error(f"Colonne '{text_column}' non trouvée")
             return df
 
-        # Préparation
-        tweets = df[text_column].tolist()
+        # Préparation: les doublons exacts (retweets, messages types) ne sont
+        # envoyés qu'une fois à l'API, leurs résultats sont recopiés ensuite
+        all_tweets = df[text_column].tolist()
+        tweets = list(dict.fromkeys(all_tweets))
+        if len(tweets) < len(all_tweets):
+            logger.info(
+                f"{len(all_tweets) - len(tweets)} doublons exacts: "
+                f"{len(tweets)} textes distincts envoyés à Gemini"
+            )
 
         # Pré-traitement optionnel avec TextPreprocessor (PROMPT CURSOR.txt spec)
         if self.preprocessor is not None:
@@ -1248,44 +1261,47 @@ IMPORTANT: Le nombre de résultats DOIT être exactement {len(tweets)} (un par t
         else:
             tweets_for_api = tweets
 
-        total_batches = (len(tweets_for_api) + self.batch_size - 1) // self.batch_size
-        all_results = []
+        batches = [
+            tweets_for_api[start : start + self.batch_size]
+            for start in range(0, len(tweets_for_api), self.batch_size)
+        ]
+        total_batches = len(batches)
+        batch_results: List[Optional[List[Dict]]] = [None] * total_batches
 
         # Progress bar Streamlit
         if show_progress:
             progress_bar = st.progress(0)
             status_text = st.empty()
 
-        # Traitement par lots
-        for batch_idx in range(total_batches):
-            start_idx = batch_idx * self.batch_size
-            end_idx = min(start_idx + self.batch_size, len(tweets_for_api))
-            batch_tweets = tweets_for_api[start_idx:end_idx]
-
-            # Mise à jour progress
-            if show_progress:
-                progress = (batch_idx + 1) / total_batches
-                progress_bar.progress(progress)
-                status_text.text(
-                    f"Classification Gemini: Lot {batch_idx + 1}/{total_batches} ({start_idx + 1}-{end_idx} tweets)"
-                )
-
-            # Classification du lot
-            batch_results = self.classify_batch(batch_tweets)
-            all_results.extend(batch_results)
+        # Traitement par lots: les appels API (I/O) se recouvrent, au plus
+        # max_concurrency lots en vol; classify_batch gère retries et fallback
+        with ThreadPoolExecutor(
+            max_workers=max(1, self.config.max_concurrency)
+        ) as executor:
+            futures = {
+                executor.submit(self.classify_batch, batch): batch_idx
+                for batch_idx, batch in enumerate(batches)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                batch_results[futures[future]] = future.result()
+
+                # Mise à jour progress (thread principal uniquement)
+                if show_progress:
+                    progress_bar.progress(done / total_batches)
+                    status_text.text(
+                        f"Classification Gemini: {done}/{total_batches} lots terminés"
+                    )
 
-            # Délai adaptatif entre les lots pour optimiser le débit sans surcharger l'API
-            # Délai réduit pour petits batches, augmenté pour gros volumes
-            if batch_idx < total_batches - 1:
-                # Délai adaptatif: 0.3s pour petits batches (< 10), 0.5s pour moyens, 1s pour gros (> 50)
-                adaptive_delay = (
-                    0.3 if total_batches < 10 else (0.5 if total_batches < 50 else 1.0)
-                )
-                time.sleep(adaptive_delay)
+        all_results = [result for batch in batch_results for result in batch]
 
         # Renforcer la cohérence des résultats avec le texte original (non nettoyé)
         all_results = self._apply_quality_guards(tweets, all_results)
 
+        # Redistribuer les résultats sur toutes les lignes, doublons compris
+        if len(tweets) < len(all_tweets):
+            result_by_text = dict(zip(tweets, all_results))
+            all_results = [result_by_text[t] for t in all_tweets]
+
         # Nettoyage UI avec delay pour stabilité DOM
         if show_progress:
             time.sleep(0.1)
@@ -1367,6 +1383,37 @@ IMPORTANT: Le nombre de résultats DOIT être exactement {len(tweets)} (un par t
 
 
 # Fonctions utilitaires
+@lru_cache(maxsize=1)
+def _genai():
+    """Importe google.generativeai au premier appel (bibliothèque cliente Gemini)."""
+    return importlib.import_module("google.generativeai")
+
+
+@lru_cache(maxsize=1)
+def _load_env_once() -> Optional[Path]:
+    """
+    Charge le fichier .env une seule fois par processus (recherche multi-niveaux).
+
+    Returns:
+        Chemin du fichier chargé, ou None si chargé depuis le répertoire courant
+    """
+    env_paths = [
+        Path(__file__).parent.parent.parent / ".env",  # Racine projet
+        Path(__file__).parent.parent.parent.parent / ".env",  # Workspace parent
+        Path.cwd() / ".env",  # Répertoire courant
+    ]
+
+    for env_path in env_paths:
+        if env_path.exists():
+            load_dotenv(env_path, override=True)
+            logger.debug(f"Fichier .env chargé depuis: {env_path}")
+            return env_path
+
+    # Essayer de charger depuis le répertoire courant
+    load_dotenv(override=True)
+    return None
+
+
 def check_gemini_availability() -> bool:
     """
     Vérifie si l'API Gemini est disponible et configurée avec validation
@@ -1379,24 +1426,8 @@ def check_gemini_availability() -> bool:
         return False
 
     try:
-        # Recherche multi-niveaux du fichier .env
-        env_paths = [
-            Path(__file__).parent.parent.parent / ".env",  # Racine projet
-            Path(__file__).parent.parent.parent.parent / ".env",  # Workspace parent
-            Path.cwd() / ".env",  # Répertoire courant
-        ]
-
-        env_loaded = False
-        for env_path in env_paths:
-            if env_path.exists():
-                load_dotenv(env_path, override=True)
-                logger.debug(f"Fichier .env chargé depuis: {env_path}")
-                env_loaded = True
-                break
-
-        if not env_loaded:
-            # Essayer de charger depuis le répertoire courant
-            load_dotenv(override=True)
+        # Fichier .env lu au premier appel uniquement
+        _load_env_once()
 
         # Chercher la clé API dans plusieurs variables d'environnement
         api_key = (
@@ -1424,6 +1455,7 @@ def check_gemini_availability() -> bool:
 
         # Validation réelle de la clé en testant une requête simple
         try:
+            genai = _genai()
             genai.configure(api_key=api_key)
             # Test simple avec un modèle pour valider la clé
             model = genai.GenerativeModel("gemini-pro")
@@ -14,6 +14,7 @@ Fonctionnalités:
 
 # Imports des bibliothèques tierces pour la manipulation de données
 from typing import List, Dict, Optional, Any  # Typage statique pour la validation
+from functools import lru_cache  # Client Ollama partagé par hôte
 import pandas as pd  # Manipulation de DataFrame pour le traitement par lot
 import json  # Parsing des réponses JSON du modèle Mistral
 import re  # Expressions régulières pour l'extraction de données structurées
@@ -70,6 +71,18 @@ except ImportError:
     )
 
 
+@lru_cache(maxsize=None)
+def _ollama_client(host: str) -> "ollama.Client":
+    """
+    Client Ollama partagé par hôte
+
+    Toutes les instances de MistralClassifier (y compris celles lancées en
+    parallèle par l'orchestrateur) réutilisent le même pool de connexions
+    HTTP keep-alive au lieu d'en ouvrir un par instance.
+    """
+    return ollama.Client(host=host)
+
+
 class MistralClassifier:
     """
     Classificateur de tweets utilisant le modèle Mistral via Ollama
@@ -111,6 +124,14 @@ class MistralClassifier:
             "top_p": 0.9,  # Échantillonnage nucléaire pour équilibrer créativité et cohérence
         }
 
+        # Client HTTP partagé (connexions keep-alive réutilisées par tous les
+        # lots), pointant sur le même serveur que la vérification de connexion
+        self.client = (
+            _ollama_client(os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"))
+            if OLLAMA_AVAILABLE
+            else None
+        )
+
         # Vérification de la disponibilité et de la connexion au serveur Ollama
         self._check_ollama_connection()
 
@@ -290,7 +311,7 @@ FORMAT STRICT (aucun texte avant/après):
             )
 
             # Envoi de la requête au modèle Mistral via l'API Ollama
-            response = ollama.generate(
+            response = self.client.generate(
                 model=self.model_name,  # Sélection du modèle (mistral, llama2, etc.)
                 prompt=prompt,  # Prompt construit avec taxonomie et exemples
                 options=self.ollama_options,  # Paramètres de génération (température, tokens, etc.)
@@ -643,14 +664,11 @@ FORMAT STRICT (aucun texte avant/après):
                     f"Classification: Lot {batch_idx + 1}/{total_batches} ({start_idx + 1}-{end_idx} tweets)"
                 )
 
-            # Classification du lot
+            # Classification du lot (Ollama met lui-même les requêtes en file,
+            # aucun délai n'est nécessaire entre deux lots)
             batch_results = self.classify_batch(batch_tweets)
             all_results.extend(batch_results)
 
-            # Petit délai entre les lots pour ne pas surcharger Ollama
-            if batch_idx < total_batches - 1:
-                time.sleep(0.5)
-
         # Nettoyage UI avec delay pour stabilité DOM
         if show_progress:
             time.sleep(0.1)
@@ -14,6 +14,7 @@ Fonctionnalités:
 
 # Imports pour la manipulation de types et de données
 from typing import (
+    Callable,
     Tuple,
     Dict,
     List,
@@ -40,6 +41,9 @@ PUNCTUATION_PATTERN = (
 )
 WHITESPACE_PATTERN = r"\s+"  # Normalisation des espaces multiples en espace unique
 
+# Taille des blocs nettoyés entre deux notifications de progression
+CLEAN_CHUNK_SIZE = 50_000
+
 
 DEFAULT_DOMAIN_KEYWORDS = [
     "free",
@@ -245,7 +249,11 @@ class TweetCleaner:
         return cleaned
 
     def process_dataframe(
-        self, df: pd.DataFrame, text_column: str = "text"
+        self,
+        df: pd.DataFrame,
+        text_column: str = "text",
+        progress_callback: Optional[Callable[[float], None]] = None,
+        chunk_size: int = CLEAN_CHUNK_SIZE,
     ) -> Tuple[pd.DataFrame, Dict]:
         """
         Pipeline complet de nettoyage
@@ -256,6 +264,9 @@ class TweetCleaner:
         Args:
             df: DataFrame brut
             text_column: Colonne à nettoyer
+            progress_callback: Appelée avec la fraction (0 à 1) de textes
+                nettoyés après chaque bloc de chunk_size lignes
+            chunk_size: Nombre de textes nettoyés par bloc
 
         Returns:
             (df_cleaned, stats_dict) - DataFrame nettoyé et statistiques
@@ -304,10 +315,23 @@ class TweetCleaner:
         else:
             stats["avg_length_before"] = 0.0
 
-        # 4. Nettoyage du texte
-        df_clean[f"{text_column}_cleaned"] = df_clean[text_column].apply(
-            self.clean_text
-        )
+        # 4. Nettoyage du texte (par blocs si la progression est suivie)
+        if progress_callback is None:
+            df_clean[f"{text_column}_cleaned"] = df_clean[text_column].apply(
+                self.clean_text
+            )
+        else:
+            texts = df_clean[text_column]
+            total = len(texts)
+            cleaned_parts = []
+            for start in range(0, total, chunk_size):
+                cleaned_parts.append(
+                    texts.iloc[start : start + chunk_size].apply(self.clean_text)
+                )
+                progress_callback(min(start + chunk_size, total) / total)
+            df_clean[f"{text_column}_cleaned"] = (
+                pd.concat(cleaned_parts) if cleaned_parts else texts.astype(str)
+            )
 
         # 5. Calcul de la longueur moyenne après nettoyage
         if len(df_clean) > 0:
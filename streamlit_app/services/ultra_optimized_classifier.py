@@ -49,10 +49,11 @@ import hashlib
 import pickle
 import json
 import logging
+import threading
 from pathlib import Path
 from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 import warnings
 
 warnings.filterwarnings("ignore")
@@ -123,6 +124,17 @@ class BenchmarkMetrics:
         return report
 
 
+@dataclass
+class RunStats:
+    """Compteurs d'un appel à classify_tweets_batch (propres à chaque run)"""
+
+    cache_hits: int = 0
+    cache_misses: int = 0
+    errors_count: int = 0
+    phase_times: Dict[str, float] = field(default_factory=dict)
+    batches_processed: int = 0
+
+
 @dataclass
 class BatchResult:
     """Résultat d'un batch traité"""
@@ -181,17 +193,13 @@ class UltraOptimizedClassifier:
         self.max_workers = max_workers
         self.enable_logging = enable_logging
 
-        # Statistics tracking
-        self.cache_hits = 0
-        self.cache_misses = 0
-        self.errors_count = 0
-        self.phase_times = {}
-        self.batches_processed = 0
-
-        # Models (lazy loading)
+        # Models (lazy loading). The instance is shared across Streamlit
+        # sessions (st.cache_resource): loaders are serialised by a lock and
+        # per-run statistics live in a RunStats owned by each call
         self._bert = None
         self._rules = None
         self._mistral = None
+        self._load_lock = threading.Lock()
 
         if self.enable_logging:
             logger.info(f" UltraOptimizedClassifier initialized")
@@ -208,43 +216,51 @@ class UltraOptimizedClassifier:
     def bert(self):
         """Lazy load BERT classifier"""
         if self._bert is None:
-            try:
-                from services.bert_classifier import BERTClassifier
-
-                self._bert = BERTClassifier(batch_size=64, use_gpu=True)
-                logger.info(f" BERT loaded on {self._bert.device}")
-            except Exception as e:
-                logger.error(f" BERT loading failed: {e}")
-                raise RuntimeError(f"Cannot load BERT: {e}")
+            with self._load_lock:
+                if self._bert is None:
+                    try:
+                        from services.bert_classifier import BERTClassifier
+
+                        self._bert = BERTClassifier(batch_size=64, use_gpu=True)
+                        logger.info(f" BERT loaded on {self._bert.device}")
+                    except Exception as e:
+                        logger.error(f" BERT loading failed: {e}")
+                        raise RuntimeError(f"Cannot load BERT: {e}")
         return self._bert
 
     @property
     def rules(self):
         """Lazy load Rules classifier"""
         if self._rules is None:
-            try:
-                from services.rule_classifier import EnhancedRuleClassifier
-
-                self._rules = EnhancedRuleClassifier()
-                logger.info(" Rules classifier loaded")
-            except Exception as e:
-                logger.error(f" Rules loading failed: {e}")
-                raise RuntimeError(f"Cannot load Rules: {e}")
+            with self._load_lock:
+                if self._rules is None:
+                    try:
+                        from services.rule_classifier import EnhancedRuleClassifier
+
+                        self._rules = EnhancedRuleClassifier()
+                        logger.info(" Rules classifier loaded")
+                    except Exception as e:
+                        logger.error(f" Rules loading failed: {e}")
+                        raise RuntimeError(f"Cannot load Rules: {e}")
         return self._rules
 
     @property
     def mistral(self):
         """Lazy load Mistral classifier"""
         if self._mistral is None:
-            try:
-                from services.mistral_classifier import MistralClassifier
+            with self._load_lock:
+                if self._mistral is None:
+                    try:
+                        from services.mistral_classifier import MistralClassifier
 
-                self._mistral = MistralClassifier(batch_size=50, temperature=0.1)
-                logger.info(" Mistral loaded")
-            except Exception as e:
-                logger.warning(f"️ Mistral loading failed: {e}")
-                logger.warning("   Continuing without Mistral (FAST mode only)")
-                self._mistral = None
+                        self._mistral = MistralClassifier(
+                            batch_size=50, temperature=0.1
+                        )
+                        logger.info(" Mistral loaded")
+                    except Exception as e:
+                        logger.warning(f"️ Mistral loading failed: {e}")
+                        logger.warning("   Continuing without Mistral (FAST mode only)")
+                        self._mistral = None
         return self._mistral
 
     # ═════════════════════════════════════════════════════════
@@ -256,7 +272,7 @@ class UltraOptimizedClassifier:
         content = f"{model}:v2:{text}"  # v2 to invalidate old cache
         return hashlib.md5(content.encode("utf-8")).hexdigest()
 
-    def _get_from_cache(self, key: str) -> Optional[Dict]:
+    def _get_from_cache(self, key: str, stats: RunStats) -> Optional[Dict]:
         """Retrieve from disk cache"""
         if not self.use_cache:
             return None
@@ -265,12 +281,13 @@ class UltraOptimizedClassifier:
         if cache_file.exists():
             try:
                 with open(cache_file, "rb") as f:
-                    self.cache_hits += 1
-                    return pickle.load(f)
+                    value = pickle.load(f)
+                stats.cache_hits += 1
+                return value
             except Exception as e:
                 logger.warning(f"Cache read error for {key}: {e}")
 
-        self.cache_misses += 1
+        stats.cache_misses += 1
         return None
 
     def _save_to_cache(self, key: str, value: Dict):
@@ -279,9 +296,12 @@ class UltraOptimizedClassifier:
             return
 
         cache_file = self.cache_dir / f"{key}.pkl"
+        # Write-then-rename: a concurrent run never reads a partial pickle
+        tmp_file = cache_file.with_suffix(f".{threading.get_ident()}.tmp")
         try:
-            with open(cache_file, "wb") as f:
+            with open(tmp_file, "wb") as f:
                 pickle.dump(value, f)
+            tmp_file.replace(cache_file)
         except Exception as e:
             logger.warning(f"Cache write error for {key}: {e}")
 
@@ -300,7 +320,7 @@ class UltraOptimizedClassifier:
         return batches
 
     def _process_batch_bert(
-        self, batch: pd.DataFrame, text_column: str
+        self, batch: pd.DataFrame, text_column: str, stats: RunStats
     ) -> pd.DataFrame:
         """
         Process batch with BERT
@@ -316,7 +336,7 @@ class UltraOptimizedClassifier:
 
         for idx, text in enumerate(texts):
             cache_key = self._get_cache_key(text, "bert")
-            cached = self._get_from_cache(cache_key)
+            cached = self._get_from_cache(cache_key, stats)
 
             if cached:
                 results_sentiment.append(cached["sentiment"])
@@ -348,7 +368,7 @@ class UltraOptimizedClassifier:
                     )
             except Exception as e:
                 logger.error(f"BERT batch error: {e}")
-                self.errors_count += 1
+                stats.errors_count += 1
                 # Fill with defaults
                 for batch_idx in uncached_indices:
                     results_sentiment[batch_idx] = "neutre"
@@ -360,7 +380,7 @@ class UltraOptimizedClassifier:
         return result
 
     def _process_batch_rules(
-        self, batch: pd.DataFrame, text_column: str
+        self, batch: pd.DataFrame, text_column: str, stats: RunStats
     ) -> pd.DataFrame:
         """
         Process batch with Rules
@@ -380,7 +400,7 @@ class UltraOptimizedClassifier:
             return result
         except Exception as e:
             logger.error(f"Rules batch error: {e}")
-            self.errors_count += 1
+            stats.errors_count += 1
             # Defaults
             result = batch.copy()
             result["is_claim"] = "non"
@@ -390,7 +410,7 @@ class UltraOptimizedClassifier:
             return result
 
     def _process_batch_mistral(
-        self, batch: pd.DataFrame, text_column: str
+        self, batch: pd.DataFrame, text_column: str, stats: RunStats
     ) -> pd.DataFrame:
         """
         Process batch with Mistral
@@ -402,7 +422,7 @@ class UltraOptimizedClassifier:
 
         for idx, text in enumerate(texts):
             cache_key = self._get_cache_key(text, "mistral")
-            cached = self._get_from_cache(cache_key)
+            cached = self._get_from_cache(cache_key, stats)
 
             if cached:
                 results_confidence.append(cached["confidence"])
@@ -436,7 +456,7 @@ class UltraOptimizedClassifier:
                         uncached_idx += 1
             except Exception as e:
                 logger.error(f"Mistral batch error: {e}")
-                self.errors_count += 1
+                stats.errors_count += 1
                 # Fill remaining with default
                 for i in range(len(results_confidence)):
                     if results_confidence[i] is None:
@@ -482,6 +502,8 @@ class UltraOptimizedClassifier:
         """
         start_time = time.time()
         total_tweets = len(df)
+        # Per-run statistics: the instance may serve several sessions at once
+        stats = RunStats()
 
         logger.info("=" * 80)
         logger.info(f" CLASSIFICATION ULTRA-OPTIMISÉE")
@@ -517,9 +539,9 @@ class UltraOptimizedClassifier:
                     f"Phase 1/4: BERT batch {batch_idx+1}/{num_batches}", pct
                 )
 
-            batch_result = self._process_batch_bert(batch, text_column)
+            batch_result = self._process_batch_bert(batch, text_column, stats)
             bert_results.append(batch_result)
-            self.batches_processed += 1
+            stats.batches_processed += 1
 
         # Merge
         bert_combined = pd.concat(bert_results, ignore_index=False)
@@ -527,7 +549,7 @@ class UltraOptimizedClassifier:
         results["bert_confidence"] = bert_combined["bert_confidence"]
 
         phase1_time = time.time() - phase1_start
-        self.phase_times["phase1_bert"] = phase1_time
+        stats.phase_times["phase1_bert"] = phase1_time
         logger.info(
             f" Phase 1 completed: {total_tweets} tweets in {phase1_time:.1f}s ({total_tweets/phase1_time:.1f} tweets/s)"
         )
@@ -544,7 +566,7 @@ class UltraOptimizedClassifier:
 
         rules_results = []
         for batch in batches:
-            batch_result = self._process_batch_rules(batch, text_column)
+            batch_result = self._process_batch_rules(batch, text_column, stats)
             rules_results.append(batch_result)
 
         # Merge
@@ -555,7 +577,7 @@ class UltraOptimizedClassifier:
         results["incident"] = rules_combined["incident"]
 
         phase2_time = time.time() - phase2_start
-        self.phase_times["phase2_rules"] = phase2_time
+        stats.phase_times["phase2_rules"] = phase2_time
         logger.info(
             f" Phase 2 completed: {total_tweets} tweets in {phase2_time:.1f}s ({total_tweets/phase2_time:.1f} tweets/s)"
         )
@@ -594,7 +616,7 @@ class UltraOptimizedClassifier:
                         pct,
                     )
 
-                batch_result = self._process_batch_mistral(batch, text_column)
+                batch_result = self._process_batch_mistral(batch, text_column, stats)
                 mistral_results.append(batch_result)
 
             # Merge Mistral results
@@ -624,7 +646,7 @@ class UltraOptimizedClassifier:
                         f"Phase 3/4: Mistral batch {batch_idx+1}/{num_batches}", pct
                     )
 
-                batch_result = self._process_batch_mistral(batch, text_column)
+                batch_result = self._process_batch_mistral(batch, text_column, stats)
                 mistral_results.append(batch_result)
 
             mistral_combined = pd.concat(mistral_results, ignore_index=False)
@@ -635,7 +657,7 @@ class UltraOptimizedClassifier:
             results["confidence"] = results["bert_confidence"]
 
         phase3_time = time.time() - phase3_start
-        self.phase_times["phase3_mistral"] = phase3_time
+        stats.phase_times["phase3_mistral"] = phase3_time
         logger.info(f" Phase 3 completed in {phase3_time:.1f}s")
 
         # ═══════════════════════════════════════════════════════════
@@ -677,7 +699,7 @@ class UltraOptimizedClassifier:
         results = results.drop(columns=temp_cols, errors="ignore")
 
         phase4_time = time.time() - phase4_start
-        self.phase_times["phase4_finalization"] = phase4_time
+        stats.phase_times["phase4_finalization"] = phase4_time
 
         # ═══════════════════════════════════════════════════════════
         # BENCHMARK METRICS
@@ -694,9 +716,9 @@ class UltraOptimizedClassifier:
             memory_mb = 0.0
 
         # Cache hit rate
-        total_cache_ops = self.cache_hits + self.cache_misses
+        total_cache_ops = stats.cache_hits + stats.cache_misses
         cache_hit_rate = (
-            (self.cache_hits / total_cache_ops * 100) if total_cache_ops > 0 else 0.0
+            (stats.cache_hits / total_cache_ops * 100) if total_cache_ops > 0 else 0.0
         )
 
         metrics = BenchmarkMetrics(
@@ -705,11 +727,11 @@ class UltraOptimizedClassifier:
             tweets_per_second=total_tweets / total_time if total_time > 0 else 0,
             memory_mb=memory_mb,
             cache_hit_rate_percent=cache_hit_rate,
-            cache_hits=self.cache_hits,
-            cache_misses=self.cache_misses,
-            phase_times=self.phase_times,
-            batches_processed=self.batches_processed,
-            errors_count=self.errors_count,
+            cache_hits=stats.cache_hits,
+            cache_misses=stats.cache_misses,
+            phase_times=stats.phase_times,
+            batches_processed=stats.batches_processed,
+            errors_count=stats.errors_count,
             mode=mode,
         )
 
@@ -720,7 +742,7 @@ class UltraOptimizedClassifier:
         logger.info(f"   ├─ Vitesse: {metrics.tweets_per_second:.1f} tweets/s")
         logger.info(f"   ├─ Mémoire: {memory_mb:.1f} MB")
         logger.info(f"   ├─ Cache hit: {cache_hit_rate:.1f}%")
-        logger.info(f"   └─ Erreurs: {self.errors_count}")
+        logger.info(f"   └─ Erreurs: {stats.errors_count}")
         logger.info("=" * 80)
 
         if progress_callback:
@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
+from uuid import uuid4
 
 import pandas as pd
 import requests
@@ -316,6 +317,23 @@ class InMemoryUploadedFile(io.BytesIO):
         self.size = len(content)
 
 
+class LocalUploadedFile(io.FileIO):
+    """Fichier sur disque mimant un UploadedFile Streamlit (import distant streamé)."""
+
+    def __init__(self, path: Union[str, Path], name: str, mime_type: str = "text/csv"):
+        super().__init__(str(path), "rb")
+        self.name = name
+        self.type = mime_type
+        self.mime_type = mime_type
+        self.size = os.path.getsize(path)
+        # Identifiant unique (chemin horodaté) pour les caches par fichier
+        self.file_id = str(path)
+
+
+# Taille des blocs lus sur le réseau lors d'un import distant streamé
+REMOTE_CHUNK_SIZE = 1 << 16
+
+
 def fetch_remote_dataset(
     url: str,
     method: str = "GET",
@@ -323,10 +341,15 @@ def fetch_remote_dataset(
     payload: Optional[Union[str, Dict[str, Any]]] = None,
     timeout: int = 15,
     max_size_mb: int = 500,
+    dest_dir: Optional[Union[str, Path]] = None,
 ) -> Dict[str, Any]:
     """
     Récupère un fichier CSV distant (API/URL) et renvoie un fichier en mémoire.
 
+    Avec ``dest_dir``, la réponse est streamée directement sur disque par blocs
+    de REMOTE_CHUNK_SIZE octets (la taille est contrôlée pendant le transfert)
+    et le fichier renvoyé est un LocalUploadedFile ouvert sur ce fichier.
+
     Args:
         url: Lien HTTP/HTTPS du fichier ou endpoint API.
         method: Méthode HTTP (GET/POST).
@@ -334,9 +357,11 @@ def fetch_remote_dataset(
         payload: Corps de requête pour POST (dict ou JSON string).
         timeout: Timeout en secondes.
         max_size_mb: Taille maximale autorisée.
+        dest_dir: Dossier où écrire le fichier au fil du téléchargement.
 
     Returns:
-        Dict contenant le contenu, le nom détecté et un objet InMemoryUploadedFile.
+        Dict contenant le contenu (ou le chemin ``path`` si streamé), le nom
+        détecté et un objet InMemoryUploadedFile / LocalUploadedFile.
 
     Raises:
         ValueError / RequestException si la récupération échoue.
@@ -372,11 +397,15 @@ def fetch_remote_dataset(
             json=data if isinstance(data, dict) else None,
             data=None if isinstance(data, dict) else data,
             timeout=timeout,
+            stream=dest_dir is not None,
         )
         response.raise_for_status()
     except RequestException as exc:
         raise ValueError(f"Erreur lors de l'appel distant: {exc}") from exc
 
+    if dest_dir is not None:
+        return _stream_remote_dataset(response, url, parsed.path, dest_dir, max_size_mb)
+
     content = response.content
     size_mb = len(content) / (1024 * 1024)
     if size_mb > max_size_mb:
@@ -385,9 +414,7 @@ def fetch_remote_dataset(
         )
 
     content_type = response.headers.get("Content-Type", "text/csv").split(";")[0]
-    filename = os.path.basename(parsed.path) or "remote_dataset.csv"
-    if not filename.lower().endswith(".csv"):
-        filename = f"{filename}.csv"
+    filename = _remote_filename(parsed.path)
 
     memory_file = InMemoryUploadedFile(content, filename, content_type)
     return {
@@ -400,6 +427,66 @@ def fetch_remote_dataset(
     }
 
 
+def _remote_filename(url_path: str) -> str:
+    """Nom de fichier CSV déduit du chemin de l'URL."""
+    filename = os.path.basename(url_path) or "remote_dataset.csv"
+    if not filename.lower().endswith(".csv"):
+        filename = f"{filename}.csv"
+    return filename
+
+
+def _stream_remote_dataset(
+    response: requests.Response,
+    url: str,
+    url_path: str,
+    dest_dir: Union[str, Path],
+    max_size_mb: int,
+) -> Dict[str, Any]:
+    """Écrit une réponse streamée sur disque en bornant sa taille."""
+    max_bytes = max_size_mb * 1024 * 1024
+    too_large = ValueError(f"Fichier trop volumineux. Limite: {max_size_mb} MB.")
+
+    declared = response.headers.get("Content-Length")
+    if declared and declared.isdigit() and int(declared) > max_bytes:
+        response.close()
+        raise too_large
+
+    content_type = response.headers.get("Content-Type", "text/csv").split(";")[0]
+    filename = _remote_filename(url_path)
+
+    base_path = Path(dest_dir)
+    base_path.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    # Suffixe aléatoire: deux imports dans la même seconde ne s'écrasent pas
+    target_path = (
+        base_path / f"{timestamp}_{uuid4().hex[:8]}_{clean_filename(filename)}"
+    )
+
+    # Aucun fichier partiel ne reste sur disque, quelle que soit l'erreur
+    # (limite dépassée, coupure réseau, disque plein...)
+    try:
+        with response, target_path.open("wb") as target:
+            for chunk in response.iter_content(chunk_size=REMOTE_CHUNK_SIZE):
+                target.write(chunk)
+                if target.tell() > max_bytes:
+                    raise too_large
+    except RequestException as exc:
+        target_path.unlink(missing_ok=True)
+        raise ValueError(f"Erreur lors de l'appel distant: {exc}") from exc
+    except BaseException:
+        target_path.unlink(missing_ok=True)
+        raise
+
+    return {
+        "path": target_path,
+        "filename": filename,
+        "mime_type": content_type,
+        "size": target_path.stat().st_size,
+        "uploaded_file": LocalUploadedFile(target_path, filename, content_type),
+        "source_url": url,
+    }
+
+
 def persist_remote_dataset(
     dataset: Dict[str, Any],
     base_dir: Union[str, Path] = "uploads/remote",
@@ -407,6 +494,9 @@ def persist_remote_dataset(
     """
     Persist a remotely fetched dataset to disk for audit trail purposes.
 
+    Datasets streamed with ``dest_dir`` are already on disk: only the
+    manifest entry is written for them.
+
     Args:
         dataset: Dict returned by fetch_remote_dataset.
         base_dir: Directory where files should be stored.
@@ -420,15 +510,20 @@ def persist_remote_dataset(
 
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     filename = clean_filename(dataset.get("filename", "remote_dataset.csv"))
-    target_path = base_path / f"{timestamp}_{filename}"
-    content: bytes = dataset.get("content", b"")
-    target_path.write_bytes(content)
+    if dataset.get("path"):
+        target_path = Path(dataset["path"])
+        size_bytes = dataset.get("size", target_path.stat().st_size)
+    else:
+        target_path = base_path / f"{timestamp}_{filename}"
+        content: bytes = dataset.get("content", b"")
+        target_path.write_bytes(content)
+        size_bytes = len(content)
 
     manifest_entry = {
         "timestamp": timestamp,
         "filename": filename,
         "saved_path": str(target_path),
-        "size_bytes": len(content),
+        "size_bytes": size_bytes,
         "source_url": dataset.get("source_url"),
         "mime_type": dataset.get("mime_type"),
     }
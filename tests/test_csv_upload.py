@@ -0,0 +1,100 @@
+"""
+Tests de lecture des CSV uploadés (pages/Classification_Mistral.py)
+===================================================================
+
+Couvre la détection du séparateur (_sniff_delimiter) et la lecture stricte
+puis tolérante (_read_csv) sur des fichiers en mémoire, comme les
+UploadedFile Streamlit (BytesIO).
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+STREAMLIT_ROOT = PROJECT_ROOT / "streamlit_app"
+sys.path.insert(0, str(STREAMLIT_ROOT))
+
+import pages.Classification_Mistral as page  # noqa: E402
+
+
+def _upload(text: str) -> io.BytesIO:
+    return io.BytesIO(text.encode("utf-8"))
+
+
+@pytest.mark.parametrize("sep", [";", "|"])
+def test_single_text_column_containing_separator_stays_comma(sep):
+    text = "text\n" + "".join(
+        f"message {i}{sep} la box est en panne\n" for i in range(300)
+    )
+
+    assert page._sniff_delimiter(_upload(text), "utf-8") == ","
+
+    df = page._read_csv(_upload(text), "utf-8")
+    assert list(df.columns) == ["text"]
+    assert len(df) == 300
+    assert df["text"].iloc[0] == f"message 0{sep} la box est en panne"
+
+
+def test_semicolon_file_is_split_on_semicolons():
+    text = "id;text;date\n1;panne fibre;2024-01-01\n2;box lente;2024-01-02\n"
+
+    assert page._sniff_delimiter(_upload(text), "utf-8") == ";"
+
+    df = page._read_csv(_upload(text), "utf-8")
+    assert list(df.columns) == ["id", "text", "date"]
+    assert df["text"].tolist() == ["panne fibre", "box lente"]
+
+
+def test_quoted_commas_stay_inside_the_field():
+    text = 'id,text\n1,"bonjour, ma box, en panne"\n2,"ok, merci"\n'
+
+    assert page._sniff_delimiter(_upload(text), "utf-8") == ","
+
+    df = page._read_csv(_upload(text), "utf-8")
+    assert df["text"].tolist() == ["bonjour, ma box, en panne", "ok, merci"]
+
+
+def test_sniffing_keeps_the_read_position():
+    upload = _upload("id;text\n1;a\n")
+    upload.seek(3)
+
+    page._sniff_delimiter(upload, "utf-8")
+
+    assert upload.tell() == 3
+
+
+def test_malformed_row_falls_back_to_skip_pass(monkeypatch):
+    calls = []
+    read_csv = pd.read_csv
+
+    def spy(*args, **kwargs):
+        calls.append(kwargs.get("on_bad_lines", "error"))
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(page.pd, "read_csv", spy)
+    text = "id,text\n1,panne\n2,box,colonne en trop\n3,merci\n"
+
+    df = page._read_csv(_upload(text), "utf-8")
+
+    assert calls == ["error", "skip"]
+    assert df["id"].tolist() == [1, 3]
+
+
+def test_well_formed_file_is_read_strictly_once(monkeypatch):
+    calls = []
+    read_csv = pd.read_csv
+
+    def spy(*args, **kwargs):
+        calls.append(kwargs.get("on_bad_lines", "error"))
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(page.pd, "read_csv", spy)
+
+    df = page._read_csv(_upload("id,text\n1,panne\n2,merci\n"), "utf-8")
+
+    assert calls == ["error"]
+    assert df["id"].dtype == "int8"
@@ -0,0 +1,142 @@
+"""
+Tests du classificateur de secours vectorisé (pages/Classification_Mistral.py)
+=============================================================================
+
+_classify_fallback teste les mots-clés par groupes vectorisés: ses résultats
+doivent être identiques à ceux de la version d'origine ligne à ligne
+(reproduite ci-dessous) sur des tweets aléatoires mêlant les mots-clés.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+STREAMLIT_ROOT = PROJECT_ROOT / "streamlit_app"
+sys.path.insert(0, str(STREAMLIT_ROOT))
+
+import pages.Classification_Mistral as page  # noqa: E402
+
+KPI_COLUMNS = ["is_claim", "sentiment", "urgence", "topics", "incident", "confidence"]
+
+KEYWORDS = [
+    "panne",
+    "@free",
+    "problème",
+    "bug",
+    "merci",
+    "super",
+    "bravo",
+    "excellent",
+    "nul",
+    "mauvais",
+    "honte",
+    "urgent",
+    "critique",
+    "fibre",
+    "mobile",
+    "facture",
+]
+FILLERS = ["la box", "depuis hier", "ce soir", "encore", "!!", "?", "et", "svp"]
+
+
+def _reference_classify_fallback(df, text_col):
+    """Version d'origine, appliquée ligne à ligne."""
+    df_copy = df.copy()
+
+    def classify_row(text):
+        t = str(text).lower()
+
+        is_claim = (
+            "oui"
+            if any(w in t for w in ["panne", "@free", "problème", "bug"])
+            else "non"
+        )
+
+        if any(w in t for w in ["merci", "super", "bravo", "excellent"]):
+            sentiment = "positif"
+        elif any(w in t for w in ["panne", "nul", "mauvais", "honte"]):
+            sentiment = "negatif"
+        else:
+            sentiment = "neutre"
+
+        urgence = (
+            "haute"
+            if any(w in t for w in ["panne", "urgent", "critique"])
+            else "moyenne" if is_claim == "oui" else "faible"
+        )
+
+        topics = (
+            "fibre"
+            if "fibre" in t
+            else "mobile" if "mobile" in t else "facture" if "facture" in t else "autre"
+        )
+
+        incident = (
+            "incident_reseau"
+            if "panne" in t
+            else "facturation" if "facture" in t else "autre"
+        )
+
+        return pd.Series(
+            {
+                "is_claim": is_claim,
+                "sentiment": sentiment,
+                "urgence": urgence,
+                "topics": topics,
+                "incident": incident,
+                "confidence": 0.75,
+            }
+        )
+
+    classifications = df_copy[text_col].apply(classify_row)
+    return pd.concat([df_copy, classifications], axis=1)
+
+
+def _random_tweet(rng):
+    words = list(rng.choice(FILLERS, size=rng.integers(0, 4)))
+    for word in rng.choice(KEYWORDS, size=rng.integers(0, 4)):
+        # Casse variable et mots-clés collés à d'autres mots (« PANNEs »)
+        word = word.upper() if rng.random() < 0.3 else word
+        words.append(word + "s" if rng.random() < 0.2 else word)
+    rng.shuffle(words)
+    return " ".join(words)
+
+
+def _random_frame(seed, rows=3000):
+    rng = np.random.default_rng(seed)
+    texts = [_random_tweet(rng) for _ in range(rows)]
+    # Valeurs manquantes et non textuelles, comme dans un CSV réel
+    texts[::97] = [None] * len(texts[::97])
+    texts[5::131] = [float("nan")] * len(texts[5::131])
+    texts[7::149] = [42] * len(texts[7::149])
+    return pd.DataFrame(
+        {"text": np.array(texts, dtype=object), "author": np.arange(rows)},
+        index=rng.permutation(rows * 10)[:rows],
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_vectorized_fallback_matches_row_by_row(seed):
+    df = _random_frame(seed)
+
+    expected = _reference_classify_fallback(df, "text")
+    result = page._classify_fallback(df, "text")
+
+    assert result.columns.tolist() == expected.columns.tolist()
+    pd.testing.assert_frame_equal(
+        result[KPI_COLUMNS].astype(object), expected[KPI_COLUMNS].astype(object)
+    )
+    pd.testing.assert_frame_equal(result[["text", "author"]], df)
+
+
+def test_fallback_leaves_input_untouched():
+    df = _random_frame(3, rows=50)
+    snapshot = df.copy()
+
+    page._classify_fallback(df, "text")
+
+    pd.testing.assert_frame_equal(df, snapshot)
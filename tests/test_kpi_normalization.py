@@ -0,0 +1,163 @@
+"""
+Tests de normalisation des champs KPI (pages/Classification_Mistral.py)
+======================================================================
+
+Couvre l'inférence vectorisée de _normalize_kpi_fields pour les urgences et
+incidents invalides, sur un index non contigu comme après un filtrage: les
+valeurs inférées doivent rester alignées sur leurs lignes.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+STREAMLIT_ROOT = PROJECT_ROOT / "streamlit_app"
+sys.path.insert(0, str(STREAMLIT_ROOT))
+
+import pages.Classification_Mistral as page  # noqa: E402
+
+# Index à trous et non trié
+INDEX = [10, 3, 57, 8, 91, 24, 40]
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "sentiment": [
+                "negative",
+                "positif",
+                "neutre",
+                "NEG",
+                "negatif",
+                "neutre",
+                "Négatif",
+            ],
+            "is_claim": ["yes", "oui", "no", "True", "non", "1", "oui"],
+            "urgence": [
+                "???",
+                "inconnue",
+                "zzz",
+                "bizarre",
+                "n/a",
+                "High",
+                "moyenne",
+            ],
+            "incident": [
+                "inconnu",
+                "truc",
+                "zzz",
+                "Panne_Connexion",
+                "bizarre",
+                "",
+                float("nan"),
+            ],
+        },
+        index=INDEX,
+    )
+
+
+def test_invalid_urgence_is_inferred_from_claim_and_sentiment():
+    df = page._normalize_kpi_fields(_frame())
+
+    assert df["urgence"].to_dict() == {
+        10: "haute",  # réclamation + sentiment négatif
+        3: "moyenne",  # réclamation seule
+        57: "faible",  # ni réclamation ni sentiment négatif
+        8: "haute",  # "True" / "NEG" normalisés avant l'inférence
+        91: "faible",  # sentiment négatif sans réclamation
+        24: "haute",  # valeur valide après mapping, conservée
+        40: "moyenne",  # valeur valide, conservée
+    }
+
+
+def test_invalid_incident_depends_on_claim():
+    df = page._normalize_kpi_fields(_frame())
+
+    assert df["incident"].to_dict() == {
+        10: "non_specifie",
+        3: "non_specifie",
+        57: "aucun",
+        8: "panne_connexion",  # label valide en minuscules, conservé
+        91: "aucun",
+        24: "aucun",  # vide
+        40: "aucun",  # manquant
+    }
+
+
+def test_normalization_keeps_index_and_mutates_in_place():
+    df = _frame()
+
+    result = page._normalize_kpi_fields(df)
+
+    assert result is df
+    assert result.index.tolist() == INDEX
+    assert result["is_claim"].tolist() == [
+        "oui",
+        "oui",
+        "non",
+        "oui",
+        "non",
+        "oui",
+        "oui",
+    ]
+
+
+def _reference_labels(series, mapping=None):
+    """Normalisation d'origine, appliquée ligne à ligne."""
+    normalized = series.astype(str).str.lower().str.strip()
+    return normalized.replace(mapping) if mapping else normalized
+
+
+def _assert_same_labels(result, expected):
+    pd.testing.assert_series_equal(result.astype(object), expected.astype(object))
+
+
+@pytest.mark.parametrize("mapping", [None, page._SENTIMENT_MAP])
+def test_normalize_labels_keeps_none_and_nan_apart(mapping):
+    series = pd.Series(
+        [" Negative", None, "pos", float("nan"), "NEUTRE", None],
+        index=[5, 12, 2, 40, 7, 1],
+        name="sentiment",
+    )
+
+    _assert_same_labels(
+        page._normalize_labels(series, mapping), _reference_labels(series, mapping)
+    )
+
+
+@pytest.mark.parametrize("mapping", [None, page._IS_CLAIM_MAP])
+def test_normalize_labels_mixed_claim_types(mapping):
+    # factorize confond True, 1 et 1.0 (et False, 0): le texte doit primer
+    series = pd.Series(
+        [True, 1, "Yes", 0, False, " NO ", 1.0, "1", None],
+        index=[9, 2, 7, 4, 11, 0, 5, 3, 8],
+        dtype=object,
+        name="is_claim",
+    )
+
+    result = page._normalize_labels(series, mapping)
+
+    _assert_same_labels(result, _reference_labels(series, mapping))
+    if mapping:
+        assert result.tolist()[:6] == ["oui", "oui", "oui", "non", "non", "non"]
+    else:
+        assert result.tolist()[:3] == ["true", "1", "yes"]
+
+
+def test_normalize_labels_maps_back_through_codes():
+    rng = np.random.default_rng(0)
+    labels = ["High", " urgent", "moyenne", "LOW", "autre", "Critique "]
+    series = pd.Series(
+        rng.choice(labels, size=2000),
+        index=rng.permutation(10_000)[:2000],
+        name="urgence",
+    )
+
+    result = page._normalize_labels(series, page._URGENCE_MAP)
+
+    _assert_same_labels(result, _reference_labels(series, page._URGENCE_MAP))
+    assert set(result) == {"haute", "moyenne", "faible", "autre"}
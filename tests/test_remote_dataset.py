@@ -0,0 +1,127 @@
+"""
+Tests de l'import distant streamé sur disque (utils.helpers.fetch_remote_dataset)
+================================================================================
+
+Couvre les limites de taille (Content-Length annoncé et taille réellement
+reçue), le nettoyage des fichiers partiels et l'unicité des noms de fichier.
+Aucun appel réseau: requests.request est remplacé par une réponse factice.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from requests import ConnectionError as RequestsConnectionError
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+STREAMLIT_ROOT = PROJECT_ROOT / "streamlit_app"
+sys.path.insert(0, str(STREAMLIT_ROOT))
+
+from utils import helpers  # noqa: E402
+
+URL = "https://example.com/data/tweets.csv"
+ONE_MB = 1024 * 1024
+
+
+class FakeResponse:
+    """Réponse streamée minimale: en-têtes, blocs et erreur optionnelle."""
+
+    def __init__(self, chunks, headers=None, error=None):
+        self.headers = {"Content-Type": "text/csv", **(headers or {})}
+        self._chunks = chunks
+        self._error = error
+        self.closed = False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=1):
+        yield from self._chunks
+        if self._error is not None:
+            raise self._error
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Fait renvoyer `response` par requests.request dans utils.helpers."""
+
+    def _serve(response):
+        monkeypatch.setattr(
+            helpers.requests, "request", lambda *args, **kwargs: response
+        )
+        return response
+
+    return _serve
+
+
+def test_streams_body_to_dest_dir(serve, tmp_path):
+    serve(FakeResponse([b"id,text\n", b"1,panne fibre\n"]))
+
+    dataset = helpers.fetch_remote_dataset(URL, dest_dir=tmp_path, max_size_mb=1)
+    dataset["uploaded_file"].close()
+
+    assert dataset["path"].parent == tmp_path
+    assert dataset["path"].read_bytes() == b"id,text\n1,panne fibre\n"
+    assert dataset["size"] == len(b"id,text\n1,panne fibre\n")
+    assert dataset["filename"] == "tweets.csv"
+
+
+def test_declared_content_length_over_limit_is_rejected(serve, tmp_path):
+    response = serve(
+        FakeResponse([b"x" * 10], headers={"Content-Length": str(2 * ONE_MB)})
+    )
+
+    with pytest.raises(ValueError, match="trop volumineux"):
+        helpers.fetch_remote_dataset(URL, dest_dir=tmp_path, max_size_mb=1)
+
+    assert response.closed
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_streamed_size_over_limit_is_rejected(serve, tmp_path):
+    # Pas de Content-Length: la limite est contrôlée pendant le transfert
+    serve(FakeResponse([b"x" * (ONE_MB // 2)] * 3))
+
+    with pytest.raises(ValueError, match="trop volumineux"):
+        helpers.fetch_remote_dataset(URL, dest_dir=tmp_path, max_size_mb=1)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_network_error_mid_stream_removes_partial_file(serve, tmp_path):
+    serve(FakeResponse([b"id,text\n"], error=RequestsConnectionError("reset")))
+
+    with pytest.raises(ValueError, match="appel distant"):
+        helpers.fetch_remote_dataset(URL, dest_dir=tmp_path, max_size_mb=1)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_os_error_mid_stream_removes_partial_file(serve, tmp_path):
+    serve(FakeResponse([b"id,text\n"], error=OSError(28, "No space left on device")))
+
+    with pytest.raises(OSError):
+        helpers.fetch_remote_dataset(URL, dest_dir=tmp_path, max_size_mb=1)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_same_url_twice_keeps_both_files(serve, tmp_path):
+    paths = []
+    for body in (b"id\n1\n", b"id\n2\n"):
+        serve(FakeResponse([body]))
+        dataset = helpers.fetch_remote_dataset(URL, dest_dir=tmp_path, max_size_mb=1)
+        dataset["uploaded_file"].close()
+        paths.append(dataset["path"])
+
+    assert paths[0] != paths[1]
+    assert [p.read_bytes() for p in paths] == [b"id\n1\n", b"id\n2\n"]
@@ -0,0 +1,69 @@
+"""
+Tests du nettoyage par blocs de TweetCleaner.process_dataframe
+==============================================================
+
+Avec un progress_callback, le nettoyage est fait par blocs de chunk_size
+lignes: le résultat doit être identique au nettoyage en un seul passage,
+y compris sur un index non contigu, et la progression signalée une fois
+par bloc.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+STREAMLIT_ROOT = PROJECT_ROOT / "streamlit_app"
+sys.path.insert(0, str(STREAMLIT_ROOT))
+
+from services.tweet_cleaner import TweetCleaner  # noqa: E402
+
+TWEETS = [
+    "@free ma #fibre est en PANNE depuis 3 jours http://t.co/x 😡",
+    "Merci @freebox pour le dépannage rapide 👍",
+    "Débit très lent ce soir...",
+    None,
+    "Facture incorrecte ce mois-ci, remboursement ?",
+    "Débit très lent ce soir...",
+    "La box redémarre en boucle",
+    "",
+    "Impossible de joindre le service client",
+    "Activation de la ligne toujours en attente",
+    "Réseau mobile coupé à Lyon",
+]
+
+
+def _frame() -> pd.DataFrame:
+    # Index à trous et non trié, comme après un filtrage/tri en amont
+    index = [40, 3, 17, 99, 8, 56, 21, 5, 72, 14, 30]
+    return pd.DataFrame(
+        {"text": TWEETS, "author": [f"user{i}" for i in index]}, index=index
+    )
+
+
+def test_chunked_cleaning_matches_single_pass():
+    cleaner = TweetCleaner()
+    expected, expected_stats = cleaner.process_dataframe(_frame(), "text")
+
+    progress = []
+    chunked, chunked_stats = cleaner.process_dataframe(
+        _frame(), "text", progress_callback=progress.append, chunk_size=3
+    )
+
+    pd.testing.assert_frame_equal(chunked, expected)
+    assert chunked_stats == expected_stats
+
+
+def test_progress_is_reported_once_per_chunk():
+    cleaner = TweetCleaner()
+    progress = []
+    cleaned, _stats = cleaner.process_dataframe(
+        _frame(), "text", progress_callback=progress.append, chunk_size=3
+    )
+
+    # Lignes passées au nettoyage: sans valeur manquante ni doublon
+    cleaned_rows = _frame()["text"].dropna().drop_duplicates().shape[0]
+    assert len(progress) == -(-cleaned_rows // 3)
+    assert progress == sorted(progress)
+    assert progress[-1] == 1.0